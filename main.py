@@ -730,6 +730,7 @@ def run_main_menu(window, ctx, screen_size, audio_manager) -> int:
 
     while True:
         dt = clock.tick(60)
+        audio_manager.update()
 
         for event in window.poll_events():
             if event['type'] == EVENT_QUIT:
@@ -772,7 +773,7 @@ def main():
     window, ctx, base_size, screen_size, game_viewport, game_viewport_fb = initialize_window_and_context()
     selected_stage_class = resolve_stage_class()
     game_audio = GameAudioBank()
-    game_audio.load_defaults()
+    game_audio.load_defaults(background=True)
     audio_manager = AudioManager(game_audio)
 
     # ===== 加载玩家设置并应用音量 =====
@@ -1148,6 +1149,11 @@ def main():
                     if boss._active:
                         enemy_count += 1
 
+                lanes = " ".join(
+                    f"{name}={stats['dropped']}/{stats['coalesced']}"
+                    for name, stats in emoji_sys.lane_stats.items()
+                )
+
                 print(
                     "[PROFILE] "
                     f"avg_frame={avg_ms['frame']:.3f}ms "
@@ -1170,7 +1176,8 @@ def main():
                     f"roverlay={avg_ms['render_overlay']:.3f} "
                     f"swap={avg_ms['swap']:.3f} "
                     f"fps={clock.get_fps():.1f} maxfps={clock.get_max_fps():.1f} "
-                    f"bullets={bullets_alive} targets={enemy_count}"
+                    f"bullets={bullets_alive} targets={enemy_count} "
+                    f"udp_lanes(drop/coalesce)=[{lanes}]"
                 )
 
                 profile_acc = {k: 0.0 for k in profile_acc}
@@ -1178,6 +1185,7 @@ def main():
 
             while running:
                 dt = clock.tick(60)
+                audio_manager.update()
                 frame_start = time.perf_counter() if PROFILE_MODE else 0.0
                 events_start = time.perf_counter() if PROFILE_MODE else 0.0
                 
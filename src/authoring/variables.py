@@ -13,7 +13,7 @@ import math
 import re
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Iterable, Mapping
 
 
 VARIABLE_SCOPES = (
@@ -215,6 +215,19 @@ class VariableTypeRegistry:
         self._normalizers[type_id] = normalizer
         return spec
 
+    def normalizer(self, type_id: str) -> Callable[[Any, str], Any]:
+        """Return a ``(value, path)`` normalizer resolved once for ``type_id``.
+
+        Built-in normalizers already produce fresh JSON values, so only
+        plugin types keep :meth:`normalize`'s JSON round-trip check.
+        """
+
+        self.require(type_id)
+        normalizer = self._normalizers[type_id]
+        if normalizer is _NORMALIZERS.get(type_id):
+            return normalizer
+        return lambda value, path: _json_value(normalizer(value, path), path)
+
     def normalize(self, type_id: str, value: Any, path: str = "variable.value") -> Any:
         self.require(type_id)
         normalizer = self._normalizers[type_id]
@@ -650,7 +663,7 @@ class VariableStore:
             raise VariableError(
                 f"scope={spec.scope} variable={reference.name!r} expects {spec.type}, got {reference.type}"
             )
-        key = (spec.scope, self._owner(spec.scope, effective_owner or spec.owner_id or (spec.scope if spec.scope in {"project", "stage", "engine_snapshot"} else None)))
+        key = self._store_key(spec, effective_owner)
         bucket = self._stores.get(key)
         if bucket is None:
             raise VariableError(
@@ -683,19 +696,18 @@ class VariableStore:
             return DEFAULT_VARIABLE_TYPES.normalize(spec.type, _blend_values(spec.type, current, normalized), f"{spec.scope}.{spec.name}")
         raise VariableError(f"unsupported variable operation {operation!r}")
 
-    def write(
+    def _resolve_write(
         self,
         ref: VariableRef | str,
-        value: Any = None,
         *,
         writer: str,
-        operation: str = "set",
-        owner_id: str | None = None,
-        frame: int | None = None,
-        order: int = 0,
-        reducer: str | None = None,
-        mapped_output: bool = False,
-    ) -> Any:
+        operation: str,
+        owner_id: str | None,
+        reducer: str | None,
+        mapped_output: bool,
+    ) -> tuple[VariableSpec, str | None, str | None]:
+        """Check one writer's capability; return (spec, owner, reducer)."""
+
         if writer not in VARIABLE_WRITERS:
             raise VariableError(f"unknown variable writer {writer!r}")
         if operation not in VARIABLE_OPERATIONS:
@@ -729,7 +741,33 @@ class VariableStore:
         effective_reducer = reducer or spec.reducer
         if effective_reducer is not None and effective_reducer not in VARIABLE_REDUCERS:
             raise VariableError(f"unsupported variable reducer {effective_reducer!r}")
-        key = (spec.scope, self._owner(spec.scope, effective_owner or spec.owner_id or (spec.scope if spec.scope in {"project", "stage", "engine_snapshot"} else None)))
+        return spec, effective_owner, effective_reducer
+
+    def _store_key(self, spec: VariableSpec, owner_id: str | None) -> tuple[str, str]:
+        return (spec.scope, self._owner(spec.scope, owner_id or spec.owner_id or (spec.scope if spec.scope in {"project", "stage", "engine_snapshot"} else None)))
+
+    def write(
+        self,
+        ref: VariableRef | str,
+        value: Any = None,
+        *,
+        writer: str,
+        operation: str = "set",
+        owner_id: str | None = None,
+        frame: int | None = None,
+        order: int = 0,
+        reducer: str | None = None,
+        mapped_output: bool = False,
+    ) -> Any:
+        spec, effective_owner, effective_reducer = self._resolve_write(
+            ref,
+            writer=writer,
+            operation=operation,
+            owner_id=owner_id,
+            reducer=reducer,
+            mapped_output=mapped_output,
+        )
+        key = self._store_key(spec, effective_owner)
         if key not in self._stores or key not in self._active:
             # A behavior descriptor publishes its first output as the owner
             # registration point.  Once an owner has explicitly been closed,
@@ -766,6 +804,78 @@ class VariableStore:
         self._writes.append(VariableWrite(spec.name, spec.scope, key[1], writer, operation, copy.deepcopy(result), write_frame, int(order)))
         return copy.deepcopy(result)
 
+    def compile_writer(
+        self,
+        ref: VariableRef | str,
+        *,
+        writer: str,
+        operation: str = "set",
+        owner_id: str | None = None,
+        reducer: str | None = None,
+    ) -> Callable[..., bool]:
+        """Resolve one repeated writer's declaration, capability and type once.
+
+        The returned ``write(value, frame=None, order=0)`` behaves like
+        :meth:`write` and reports whether the store changed: a plain ``set``
+        of the value already stored is skipped without a write record.
+        Reducer and non-``set`` writes always go through :meth:`write`.
+        """
+
+        spec, effective_owner, effective_reducer = self._resolve_write(
+            ref,
+            writer=writer,
+            operation=operation,
+            owner_id=owner_id,
+            reducer=reducer,
+            mapped_output=False,
+        )
+
+        def write_full(value: Any, frame: int | None = None, order: int = 0) -> bool:
+            self.write(
+                ref,
+                value,
+                writer=writer,
+                operation=operation,
+                owner_id=owner_id,
+                frame=frame,
+                order=order,
+                reducer=reducer,
+            )
+            return True
+
+        if operation != "set" or effective_reducer is not None:
+            return write_full
+        key = self._store_key(spec, effective_owner)
+        name = spec.name
+        scope = spec.scope
+        path = f"{scope}.{name}"
+        normalize = DEFAULT_VARIABLE_TYPES.normalizer(spec.type)
+
+        def write_set(value: Any, frame: int | None = None, order: int = 0) -> bool:
+            bucket = self._stores.get(key) if key in self._active else None
+            if bucket is None or name not in bucket:
+                # Inactive scopes keep write()'s owner-registration and errors.
+                return write_full(value, frame, order)
+            result = normalize(value, path)
+            if bucket[name] == result:
+                return False
+            bucket[name] = result
+            self._writes.append(
+                VariableWrite(
+                    name,
+                    scope,
+                    key[1],
+                    writer,
+                    "set",
+                    copy.deepcopy(result),
+                    self.frame if frame is None else int(frame),
+                    int(order),
+                )
+            )
+            return True
+
+        return write_set
+
     def publish_engine_snapshot(self, values: Mapping[str, Any], *, frame: int | None = None) -> None:
         if not isinstance(values, Mapping):
             raise VariableError("engine snapshot must be an object")
@@ -790,6 +900,30 @@ class VariableStore:
             result.setdefault(scope, {})[owner] = copy.deepcopy(values)
         return result
 
+    def capture_checkpoint(self) -> dict[str, Any]:
+        """Return the complete runtime state for an exact seek restore.
+
+        Unlike :meth:`snapshot`, this includes scope lifecycle, reducer and
+        write-log state.  Write records are immutable and shared.
+        """
+
+        return {
+            "frame": self.frame,
+            "stores": copy.deepcopy(self._stores),
+            "active": frozenset(self._active),
+            "closed_owners": frozenset(self._closed_owners),
+            "writes": tuple(self._writes),
+            "reducer_state": copy.deepcopy(self._reducer_state),
+        }
+
+    def restore_checkpoint(self, checkpoint: Mapping[str, Any]) -> None:
+        self.frame = int(checkpoint["frame"])
+        self._stores = copy.deepcopy(checkpoint["stores"])
+        self._active = set(checkpoint["active"])
+        self._closed_owners = set(checkpoint["closed_owners"])
+        self._writes = list(checkpoint["writes"])
+        self._reducer_state = copy.deepcopy(checkpoint["reducer_state"])
+
     def restore_compatible_snapshot(
         self,
         snapshot: Mapping[str, Any],
@@ -12,7 +12,8 @@ from .collision import CollisionManager, get_collision_manager, CollisionResult,
 from .sprite_registry import SpriteRegistry, SpriteInfo, get_sprite_registry, init_sprite_registry
 from .project_context import ProjectContext, ProjectContextError, get_project_context
 from .engine_session import EngineSession
-from .atomic_io import atomic_write_json, atomic_write_text
+from .atomic_io import atomic_write_bytes, atomic_write_json, atomic_write_text
+from .checkpoints import CheckpointRing
 
 __all__ = [
     # 配置
@@ -52,6 +53,8 @@ __all__ = [
     'ProjectContextError',
     'get_project_context',
     'EngineSession',
+    'atomic_write_bytes',
     'atomic_write_json',
     'atomic_write_text',
+    'CheckpointRing',
 ]
@@ -3,19 +3,36 @@ Audio backend - miniaudio implementation
 
 Provides SE playback, BGM streaming, volume control, fadeout.
 Replaces pygame.mixer.
+
+Sound effects go through a SoundCache: short clips are decoded once and kept
+resident (with the decoded PCM also cached under the project's userdata,
+keyed by a hash of the source file), while long voice/ambient clips and anything past the memory
+budget are streamed from disk in chunks while they play.
 """
 
 import os
 import array
+import hashlib
+import json
 import threading
+import weakref
 from typing import Optional
 
+from .atomic_io import atomic_write_bytes, atomic_write_json
+from .project_context import ProjectContextError, get_project_context
+
 try:
     import miniaudio
     HAS_MINIAUDIO = True
 except ImportError:
     HAS_MINIAUDIO = False
 
+DEFAULT_SE_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_STREAM_THRESHOLD_SECONDS = 8.0
+DEFAULT_PCM_CACHE_DIR = os.path.join("audio_cache", "pcm")
+DEFAULT_PCM_CACHE_LIMIT = 256 * 1024 * 1024
+STREAM_CHUNK_FRAMES = 4096
+
 
 class Sound:
     """Decoded sound effect stored in memory."""
@@ -46,29 +63,287 @@ class Sound:
         if backend:
             backend.stop_sound(self)
 
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._samples) * self._samples.itemsize
+
+
+class StreamedSound(Sound):
+    """Long sound decoded from disk in chunks while it plays."""
+
+    def __init__(self, path: str, nchannels: int, sample_rate: int,
+                 num_frames: int = 0):
+        self._samples = None
+        self.path = path
+        self.nchannels = nchannels
+        self.sample_rate = sample_rate
+        self.num_frames = num_frames
+        self._volume = 1.0
+
+    @property
+    def memory_bytes(self) -> int:
+        return 0
+
+    def open_stream(self):
+        """Open a fresh primed decoder generator positioned at frame 0."""
+        return miniaudio.stream_file(
+            self.path,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=self.nchannels,
+            sample_rate=self.sample_rate,
+            frames_to_read=STREAM_CHUNK_FRAMES,
+        )
+
+
+# ---------- Sound cache ----------
+
+def _resolve_cache_dir(cache_dir: Optional[str]) -> Optional[str]:
+    """Anchor a relative cache dir at the project's userdata directory."""
+    if not cache_dir or os.path.isabs(cache_dir):
+        return cache_dir
+    try:
+        context = get_project_context()
+    except ProjectContextError:
+        return None
+    return str(context.userdata / cache_dir)
+
+
+class SoundCache:
+    """
+    Decides per file whether a sound is kept resident or streamed.
+
+    Clips no longer than ``stream_threshold_seconds`` are decoded eagerly as
+    long as the resident PCM stays within ``memory_budget`` bytes; everything
+    else becomes a StreamedSound. Resident sounds are tracked weakly, so PCM
+    released by a bank (e.g. a stage bank being cleared) returns to the budget,
+    and identical source files share one decoded buffer.
+
+    When ``cache_dir`` is set, decoded PCM is written there keyed by a hash of
+    the source bytes and output format, so later startups skip decoding.
+    Relative ``cache_dir`` values resolve against the project's userdata
+    directory. An index maps (path, size, mtime) to that hash so unchanged
+    files are not re-read, and the least recently used entries are evicted
+    once the directory grows past ``disk_limit`` bytes.
+    """
+
+    def __init__(self, sample_rate: int = 44100, nchannels: int = 2,
+                 memory_budget: int = DEFAULT_SE_MEMORY_BUDGET,
+                 stream_threshold_seconds: float = DEFAULT_STREAM_THRESHOLD_SECONDS,
+                 cache_dir: Optional[str] = DEFAULT_PCM_CACHE_DIR,
+                 disk_limit: int = DEFAULT_PCM_CACHE_LIMIT):
+        self.sample_rate = sample_rate
+        self.nchannels = nchannels
+        self.memory_budget = max(0, int(memory_budget))
+        self.stream_threshold_seconds = max(0.0, float(stream_threshold_seconds))
+        self.cache_dir = _resolve_cache_dir(cache_dir)
+        self.disk_limit = max(0, int(disk_limit))
+        self._resident: "weakref.WeakValueDictionary[str, array.array]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._index: Optional[dict] = None
+        self.decode_count = 0
+        self.disk_hits = 0
+        self.hash_count = 0
+
+    @property
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(len(samples) * samples.itemsize for samples in self._resident.values())
+
+    def load(self, path: str) -> Optional[Sound]:
+        if not HAS_MINIAUDIO or not os.path.exists(path):
+            return None
+        info = miniaudio.get_file_info(path)
+        frames = _resampled_frames(info.num_frames, info.sample_rate, self.sample_rate)
+        decoded_bytes = frames * self.nchannels * 2
+        if info.duration > self.stream_threshold_seconds:
+            return StreamedSound(path, self.nchannels, self.sample_rate, frames)
+
+        digest = self._source_key(path)
+        with self._lock:
+            shared = self._resident.get(digest)
+        if shared is not None:
+            return Sound(shared, self.nchannels, self.sample_rate)
+        if self.resident_bytes + decoded_bytes > self.memory_budget:
+            return StreamedSound(path, self.nchannels, self.sample_rate, frames)
+
+        sound = self._load_cached_pcm(digest)
+        if sound is None:
+            sound = self._decode(path)
+            self._store_cached_pcm(digest, sound)
+        with self._lock:
+            self._resident[digest] = sound._samples
+        return sound
+
+    def _source_key(self, path: str) -> str:
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        stat_key = f"{abs_path}|{st.st_size}|{st.st_mtime_ns}"
+        with self._lock:
+            index = self._load_index()
+            digest = index.get(stat_key)
+        if digest is not None:
+            return digest
+        digest = self._source_digest(path)
+        with self._lock:
+            # One entry per source file: an edited file replaces its old key.
+            prefix = f"{abs_path}|"
+            for key in [key for key in index if key.startswith(prefix)]:
+                del index[key]
+            index[stat_key] = digest
+        self._store_index()
+        return digest
+
+    def _source_digest(self, path: str) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as stream:
+            for block in iter(lambda: stream.read(1 << 20), b""):
+                hasher.update(block)
+        hasher.update(f"|s16|{self.sample_rate}|{self.nchannels}".encode("ascii"))
+        self.hash_count += 1
+        return hasher.hexdigest()
+
+    def _index_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"index_s16_{self.sample_rate}_{self.nchannels}.json")
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {}
+            index_path = self._index_path()
+            if index_path is not None and os.path.exists(index_path):
+                try:
+                    with open(index_path, "r", encoding="utf-8") as stream:
+                        data = json.load(stream)
+                except (OSError, ValueError):
+                    data = None
+                if isinstance(data, dict):
+                    self._index = {
+                        key: value for key, value in data.items()
+                        if isinstance(key, str) and isinstance(value, str)
+                    }
+        return self._index
+
+    def _store_index(self):
+        index_path = self._index_path()
+        if index_path is None:
+            return
+        with self._lock:
+            data = dict(self._load_index())
+        try:
+            atomic_write_json(index_path, data)
+        except OSError as e:
+            print(f"[SoundCache] PCM index write failed {index_path}: {e}")
+
+    def _cache_path(self, digest: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{digest}.pcm")
+
+    def _load_cached_pcm(self, digest: str) -> Optional[Sound]:
+        cache_path = self._cache_path(digest)
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as stream:
+                data = stream.read()
+            # Touch the entry so eviction sees it as recently used.
+            os.utime(cache_path)
+        except OSError:
+            return None
+        if len(data) % (2 * self.nchannels):
+            return None
+        self.disk_hits += 1
+        return Sound(data, self.nchannels, self.sample_rate)
+
+    def _store_cached_pcm(self, digest: str, sound: Sound):
+        cache_path = self._cache_path(digest)
+        if cache_path is None:
+            return
+        try:
+            atomic_write_bytes(cache_path, sound._samples.tobytes())
+        except OSError as e:
+            print(f"[SoundCache] PCM cache write failed {cache_path}: {e}")
+            return
+        self._evict_cached_pcm(keep=cache_path)
+
+    def _evict_cached_pcm(self, keep: Optional[str] = None):
+        """Drop the least recently used PCM files past ``disk_limit``."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".pcm") or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, entry.path, st.st_size))
+                    total += st.st_size
+        except OSError:
+            return
+        for _, entry_path, size in sorted(entries):
+            if total <= self.disk_limit:
+                break
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            total -= size
+
+    def _decode(self, path: str) -> Sound:
+        decoded = miniaudio.decode_file(
+            path,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=self.nchannels,
+            sample_rate=self.sample_rate,
+        )
+        self.decode_count += 1
+        return Sound(decoded.samples, decoded.nchannels, decoded.sample_rate)
+
+
+def _resampled_frames(num_frames: int, source_rate: int, target_rate: int) -> int:
+    if source_rate <= 0 or source_rate == target_rate:
+        return int(num_frames)
+    return -(-int(num_frames) * target_rate // source_rate)
+
 
 class _PlayingSound:
     """Runtime state for a currently-playing sound instance."""
 
-    __slots__ = ('sound', 'position', 'loops', 'volume', 'active')
+    __slots__ = ('sound', 'position', 'loops', 'volume', 'active', 'stream')
 
-    def __init__(self, sound: Sound, loops: int = 0):
+    def __init__(self, sound: Sound, loops: int = 0, stream=None):
         self.sound = sound
         self.position = 0
         self.loops = loops
         self.volume = sound._volume
         self.active = True
+        self.stream = stream
 
 
 class AudioBackend:
     """Miniaudio-based audio backend with software mixer."""
 
-    def __init__(self, sample_rate: int = 44100, nchannels: int = 2):
+    def __init__(self, sample_rate: int = 44100, nchannels: int = 2,
+                 se_memory_budget: int = DEFAULT_SE_MEMORY_BUDGET,
+                 stream_threshold_seconds: float = DEFAULT_STREAM_THRESHOLD_SECONDS,
+                 pcm_cache_dir: Optional[str] = DEFAULT_PCM_CACHE_DIR,
+                 pcm_cache_limit: int = DEFAULT_PCM_CACHE_LIMIT):
         self._sample_rate = sample_rate
         self._nchannels = nchannels
         self._initialized = False
         self._max_playing_sounds = 8
         self._max_instances_per_sound = 1
+        self._sound_cache = SoundCache(
+            sample_rate=sample_rate,
+            nchannels=nchannels,
+            memory_budget=se_memory_budget,
+            stream_threshold_seconds=stream_threshold_seconds,
+            cache_dir=pcm_cache_dir,
+            disk_limit=pcm_cache_limit,
+        )
 
         self._playing: list = []
         self._lock = threading.Lock()
@@ -101,6 +376,10 @@ class AudioBackend:
     def is_initialized(self) -> bool:
         return self._initialized
 
+    @property
+    def sound_cache(self) -> SoundCache:
+        return self._sound_cache
+
     # ---------- Mixer generator ----------
 
     def _mix_generator(self):
@@ -120,6 +399,11 @@ class AudioBackend:
         for ps in self._playing:
             if not ps.active:
                 continue
+            if ps.stream is not None:
+                self._mix_stream(ps, mixed, num_frames)
+                if ps.active:
+                    alive.append(ps)
+                continue
             s = ps.sound._samples
             total = len(s)
             needed = num_frames * ps.sound.nchannels
@@ -152,6 +436,41 @@ class AudioBackend:
                 alive.append(ps)
         self._playing = alive
 
+    def _mix_stream(self, ps: _PlayingSound, mixed: array.array, num_frames: int):
+        nchannels = ps.sound.nchannels
+        needed = num_frames * nchannels
+        vol = ps.volume
+        wrote = 0
+        reopened = False
+        while wrote < needed:
+            try:
+                chunk = ps.stream.send((needed - wrote) // nchannels)
+            except StopIteration:
+                chunk = None
+            if not chunk:
+                # Empty right after reopening means the file has no frames.
+                if ps.loops == 0 or reopened:
+                    ps.active = False
+                    ps.stream = None
+                    return
+                if ps.loops > 0:
+                    ps.loops -= 1
+                try:
+                    ps.stream = ps.sound.open_stream()
+                except Exception:
+                    ps.active = False
+                    ps.stream = None
+                    return
+                reopened = True
+                continue
+            reopened = False
+            count = min(len(chunk), needed - wrote, len(mixed) - wrote)
+            for i in range(count):
+                idx = wrote + i
+                v = mixed[idx] + int(chunk[i] * vol)
+                mixed[idx] = max(-32768, min(32767, v))
+            wrote += len(chunk)
+
     def _mix_bgm(self, mixed: array.array, num_frames: int):
         if not self._bgm_playing or self._bgm_generator is None:
             return
@@ -194,13 +513,7 @@ class AudioBackend:
         if not self._initialized or not os.path.exists(path):
             return None
         try:
-            decoded = miniaudio.decode_file(
-                path,
-                output_format=miniaudio.SampleFormat.SIGNED16,
-                nchannels=self._nchannels,
-                sample_rate=self._sample_rate,
-            )
-            return Sound(decoded.samples, decoded.nchannels, decoded.sample_rate)
+            return self._sound_cache.load(path)
         except Exception as e:
             print(f"[AudioBackend] Load failed {path}: {e}")
             return None
@@ -208,7 +521,14 @@ class AudioBackend:
     def play_sound(self, sound: Sound, loops: int = 0) -> bool:
         if not self._initialized or sound is None:
             return False
-        ps = _PlayingSound(sound, loops)
+        stream = None
+        if isinstance(sound, StreamedSound):
+            try:
+                stream = sound.open_stream()
+            except Exception as e:
+                print(f"[AudioBackend] Stream failed {sound.path}: {e}")
+                return False
+        ps = _PlayingSound(sound, loops, stream)
         with self._lock:
             active_count = 0
             same_sound_count = 0
@@ -0,0 +1,127 @@
+"""Memory-bounded frame checkpoints for deterministic seek.
+
+Runners replay fixed ticks; a seek restores the newest checkpoint at or
+before the target and replays the remainder.  The ring only stores opaque
+values with an estimated size, so each runner owns what it captures.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+
+DEFAULT_CHECKPOINT_INTERVAL = 300
+DEFAULT_CHECKPOINT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def checkpoint_nbytes(value: Any) -> int:
+    """Estimate retained bytes: copied arrays plus one slot per reference."""
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, Mapping):
+        return sum(16 + checkpoint_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(
+            8 + (checkpoint_nbytes(item) if isinstance(item, (np.ndarray, Mapping, list, tuple)) else 0)
+            for item in value
+        )
+    return 0
+
+
+def capture_context_checkpoint(context: Any) -> tuple[bool, Any]:
+    """Capture ``context`` through its optional ``capture_checkpoint`` hook.
+
+    Returns ``(False, None)`` when the context owns simulation state (a
+    bullet pool or EventBus) that cannot be captured.  Contexts without that
+    state are treated as stateless and yield ``(True, None)``.
+    """
+
+    hook = getattr(context, "capture_checkpoint", None)
+    if callable(hook):
+        state = hook()
+        return state is not None, state
+    if (
+        getattr(context, "bullet_pool", None) is not None
+        or getattr(context, "event_bus", None) is not None
+    ):
+        return False, None
+    return True, None
+
+
+def context_player_position(context: Any) -> tuple[float, float] | None:
+    """Live player position of ``context``; aimed replays depend on it."""
+
+    get_player = getattr(context, "get_player", None)
+    player = get_player() if callable(get_player) else None
+    if player is None:
+        return None
+    return (float(getattr(player, "x", 0.0)), float(getattr(player, "y", 0.0)))
+
+
+class CheckpointRing:
+    """Frame-indexed checkpoints evicted oldest-first above a byte budget."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_CHECKPOINT_BUDGET_BYTES) -> None:
+        if isinstance(budget_bytes, bool) or not isinstance(budget_bytes, int) or budget_bytes < 0:
+            raise ValueError("checkpoint budget must be a non-negative integer")
+        self.budget_bytes = budget_bytes
+        self._values: dict[int, tuple[Any, int]] = {}
+        self._frames: list[int] = []
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, frame: int) -> bool:
+        return frame in self._values
+
+    @property
+    def frames(self) -> tuple[int, ...]:
+        return tuple(self._frames)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._frames.clear()
+        self.nbytes = 0
+
+    def add(self, frame: int, value: Any, nbytes: int | None = None) -> bool:
+        """Store ``value`` for ``frame``; return False if it exceeds the budget."""
+
+        size = checkpoint_nbytes(value) if nbytes is None else int(nbytes)
+        if size > self.budget_bytes:
+            return False
+        if frame in self._values:
+            self.nbytes -= self._values.pop(frame)[1]
+            self._frames.remove(frame)
+        self._values[frame] = (value, size)
+        bisect.insort(self._frames, frame)
+        self.nbytes += size
+        while self.nbytes > self.budget_bytes:
+            oldest = next(iter(self._values))
+            self.nbytes -= self._values.pop(oldest)[1]
+            self._frames.remove(oldest)
+        return True
+
+    def latest(self, frame: int) -> Any | None:
+        """Return the newest checkpoint at or before ``frame``."""
+
+        index = bisect.bisect_right(self._frames, frame)
+        return self._values[self._frames[index - 1]][0] if index else None
+
+    def newest_first(self) -> Iterator[Any]:
+        for frame in reversed(self._frames):
+            yield self._values[frame][0]
+
+
+__all__ = [
+    "CheckpointRing",
+    "DEFAULT_CHECKPOINT_BUDGET_BYTES",
+    "DEFAULT_CHECKPOINT_INTERVAL",
+    "capture_context_checkpoint",
+    "checkpoint_nbytes",
+    "context_player_position",
+]
@@ -491,6 +491,7 @@ _ZH_CN: dict[str, str] = {
     "Active Clips": "活动片段",
     "Events": "事件",
     "Bullets": "弹幕数",
+    "Event Drops": "事件丢弃",
     "Seed": "随机种子",
     "Update": "更新",
     "Render": "渲染",
@@ -129,6 +129,7 @@ class PatternPreviewPanel(QWidget):
             ("active_clips", "Active Clips"),
             ("timeline_events", "Events"),
             ("bullet_count", "Bullets"),
+            ("event_lanes", "Event Drops"),
             ("seed", "Seed"),
             ("update_ms", "Update"),
             ("render_ms", "Render"),
@@ -282,6 +283,12 @@ class PatternPreviewPanel(QWidget):
                     value = " / ".join(str(item) for item in value) or "—"
                 if key in {"active_clips", "timeline_events"} and isinstance(value, list):
                     value = len(value)
+                if key == "event_lanes" and isinstance(value, dict):
+                    # dropped/coalesced per lane; empty when no bus is bound.
+                    value = " · ".join(
+                        f"{lane} {counts.get('dropped', 0)}/{counts.get('coalesced', 0)}"
+                        for lane, counts in value.items()
+                    ) or None
                 if key in {"update_ms", "render_ms"} and value is not None:
                     value = f"{float(value):.3f} ms"
                 self._set_stat(key, value)
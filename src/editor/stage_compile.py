@@ -34,6 +34,7 @@ from src.pattern import (
     PatternCompileError,
     PatternCompiler,
     PatternDocument,
+    pattern_cache_dir,
 )
 
 from .document import (
@@ -761,7 +762,7 @@ def compile_stage(
             StageNode(node.id, node.type, node.name, properties_json)
         )
 
-    compiler = pattern_compiler or PatternCompiler()
+    compiler = pattern_compiler or PatternCompiler(pattern_cache_dir(project))
     store = ResourceStore(project)
     patterns: list[PatternSchedule] = []
     automations: list[StageAutomation] = []
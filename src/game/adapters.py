@@ -14,12 +14,15 @@ Established event-adapter contract:
 from __future__ import annotations
 
 import json
+import select
+import selectors
 import socket
 import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from .events import EventBus, EventBusError
+from .events import LANE_EXTERNAL, EventBus, EventBusError
 
 
 class EventAdapter(ABC):
@@ -63,6 +66,53 @@ class LoopbackAdapter(EventAdapter):
         return {"ok": self._bus is not None, "name": self.name}
 
 
+class _LineFramer:
+    """Newline framer over one growing ``bytearray`` and a read offset.
+
+    Each byte is scanned once: ``_scan`` remembers where the last search for
+    a newline stopped, and consumed frames are trimmed once per ``feed``
+    instead of re-slicing the buffer per line.
+    """
+
+    __slots__ = ("buffer", "_start", "_scan")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self._start = 0
+        self._scan = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self.buffer) - self._start
+
+    def feed(self, chunk: memoryview | bytes) -> Iterator[bytearray]:
+        buffer = self.buffer
+        buffer += chunk
+        while True:
+            end = buffer.find(b"\n", self._scan)
+            if end < 0:
+                self._scan = len(buffer)
+                break
+            start = self._start
+            self._start = self._scan = end + 1
+            if end > start:
+                yield buffer[start:end]
+        if self._start:
+            del buffer[: self._start]
+            self._scan -= self._start
+            self._start = 0
+
+
+class _IPCClient:
+    __slots__ = ("connection", "framer", "tokens", "stamp")
+
+    def __init__(self, connection: socket.socket, burst: float) -> None:
+        self.connection = connection
+        self.framer = _LineFramer()
+        self.tokens = burst
+        self.stamp = time.monotonic()
+
+
 class LocalIPCAdapter(EventAdapter):
     """Small newline-delimited JSON adapter over a local TCP socket.
 
@@ -71,20 +121,49 @@ class LocalIPCAdapter(EventAdapter):
     and normalizes each frame into ``adapter.local_ipc``.  ``push`` is useful
     for a same-process smoke test and uses the exact wire path as an external
     client.
+
+    One ``selectors`` loop serves up to ``max_clients`` connections.  Each
+    client may get a token bucket of ``rate_limit`` frames per second (off by
+    default, since the bus lanes already bound queued input) and may hold at
+    most ``max_pending_bytes`` of unterminated input before it is
+    disconnected; excess frames and clients are counted in ``health()``.  A
+    frame the bus rejects disconnects only its client; the server stops only
+    when the bus is closed.
     """
 
     name = "local_ipc"
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        max_clients: int = 16,
+        rate_limit: float | None = None,
+        max_pending_bytes: int = 1 << 20,
+    ) -> None:
         self.host = host
         self.port = int(port)
         self.bound_port = 0
+        self.max_clients = int(max_clients)
+        if self.max_clients < 1:
+            raise ValueError("max_clients must be positive")
+        self.rate_limit = None if rate_limit is None else float(rate_limit)
+        if self.rate_limit is not None and self.rate_limit <= 0.0:
+            raise ValueError("rate_limit must be positive or None")
+        self.max_pending_bytes = int(max_pending_bytes)
+        if self.max_pending_bytes < 1:
+            raise ValueError("max_pending_bytes must be positive")
         self._bus: EventBus | None = None
         self._sock: socket.socket | None = None
         self._thread: threading.Thread | None = None
         self._running = False
         self._errors = 0
         self._received = 0
+        self._clients = 0
+        self._rejected = 0
+        self._rate_limited = 0
+        self._overflowed = 0
         self._last_error: str | None = None
         self._lock = threading.RLock()
 
@@ -98,8 +177,8 @@ class LocalIPCAdapter(EventAdapter):
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             sock.bind((self.host, self.port))
-            sock.listen(8)
-            sock.settimeout(0.2)
+            sock.listen(self.max_clients)
+            sock.setblocking(False)
         except OSError as exc:
             try:
                 sock.close()
@@ -171,36 +250,43 @@ class LocalIPCAdapter(EventAdapter):
             bus.emit("adapter.local_ipc", payload, source=self.name)
             return True
         except EventBusError as exc:
+            closed = bus.closed
             with self._lock:
                 self._errors += 1
-                self._last_error = str(exc)
-                self._running = False
+                if closed:
+                    self._last_error = str(exc)
+                    self._running = False
             return False
 
     def _serve(self, sock: socket.socket) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ, None)
+        scratch = bytearray(65536)
+        view = memoryview(scratch)
         try:
             while True:
                 with self._lock:
                     if not self._running:
                         break
                 try:
-                    connection, _ = sock.accept()
-                except socket.timeout:
-                    continue
-                except OSError as exc:
-                    with self._lock:
-                        if self._running:
-                            self._last_error = f"{type(exc).__name__}: {exc}"
-                        self._running = False
+                    ready = selector.select(timeout=0.2)
+                except (OSError, ValueError):
                     break
-                try:
-                    self._read_connection(connection)
-                finally:
+                for key, _ in ready:
+                    client = key.data
+                    if client is None:
+                        if not self._accept(selector, sock):
+                            return
+                    elif not self._read_client(selector, client, scratch, view):
+                        return
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
                     try:
-                        connection.close()
+                        key.data.connection.close()
                     except OSError:
                         pass
-        finally:
+            selector.close()
             try:
                 sock.close()
             except OSError:
@@ -208,36 +294,88 @@ class LocalIPCAdapter(EventAdapter):
             with self._lock:
                 if self._sock is sock:
                     self._sock = None
+                self._clients = 0
                 self._running = False
 
-    def _read_connection(self, connection: socket.socket) -> None:
-        connection.settimeout(0.2)
-        buffer = b""
-        while True:
+    def _accept(self, selector: selectors.BaseSelector, sock: socket.socket) -> bool:
+        try:
+            connection, _ = sock.accept()
+        except BlockingIOError:
+            return True
+        except OSError as exc:
             with self._lock:
-                if not self._running:
-                    return
-            try:
-                chunk = connection.recv(65536)
-            except socket.timeout:
-                continue
-            except OSError:
-                return
-            if not chunk:
-                break
-            buffer += chunk
-            while b"\n" in buffer:
-                raw, buffer = buffer.split(b"\n", 1)
-                if not raw:
-                    continue
-                try:
-                    payload = json.loads(raw.decode("utf-8"))
-                except (UnicodeDecodeError, json.JSONDecodeError):
+                if self._running:
+                    self._last_error = f"{type(exc).__name__}: {exc}"
+                self._running = False
+            return False
+        with self._lock:
+            full = self._clients >= self.max_clients
+            if full:
+                self._rejected += 1
+            else:
+                self._clients += 1
+        if full:
+            connection.close()
+            return True
+        connection.setblocking(False)
+        burst = self.rate_limit if self.rate_limit is not None else 0.0
+        selector.register(connection, selectors.EVENT_READ, _IPCClient(connection, burst))
+        return True
+
+    def _drop_client(self, selector: selectors.BaseSelector, client: _IPCClient) -> None:
+        selector.unregister(client.connection)
+        try:
+            client.connection.close()
+        except OSError:
+            pass
+        with self._lock:
+            self._clients -= 1
+
+    def _read_client(
+        self,
+        selector: selectors.BaseSelector,
+        client: _IPCClient,
+        scratch: bytearray,
+        view: memoryview,
+    ) -> bool:
+        try:
+            size = client.connection.recv_into(scratch)
+        except BlockingIOError:
+            return True
+        except OSError:
+            size = 0
+        if not size:
+            self._drop_client(selector, client)
+            return True
+        rate = self.rate_limit
+        if rate is not None:
+            now = time.monotonic()
+            client.tokens = min(rate, client.tokens + (now - client.stamp) * rate)
+            client.stamp = now
+        for raw in client.framer.feed(view[:size]):
+            if rate is not None:
+                if client.tokens < 1.0:
                     with self._lock:
-                        self._errors += 1
+                        self._rate_limited += 1
                     continue
-                if not self._emit_payload(payload):
-                    return
+                client.tokens -= 1.0
+            try:
+                payload = json.loads(raw)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                with self._lock:
+                    self._errors += 1
+                continue
+            if not self._emit_payload(payload):
+                with self._lock:
+                    running = self._running
+                if running:
+                    self._drop_client(selector, client)
+                return running
+        if client.framer.pending > self.max_pending_bytes:
+            with self._lock:
+                self._overflowed += 1
+            self._drop_client(selector, client)
+        return True
 
     def health(self) -> dict[str, Any]:
         with self._lock:
@@ -249,6 +387,10 @@ class LocalIPCAdapter(EventAdapter):
                 "errors": self._errors,
                 "bound_port": self.bound_port,
                 "last_error": self._last_error,
+                "clients": self._clients,
+                "rejected": self._rejected,
+                "rate_limited": self._rate_limited,
+                "overflowed": self._overflowed,
             }
 
 
@@ -387,14 +529,40 @@ class UDPAdapter(EventAdapter):
     Replaces the legacy ``emoji_danmaku.udp_receiver`` path: a daemon thread
     binds the socket, JSON payloads are emitted verbatim, and malformed
     datagrams are counted in ``health()["errors"]``.
+
+    Each wakeup drains the socket with ``recv_into`` on one preallocated
+    buffer until it would block (at most ``max_batch`` datagrams).  With
+    ``require_any`` a datagram is decoded only when its raw bytes contain one
+    of the needles; the rest are counted as ``filtered``.  With ``coalesce``
+    identical datagrams of one drain are parsed once and emitted as a single
+    ``adapter.udp`` lifecycle event carrying their ``count``.
     """
 
     name = "udp"
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 9999) -> None:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9999,
+        *,
+        require_any: Iterable[bytes] = (),
+        coalesce: bool = False,
+        max_batch: int = 1024,
+        max_datagram: int = 8192,
+    ) -> None:
         self.host = host
         self.port = int(port)
         self.bound_port: int = 0
+        self.require_any = tuple(bytes(needle) for needle in require_any)
+        self.coalesce = bool(coalesce)
+        self.max_batch = int(max_batch)
+        if self.max_batch < 1:
+            raise ValueError("max_batch must be positive")
+        self.max_datagram = int(max_datagram)
+        if self.max_datagram < 1:
+            raise ValueError("max_datagram must be positive")
+        self._filtered = 0
+        self._coalesced = 0
         self._bus: EventBus | None = None
         self._thread: threading.Thread | None = None
         self._sock: socket.socket | None = None
@@ -426,7 +594,7 @@ class UDPAdapter(EventAdapter):
                 self._thread = None
                 self._running = False
             return
-        sock.settimeout(0.2)
+        sock.setblocking(False)
         with self._lock:
             self._sock = sock
             self.bound_port = sock.getsockname()[1]
@@ -470,36 +638,55 @@ class UDPAdapter(EventAdapter):
             thread.join(timeout=1.0)
 
     def _recv_loop(self, sock: socket.socket) -> None:
+        buffer = bytearray(self.max_datagram)
+        view = memoryview(buffer)
+        needles = self.require_any
         try:
             while True:
                 with self._lock:
                     if not self._running:
                         break
                 try:
-                    data, _ = sock.recvfrom(8192)
+                    readable, _, _ = select.select((sock,), (), (), 0.2)
+                except (OSError, ValueError) as exc:
+                    with self._lock:
+                        if self._running:
+                            self._last_error = f"{type(exc).__name__}: {exc}"
+                        self._running = False
+                    break
+                if not readable:
+                    continue
+                counts: dict[bytes, int] = {}
+                ordered: list[bytes] = []
+                filtered = 0
+                failure: OSError | None = None
+                for _ in range(self.max_batch):
                     try:
-                        payload = json.loads(data.decode("utf-8"))
-                        with self._lock:
-                            self._received += 1
-                            bus = self._bus
-                        if bus is not None:
-                            try:
-                                bus.emit("adapter.udp", payload, source=self.name)
-                            except EventBusError as exc:
-                                with self._lock:
-                                    self._errors += 1
-                                    self._last_error = str(exc)
-                                    self._running = False
+                        size = sock.recv_into(buffer)
+                    except BlockingIOError:
+                        break
+                    except OSError as exc:
+                        failure = exc
+                        break
+                    if needles:
+                        for needle in needles:
+                            if buffer.find(needle, 0, size) >= 0:
                                 break
-                    except (UnicodeDecodeError, json.JSONDecodeError):
-                        with self._lock:
-                            self._errors += 1
-                except socket.timeout:
-                    pass
-                except OSError as exc:
+                        else:
+                            filtered += 1
+                            continue
+                    raw = bytes(view[:size])
+                    if self.coalesce:
+                        counts[raw] = counts.get(raw, 0) + 1
+                    else:
+                        ordered.append(raw)
+                batch = counts.items() if self.coalesce else ((raw, 1) for raw in ordered)
+                if not self._emit_batch(batch, filtered):
+                    break
+                if failure is not None:
                     with self._lock:
                         if self._running:
-                            self._last_error = f"{type(exc).__name__}: {exc}"
+                            self._last_error = f"{type(failure).__name__}: {failure}"
                         self._running = False
                     break
         finally:
@@ -512,6 +699,43 @@ class UDPAdapter(EventAdapter):
                     self._sock = None
                 self._running = False
 
+    def _emit_batch(self, batch: Iterable[tuple[bytes, int]], filtered: int) -> bool:
+        parsed: list[tuple[Any, int]] = []
+        errors = 0
+        for raw, count in batch:
+            try:
+                parsed.append((json.loads(raw), count))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                errors += count
+        with self._lock:
+            self._filtered += filtered
+            self._errors += errors
+            self._received += sum(count for _, count in parsed)
+            self._coalesced += sum(count - 1 for _, count in parsed)
+            bus = self._bus
+        if bus is None:
+            return True
+        try:
+            for payload, count in parsed:
+                if count == 1:
+                    bus.emit("adapter.udp", payload, source=self.name)
+                else:
+                    bus.emit_lifecycle(
+                        "adapter.udp",
+                        payload,
+                        source=self.name,
+                        reason="coalesced",
+                        count=count,
+                        lane=LANE_EXTERNAL,
+                    )
+        except EventBusError as exc:
+            with self._lock:
+                self._errors += 1
+                self._last_error = str(exc)
+                self._running = False
+            return False
+        return True
+
     def health(self) -> dict[str, Any]:
         with self._lock:
             return {
@@ -522,4 +746,6 @@ class UDPAdapter(EventAdapter):
                 "errors": self._errors,
                 "bound_port": self.bound_port,
                 "last_error": self._last_error,
+                "filtered": self._filtered,
+                "coalesced": self._coalesced,
             }
@@ -9,13 +9,18 @@
 - 内容层通过 ctx.audio 统一访问，不关心底层实现
 - 查找顺序：Stage 私有 → Game 全局 → 警告缺失
 - 支持：播放、暂停、循环、停止、音量控制、淡入淡出
+- SE 可交给 AudioLoader 在后台线程解码，未就绪时首次播放会排队而不是阻塞
 """
 
 import os
 import hashlib
 import shutil
+import threading
 import time
-from typing import Optional, Dict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple
 from enum import Enum
 
 from ..core.audio_backend import get_audio_backend, init_audio_backend, Sound as BackendSound
@@ -38,6 +43,45 @@ def normalize_bgm_name(name: str) -> str:
     return os.path.splitext(str(name))[0]
 
 
+class AudioLoader:
+    """
+    后台音频解码器
+
+    在工作线程中解码 SE，每个提交返回一个 Future，
+    关卡切换与启动时主循环不会被磁盘 I/O 和解码卡住。
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="audio-loader"
+        )
+
+    def submit(self, fn, *args) -> Future:
+        return self._executor.submit(fn, *args)
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_loader: Optional[AudioLoader] = None
+
+
+def get_audio_loader() -> AudioLoader:
+    """全局后台解码器（首次使用时创建）"""
+    global _loader
+    if _loader is None:
+        _loader = AudioLoader()
+    return _loader
+
+
+@dataclass(frozen=True)
+class AudioTransitionStall:
+    """一次关卡音频切换在主线程上的停顿"""
+    stage_id: str
+    stall_ms: float
+    pending_se: int
+
+
 class AudioChannel(Enum):
     """音频通道类型"""
     BGM = "bgm"          # 背景音乐（同时只1首）
@@ -56,15 +100,25 @@ class AudioBank:
         bank.load_se("shoot", "assets/audio/se/se_plst00.wav")
         bank.load_se("graze", "assets/audio/se/se_graze.wav")
         bank.play_se("shoot")
+
+    后台加载：
+        bank.load_se_async("boss_voice", "stage/audio/se/voice.wav")
+        bank.play_se("boss_voice")   # 未解码完成时排队，就绪后播放
+        bank.poll_loaded()           # 每帧在主线程收取已完成的解码
     """
     
-    def __init__(self, name: str = "default"):
+    def __init__(self, name: str = "default", loader: Optional[AudioLoader] = None):
         self.name = name
         self._se_cache: Dict[str, BackendSound] = {}
         self._bgm_paths: Dict[str, str] = {}
         self._se_volume: float = 1.0
         self._bgm_volume: float = 1.0
         self._initialized = False
+        self._loader = loader
+        self._pending_se: Dict[str, Future] = {}
+        self._queued_se: Dict[str, Tuple[Optional[float], int]] = {}
+        self._ready_se: deque = deque()
+        self._lock = threading.RLock()
         
         self._ensure_mixer()
     
@@ -99,17 +153,105 @@ class AudioBank:
             print(f"[AudioBank:{self.name}] SE 文件不存在: {path}")
             return False
         
+        sound = self._decode_se(name, path)
+        if sound is None:
+            return False
+        with self._lock:
+            self._pending_se.pop(name, None)
+            self._queued_se.pop(name, None)
+            sound.set_volume(self._se_volume)
+            self._se_cache[name] = sound
+        return True
+
+    def load_se_async(self, name: str, path: str) -> Optional[Future]:
+        """
+        在后台线程加载音效
+
+        Returns:
+            就绪 Future（结果为 Sound 或 None）；文件不存在时返回 None
+        """
+        if not self._initialized:
+            return None
+
+        if not os.path.exists(path):
+            print(f"[AudioBank:{self.name}] SE 文件不存在: {path}")
+            return None
+
+        loader = self._loader or get_audio_loader()
+        future = loader.submit(self._decode_se, name, path)
+        with self._lock:
+            self._pending_se[name] = future
+        # 完成回调运行在解码线程，只入队；由 poll_loaded() 在主线程收取
+        future.add_done_callback(lambda done, se=name: self._ready_se.append((se, done)))
+        return future
+
+    def _decode_se(self, name: str, path: str) -> Optional[BackendSound]:
         try:
             sound = self._load_sound_with_fallback(path)
             if sound is None:
                 print(f"[AudioBank:{self.name}] 加载 SE 失败 '{name}'")
-                return False
-            sound.set_volume(self._se_volume)
-            self._se_cache[name] = sound
-            return True
+            return sound
         except Exception as e:
             print(f"[AudioBank:{self.name}] 加载 SE 失败 '{name}': {e}")
-            return False
+            return None
+
+    def _on_se_ready(self, name: str, future: Future):
+        """后台解码完成：放入缓存，并播放排队中的请求"""
+        with self._lock:
+            if self._pending_se.get(name) is not future:
+                return  # 已被同步加载覆盖或被 clear() 取消
+            del self._pending_se[name]
+            queued = self._queued_se.pop(name, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            sound = future.result()
+            if sound is None:
+                return
+            sound.set_volume(self._se_volume)
+            self._se_cache[name] = sound
+        if queued is not None:
+            volume, loops = queued
+            self.play_se(name, volume, loops)
+
+    def poll_loaded(self) -> int:
+        """
+        收取已完成的后台解码（主循环每帧调用）
+
+        缓存写入与排队中的 play_se 都在调用线程执行，
+        不会在解码线程上触发播放。
+
+        Returns:
+            本次收取的 SE 数量
+        """
+        count = 0
+        while self._ready_se:
+            try:
+                name, future = self._ready_se.popleft()
+            except IndexError:
+                break
+            self._on_se_ready(name, future)
+            count += 1
+        return count
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待所有后台 SE 解码完成（工具/测试用，游戏主循环不要调用）
+
+        Returns:
+            是否全部就绪
+        """
+        with self._lock:
+            pending = dict(self._pending_se)
+        wait_futures(list(pending.values()), timeout=timeout)
+        for name, future in pending.items():
+            if future.done():
+                self._on_se_ready(name, future)
+        return self.pending_se_count == 0
+
+    @property
+    def pending_se_count(self) -> int:
+        """仍在后台解码的 SE 数量"""
+        return len(self._pending_se)
 
     def _load_sound_with_fallback(self, path: str) -> Optional[BackendSound]:
         """
@@ -150,7 +292,7 @@ class AudioBank:
             return None
     
     def load_se_directory(self, directory: str, prefix_strip: str = "se_",
-                          ext: str = ".wav") -> int:
+                          ext: str = ".wav", background: bool = False) -> int:
         """
         批量加载目录下所有音效
         
@@ -160,9 +302,10 @@ class AudioBank:
             directory: 音效目录
             prefix_strip: 要去掉的文件名前缀
             ext: 文件扩展名过滤
+            background: 是否交给后台线程解码
             
         Returns:
-            成功加载的数量
+            成功加载（后台模式下为已提交）的数量
         """
         if not os.path.isdir(directory):
             print(f"[AudioBank:{self.name}] 目录不存在: {directory}")
@@ -179,7 +322,10 @@ class AudioBank:
                 name = name[len(prefix_strip):]
             
             path = os.path.join(directory, filename)
-            if self.load_se(name, path):
+            if background:
+                if self.load_se_async(name, path) is not None:
+                    count += 1
+            elif self.load_se(name, path):
                 count += 1
         
         return count
@@ -236,11 +382,19 @@ class AudioBank:
             loops: 循环次数（0=播放1次，-1=无限循环）
             
         Returns:
-            是否成功播放
+            是否成功播放（仍在后台解码时排队并返回 True）
         """
+        if self._ready_se:
+            self.poll_loaded()
         sound = self._se_cache.get(name)
         if sound is None:
-            return False
+            with self._lock:
+                if name in self._pending_se:
+                    self._queued_se[name] = (volume, loops)
+                    return True
+                sound = self._se_cache.get(name)
+            if sound is None:
+                return False
         
         if volume is not None:
             sound.set_volume(volume)
@@ -252,12 +406,14 @@ class AudioBank:
     
     def stop_se(self, name: str):
         """停止指定音效"""
+        self._queued_se.pop(name, None)
         sound = self._se_cache.get(name)
         if sound:
             sound.stop()
     
     def stop_all_se(self):
         """停止所有音效"""
+        self._queued_se.clear()
         for sound in self._se_cache.values():
             sound.stop()
     
@@ -344,16 +500,18 @@ class AudioBank:
     # ==================== 查询 ====================
     
     def has_se(self, name: str) -> bool:
-        """是否已加载某个 SE"""
-        return name in self._se_cache
+        """是否已加载（或正在后台加载）某个 SE"""
+        return name in self._se_cache or name in self._pending_se
     
     def has_bgm(self, name: str) -> bool:
         """是否已注册某个 BGM"""
         return name in self._bgm_paths
     
     def get_se_names(self) -> list:
-        """获取所有已加载的 SE 名称"""
-        return list(self._se_cache.keys())
+        """获取所有已加载及正在后台加载的 SE 名称"""
+        names = list(self._se_cache.keys())
+        names.extend(name for name in list(self._pending_se) if name not in self._se_cache)
+        return names
     
     def get_bgm_names(self) -> list:
         """获取所有已注册的 BGM 名称"""
@@ -363,6 +521,12 @@ class AudioBank:
     
     def clear(self):
         """释放所有音频资源"""
+        with self._lock:
+            pending = list(self._pending_se.values())
+            self._pending_se.clear()
+            self._ready_se.clear()
+        for future in pending:
+            future.cancel()
         self.stop_all_se()
         self._se_cache.clear()
         self._bgm_paths.clear()
@@ -424,26 +588,32 @@ class GameAudioBank(AudioBank):
         "charge":   "se_hyz_charge00.wav",
     }
     
-    def __init__(self):
-        super().__init__(name="game")
+    def __init__(self, loader: Optional[AudioLoader] = None):
+        super().__init__(name="game", loader=loader)
     
     def load_defaults(self, se_dir: str = "assets/audio/se",
-                      bgm_dir: str = "assets/audio/music"):
+                      bgm_dir: str = "assets/audio/music",
+                      background: bool = False):
         """
         加载默认的全局音效和 BGM
         
         Args:
             se_dir: 音效目录
             bgm_dir: BGM 目录
+            background: 是否交给后台线程解码 SE
         """
         # 加载预设的常用 SE
         loaded = 0
         for name, filename in self.DEFAULT_SE_MAP.items():
             path = os.path.join(se_dir, filename)
-            if self.load_se(name, path):
+            if background:
+                if self.load_se_async(name, path) is not None:
+                    loaded += 1
+            elif self.load_se(name, path):
                 loaded += 1
         
-        print(f"[GameAudioBank] 加载 {loaded}/{len(self.DEFAULT_SE_MAP)} 个全局 SE")
+        action = "后台加载" if background else "加载"
+        print(f"[GameAudioBank] {action} {loaded}/{len(self.DEFAULT_SE_MAP)} 个全局 SE")
         
         # 注册 BGM 目录
         bgm_count = self.load_bgm_directory(bgm_dir)
@@ -466,12 +636,14 @@ class StageAudioBank(AudioBank):
         - 特殊弹幕音效
     """
     
-    def __init__(self, stage_id: str):
-        super().__init__(name=f"stage:{stage_id}")
+    def __init__(self, stage_id: str, loader: Optional[AudioLoader] = None):
+        super().__init__(name=f"stage:{stage_id}", loader=loader)
         self.stage_id = stage_id
     
     @classmethod
-    def from_directory(cls, stage_id: str, stage_dir: str) -> 'StageAudioBank':
+    def from_directory(cls, stage_id: str, stage_dir: str,
+                       background: bool = False,
+                       loader: Optional[AudioLoader] = None) -> 'StageAudioBank':
         """
         从关卡目录自动加载音频
         
@@ -484,13 +656,15 @@ class StageAudioBank(AudioBank):
         Args:
             stage_id: 关卡 ID
             stage_dir: 关卡目录路径
+            background: 是否交给后台线程解码 SE
+            loader: 后台解码器，None 使用全局解码器
         """
-        bank = cls(stage_id)
+        bank = cls(stage_id, loader=loader)
         
         # 加载关卡专属 SE
         se_dir = os.path.join(stage_dir, "audio", "se")
         if os.path.isdir(se_dir):
-            count = bank.load_se_directory(se_dir)
+            count = bank.load_se_directory(se_dir, background=background)
             if count > 0:
                 print(f"[StageAudioBank:{stage_id}] 加载 {count} 个关卡 SE")
         
@@ -522,6 +696,7 @@ class AudioManager:
         self._current_bgm_name: str = ""
         self._bgm_notification_text: str = ""
         self._bgm_notification_until: float = 0.0
+        self._transition_stalls: deque = deque(maxlen=32)
     
     @property
     def game_bank(self) -> GameAudioBank:
@@ -539,11 +714,53 @@ class AudioManager:
         
         传入 None 表示清除关卡音频。
         """
+        started = time.perf_counter()
+        self._swap_stage_bank(bank)
+        self._record_transition(bank.stage_id if bank else "", started)
+
+    def load_stage_bank(self, stage_id: str, stage_dir: str,
+                        background: bool = True) -> StageAudioBank:
+        """
+        从关卡目录创建并切换关卡音频池
+
+        默认后台解码 SE，主线程只承担目录扫描和 BGM 登记；
+        本次切换的主线程停顿记录在 transition_stalls 中。
+        """
+        started = time.perf_counter()
+        bank = StageAudioBank.from_directory(stage_id, stage_dir, background=background)
+        self._swap_stage_bank(bank)
+        self._record_transition(stage_id, started)
+        return bank
+
+    def _swap_stage_bank(self, bank: Optional[StageAudioBank]):
         # 先清理旧的
         if self._stage_bank is not None:
             self._stage_bank.clear()
         self._stage_bank = bank
-    
+
+    def _record_transition(self, stage_id: str, started: float):
+        pending = self._stage_bank.pending_se_count if self._stage_bank else 0
+        stall_ms = (time.perf_counter() - started) * 1000.0
+        self._transition_stalls.append(AudioTransitionStall(stage_id, stall_ms, pending))
+
+    @property
+    def transition_stalls(self) -> Tuple[AudioTransitionStall, ...]:
+        """最近的关卡音频切换停顿记录（最多 32 条）"""
+        return tuple(self._transition_stalls)
+
+    @property
+    def last_transition_stall_ms(self) -> float:
+        """最近一次关卡音频切换的主线程停顿（毫秒）"""
+        if not self._transition_stalls:
+            return 0.0
+        return self._transition_stalls[-1].stall_ms
+    
+    def update(self):
+        """每帧调用：在主线程收取全局/关卡池的后台解码结果"""
+        self._game_bank.poll_loaded()
+        if self._stage_bank is not None:
+            self._stage_bank.poll_loaded()
+
     # ==================== SE ====================
     
     def play_se(self, name: str, volume: Optional[float] = None, loops: int = 0,
@@ -8,6 +8,7 @@ from .optimized_pool import OptimizedBulletPool
 from .optimized_pool import (
     FLAG_BOUNCE_X, FLAG_BOUNCE_Y, FLAG_IS_EMITTER, FLAG_RENDER_ANGLE_LOCKED, FLAG_IS_POLAR,
     CURVE_NONE, CURVE_SIN_SPEED, CURVE_SIN_ANGLE, CURVE_COS_SPEED, CURVE_LINEAR_SPEED,
+    TRACK_NONE,
 )
 from .tags import BOMB_PROTECTED_TAGS
 
@@ -14,13 +14,14 @@ v2 扩展字段:
 - time_scale: 每子弹时间缩放（时停 / 慢动作）
 - flags: 位标志（反弹、发射器、render_angle 锁定等）
 - curve_type / curve_param: 内置数学曲线（sin/cos/linear 速度/角度调制）
+- speed_track / turn_track: 共享轨道表中的分段线性速度 / 角速度轨道（-1 = 无）
 """
 
 import numpy as np
 from numba import njit
 import math
 from typing import Dict, List, Tuple, Optional, Callable, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 # 使用绝对导入
 import sys
@@ -49,6 +50,10 @@ CURVE_COS_SPEED    = 3  # speed = base + amp * cos(freq * t + phase)
 CURVE_LINEAR_SPEED = 4  # speed = base + amp * t
 CURVE_DELAYED_TURN = 5  # after delay seconds, add a constant angular velocity
 
+# ============= Motion track 常量 =============
+
+TRACK_NONE = -1  # speed_track / turn_track 未绑定
+
 
 @dataclass
 class SpawnRequest:
@@ -74,6 +79,8 @@ class SpawnRequest:
     render_scale: float = 1.0
     curve_type: int = 0
     curve_param: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    speed_track: int = TRACK_NONE
+    turn_track: int = TRACK_NONE
 
 
 @dataclass
@@ -97,6 +104,93 @@ class LifecycleBatch:
     representative_ids: tuple[str, ...] = ()
     representative_positions: tuple[tuple[float, float], ...] = ()
     payload: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class DeathColumns:
+    """Columnar terminal facts for every bullet that died since a drain.
+
+    One row per bullet: slot index, owner tag, interned reason code, final
+    position and record group.  Rows share a group when one clear, kill or
+    update recorded them under one reason.  :meth:`summarize` folds the rows
+    into one :class:`LifecycleBatch` per (group, tag) with ``np.bincount``, so
+    the Python work per drain is bounded by the number of batches rather than
+    by the number of bullets.
+    """
+
+    indices: np.ndarray
+    tags: np.ndarray
+    reasons: np.ndarray
+    positions: np.ndarray
+    groups: np.ndarray
+    reason_names: Tuple[str | None, ...] = ()
+
+    @classmethod
+    def empty(cls, reason_names: Tuple[str | None, ...] = ()) -> "DeathColumns":
+        return cls(
+            np.zeros(0, dtype=np.intp),
+            np.zeros(0, dtype=np.int32),
+            np.zeros(0, dtype=np.int16),
+            np.zeros((0, 2), dtype=np.float32),
+            np.zeros(0, dtype=np.int64),
+            tuple(reason_names),
+        )
+
+    def __len__(self) -> int:
+        return int(self.indices.size)
+
+    def counts(self) -> Dict[Tuple[int, str | None], int]:
+        """Return bullets per (tag, reason) without materializing batches."""
+
+        if not len(self):
+            return {}
+        tag_values, tag_rank = np.unique(self.tags, return_inverse=True)
+        width = len(tag_values)
+        keys = self.reasons.astype(np.intp) * width + tag_rank
+        counts = np.bincount(keys, minlength=width * len(self.reason_names))
+        return {
+            (int(tag_values[key % width]), self.reason_names[key // width]): int(counts[key])
+            for key in np.flatnonzero(counts)
+        }
+
+    def summarize(self, *, event_type: str = "bullet.terminated") -> Tuple[LifecycleBatch, ...]:
+        """Return one bounded batch per (group, tag).
+
+        Batches come in recording order with tags ascending inside a group,
+        the order the pool produced when it built batches per clear.
+        """
+
+        if not len(self):
+            return ()
+        tag_values, tag_rank = np.unique(self.tags, return_inverse=True)
+        width = len(tag_values)
+        keys, inverse = np.unique(
+            self.groups.astype(np.int64) * width + tag_rank, return_inverse=True
+        )
+        counts = np.bincount(inverse, minlength=len(keys))
+        order = np.argsort(inverse, kind="stable")
+        ends = np.cumsum(counts)
+        batches = []
+        for slot, key in enumerate(keys):
+            count = int(counts[slot])
+            start = int(ends[slot]) - count
+            rows = order[start:start + min(count, 8)]
+            tag = int(tag_values[int(key) % width])
+            batches.append(
+                LifecycleBatch(
+                    event_type=event_type,
+                    source="bullet_pool",
+                    owner=None if tag == 0 else str(tag),
+                    reason=self.reason_names[int(self.reasons[rows[0]])],
+                    count=count,
+                    representative_ids=tuple(str(int(index)) for index in self.indices[rows]),
+                    representative_positions=tuple(
+                        (float(x), float(y)) for x, y in self.positions[rows]
+                    ),
+                    payload={"tag": tag},
+                )
+            )
+        return tuple(batches)
 
 
 @dataclass
@@ -123,6 +217,7 @@ class OptimizedBulletPool:
     - 边界反弹 (flags & BOUNCE_X/Y)
     - 发射器节点 (flags & IS_EMITTER) — 不渲染不碰撞但可挂回调
     - 内置数学曲线 (curve_type + curve_param)
+    - 分段线性运动轨道 (speed_track / turn_track → 共享轨道表，内核内求值)
     """
 
     def __init__(self, max_bullets: int = 50000, sprite_registry: SpriteRegistry = None):
@@ -150,6 +245,8 @@ class OptimizedBulletPool:
             ('time_scale', 'f4'),       # 时间缩放 (1.0=正常)
             ('curve_type', 'u1'),       # 内置曲线类型
             ('curve_param', 'f4', 4),   # 曲线参数 [amp, freq, phase, base]
+            ('speed_track', 'i4'),      # 速度轨道 id（-1 = 无）
+            ('turn_track', 'i4'),       # 角速度轨道 id（-1 = 无）
         ])
 
         self.data = np.zeros(max_bullets, dtype=self.dtype)
@@ -157,6 +254,18 @@ class OptimizedBulletPool:
         self.data['time_scale'] = 1.0
         self.data['flags'] = FLAG_RENDER_ANGLE_LOCKED
         self.data['render_scale'] = 1.0
+        self.data['speed_track'] = TRACK_NONE
+        self.data['turn_track'] = TRACK_NONE
+
+        # Shared piecewise-linear motion tracks.  Track ``k`` owns keys
+        # ``track_starts[k] : track_starts[k] + track_lengths[k]`` of the key
+        # buffers; tracks are append-only and deduplicated, so ids stored in
+        # bullet rows stay valid across clears and checkpoint restores.
+        self.track_starts = np.zeros(0, dtype=np.int32)
+        self.track_lengths = np.zeros(0, dtype=np.int32)
+        self.track_times = np.zeros(0, dtype=np.float32)
+        self.track_values = np.zeros(0, dtype=np.float32)
+        self._track_ids: Dict[bytes, int] = {}
 
         # Stack pop should allocate low-to-high indices for deterministic
         # authored batch order; releases still append for O(1) reuse.
@@ -169,11 +278,13 @@ class OptimizedBulletPool:
 
         self.spawn_queue: List[SpawnRequest] = []
         self.death_queue: List[DeathEvent] = []
-        # Formal runtime lifecycle facts are one record per (reason, owner,
-        # frame/update), never one Python object per bullet.  Legacy
-        # ``death_handlers`` remain available only for the explicitly opted-in
-        # compatibility API.
-        self.lifecycle_batches: List[LifecycleBatch] = []
+        # Formal runtime lifecycle facts are columnar death rows folded into
+        # one record per (reason, owner) on drain, never one Python object
+        # per bullet.  Legacy ``death_handlers`` remain available only for the
+        # explicitly opted-in compatibility API.
+        self._death_chunks: List[Tuple[np.ndarray, ...]] = []
+        self._death_reason_codes: Dict[str | None, int] = {"expired": 0, "out_of_bounds": 1}
+        self._death_group = 0
         self._termination_reasons: Dict[int, str] = {}
         self._termination_batch_reactions: Dict[int, Dict[str, Any]] = {}
         self._termination_batch_queue: List[tuple[np.ndarray, Dict[str, Any], int]] = []
@@ -244,6 +355,8 @@ class OptimizedBulletPool:
         render_scale: float = 1.0,
         curve_type: int = 0,
         curve_param: Tuple[float, float, float, float] = None,
+        speed_track: int = TRACK_NONE,
+        turn_track: int = TRACK_NONE,
         **kwargs  # 忽略未知参数
     ) -> int:
         """
@@ -258,6 +371,7 @@ class OptimizedBulletPool:
             render_angle: 初始渲染朝向（None = 跟随 angle）
             curve_type: 内置曲线类型
             curve_param: 曲线参数 (amp, freq, phase, base)
+            speed_track / turn_track: register_motion_track 返回的轨道 id
         """
         acc = acc or (0.0, 0.0)
         curve_param = curve_param or (0.0, 0.0, 0.0, 0.0)
@@ -277,6 +391,7 @@ class OptimizedBulletPool:
                 flags=flags, angular_vel=angular_vel, render_angle=render_angle,
                 render_scale=render_scale,
                 curve_type=curve_type, curve_param=curve_param,
+                speed_track=speed_track, turn_track=turn_track,
             ))
             return -1
 
@@ -287,7 +402,7 @@ class OptimizedBulletPool:
         self._write_bullet(idx, x, y, angle, speed, acc, sprite_idx, radius,
                            max_lifetime, friction, tag, time_scale, flags,
                            angular_vel, render_angle, render_scale,
-                           curve_type, curve_param)
+                           curve_type, curve_param, speed_track, turn_track)
 
         if on_death:
             self.death_handlers[idx] = on_death
@@ -301,7 +416,8 @@ class OptimizedBulletPool:
 
     def _write_bullet(self, idx, x, y, angle, speed, acc, sprite_idx, radius,
                       max_lifetime, friction, tag, time_scale, flags,
-                      angular_vel, render_angle, render_scale, curve_type, curve_param):
+                      angular_vel, render_angle, render_scale, curve_type, curve_param,
+                      speed_track=TRACK_NONE, turn_track=TRACK_NONE):
         """写入子弹数据到指定 slot"""
         vx = math.cos(angle) * speed
         vy = math.sin(angle) * speed
@@ -325,6 +441,8 @@ class OptimizedBulletPool:
         d['flags'][idx] = flags
         d['curve_type'][idx] = curve_type
         d['curve_param'][idx] = curve_param
+        d['speed_track'][idx] = speed_track
+        d['turn_track'][idx] = turn_track
         d['alive'][idx] = 1
 
     def spawn_pattern(
@@ -392,6 +510,8 @@ class OptimizedBulletPool:
         d['flags'][use_indices] = flags
         d['curve_type'][use_indices] = CURVE_NONE
         d['curve_param'][use_indices] = (0.0, 0.0, 0.0, 0.0)
+        d['speed_track'][use_indices] = TRACK_NONE
+        d['turn_track'][use_indices] = TRACK_NONE
         d['alive'][use_indices] = 1
 
         if on_death:
@@ -420,6 +540,8 @@ class OptimizedBulletPool:
         render_scale: float = 1.0,
         curve_type: int = CURVE_NONE,
         curve_param: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0),
+        speed_track: int = TRACK_NONE,
+        turn_track: int = TRACK_NONE,
     ) -> np.ndarray:
         """Spawn heterogeneous bullets with one vectorized pool write.
 
@@ -495,6 +617,8 @@ class OptimizedBulletPool:
         d['flags'][use_indices] = flags
         d['curve_type'][use_indices] = curve_type
         d['curve_param'][use_indices] = curve_param
+        d['speed_track'][use_indices] = speed_track
+        d['turn_track'][use_indices] = turn_track
         d['alive'][use_indices] = 1
         self.batch_spawn_calls += 1
 
@@ -506,6 +630,38 @@ class OptimizedBulletPool:
             self.emitter_callbacks.pop(int(idx), None)
         return use_indices
 
+    # ===== 运动轨道 (Motion tracks) =====
+
+    def register_motion_track(self, times, values) -> int:
+        """Register a piecewise-linear track and return its id.
+
+        ``times`` are strictly increasing lifetimes in seconds. The kernel
+        holds the first value before the first key and the last value after
+        the last key. Identical tracks share one id.
+        """
+        time_array = np.ascontiguousarray(times, dtype=np.float32)
+        value_array = np.ascontiguousarray(values, dtype=np.float32)
+        if time_array.ndim != 1 or value_array.shape != time_array.shape:
+            raise ValueError("track times and values must be equal-length 1-D arrays")
+        if time_array.size == 0:
+            raise ValueError("a motion track needs at least one key")
+        if not (np.all(np.isfinite(time_array)) and np.all(np.isfinite(value_array))):
+            raise ValueError("track times and values must be finite")
+        if np.any(np.diff(time_array) <= 0.0):
+            raise ValueError("track times must be strictly increasing")
+
+        key = time_array.tobytes() + b'|' + value_array.tobytes()
+        track_id = self._track_ids.get(key)
+        if track_id is not None:
+            return track_id
+        track_id = len(self.track_starts)
+        self.track_starts = np.append(self.track_starts, np.int32(len(self.track_times)))
+        self.track_lengths = np.append(self.track_lengths, np.int32(time_array.size))
+        self.track_times = np.concatenate((self.track_times, time_array))
+        self.track_values = np.concatenate((self.track_values, value_array))
+        self._track_ids[key] = track_id
+        return track_id
+
     def spawn_emitter(self, x: float, y: float, angle: float, speed: float,
                       callback: Callable, **kwargs) -> int:
         """
@@ -646,7 +802,11 @@ class OptimizedBulletPool:
         """更新所有子弹"""
         self.last_alive[:] = self.data['alive']
 
-        _update_bullets_optimized(self.data, dt)
+        _update_bullets_optimized(
+            self.data, dt,
+            self.track_starts, self.track_lengths,
+            self.track_times, self.track_values,
+        )
 
         self._update_polar_motions(dt)
         self._update_emitters()
@@ -679,46 +839,34 @@ class OptimizedBulletPool:
                 event.handler(self, event)
         self.death_queue.clear()
 
-    def _record_lifecycle(
-        self,
-        indices,
-        *,
-        reason: str | None,
-        event_type: str = "bullet.terminated",
-    ) -> None:
-        """Append one bounded batch fact for ``indices``.
+    def _reason_code(self, reason: str | None) -> int:
+        name = None if reason is None else str(reason)
+        code = self._death_reason_codes.get(name)
+        if code is None:
+            code = self._death_reason_codes[name] = len(self._death_reason_codes)
+        return code
 
-        The pool stores only a small representative sample.  Consumers that
-        need every position must use a vectorized action over the owner/tag,
-        not a Python callback per element.
-        """
+    def _record_lifecycle(self, indices, *, reason: str | None) -> None:
+        """Append death rows for ``indices`` as one group with one reason."""
 
         values = np.asarray(indices, dtype=np.intp)
         if values.size == 0:
             return
-        tags = self.data['tag'][values]
-        # A single clear operation may contain multiple owners.  Split by the
-        # typed tag while keeping each group as one batch record.
-        for tag in np.unique(tags):
-            group = values[tags == tag]
-            sample = group[:8]
-            positions = tuple(
-                (float(self.data['pos'][int(index), 0]), float(self.data['pos'][int(index), 1]))
-                for index in sample
-            )
-            owner = None if int(tag) == 0 else str(int(tag))
-            self.lifecycle_batches.append(
-                LifecycleBatch(
-                    event_type=event_type,
-                    source="bullet_pool",
-                    owner=owner,
-                    reason=reason,
-                    count=int(group.size),
-                    representative_ids=tuple(str(int(index)) for index in sample),
-                    representative_positions=positions,
-                    payload={"tag": int(tag)},
-                )
+        codes = np.full(values.size, self._reason_code(reason), dtype=np.int16)
+        groups = np.full(values.size, self._death_group, dtype=np.int64)
+        self._death_group += 1
+        self._record_death_rows(values, codes, groups)
+
+    def _record_death_rows(self, values: np.ndarray, codes: np.ndarray, groups: np.ndarray) -> None:
+        self._death_chunks.append(
+            (
+                values.copy(),
+                self.data['tag'][values].astype(np.int32),
+                codes,
+                self.data['pos'][values].astype(np.float32),
+                groups,
             )
+        )
 
     def register_termination_batch_reaction(self, tag: int, spec: Dict[str, Any]) -> None:
         """Register one vectorized owner reaction, never one callback per bullet."""
@@ -786,38 +934,65 @@ class OptimizedBulletPool:
             | (data['pos'][values, 1] < -1.5)
             | (data['pos'][values, 1] > 1.5)
         )
-        explicit = np.array(
-            [index in self._termination_reasons for index in values], dtype=bool
+        codes = np.full(values.size, self._reason_code("hit_destroyed"), dtype=np.int16)
+        explicit = np.zeros(values.size, dtype=bool)
+        if self._termination_reasons:
+            marked = np.fromiter(self._termination_reasons, dtype=np.intp)
+            marked_codes = np.fromiter(
+                (self._reason_code(reason) for reason in self._termination_reasons.values()),
+                dtype=np.int16,
+                count=marked.size,
+            )
+            order = np.argsort(marked)
+            marked, marked_codes = marked[order], marked_codes[order]
+            slots = np.minimum(np.searchsorted(marked, values), marked.size - 1)
+            explicit = marked[slots] == values
+            codes[explicit] = marked_codes[slots[explicit]]
+        # Groups keep the collector's batch order: expired, out_of_bounds,
+        # explicit reasons sorted by name, then hit_destroyed.
+        names = tuple(self._death_reason_codes)
+        explicit_codes = sorted(
+            (int(code) for code in np.unique(codes[explicit])), key=lambda code: str(names[code])
         )
-        handled = np.zeros(values.size, dtype=bool)
-        for reason, mask in (
-            ("expired", expired),
-            ("out_of_bounds", outside & ~expired),
+        rank_of_code = np.zeros(len(names), dtype=np.int64)
+        rank_of_code[explicit_codes] = np.arange(2, 2 + len(explicit_codes))
+        ranks = np.full(values.size, 2 + len(explicit_codes), dtype=np.int64)
+        ranks[explicit] = rank_of_code[codes[explicit]]
+        for rank, reason, mask in (
+            (0, "expired", expired & ~explicit),
+            (1, "out_of_bounds", outside & ~expired & ~explicit),
         ):
-            selected = values[mask & ~explicit]
-            if selected.size:
-                self._record_lifecycle(selected, reason=reason)
-                self._queue_termination_batch_reaction(selected, reason)
-                handled |= mask & ~explicit
-        explicit_values = values[explicit]
-        if explicit_values.size:
-            for reason in sorted({self._termination_reasons[int(index)] for index in explicit_values}):
-                selected = np.asarray(
-                    [index for index in explicit_values if self._termination_reasons[int(index)] == reason],
-                    dtype=np.intp,
-                )
-                self._record_lifecycle(selected, reason=reason)
-                handled |= np.isin(values, selected)
-        remaining = values[~handled]
-        if remaining.size:
-            self._record_lifecycle(remaining, reason="hit_destroyed")
+            if mask.any():
+                codes[mask] = self._reason_code(reason)
+                ranks[mask] = rank
+                self._queue_termination_batch_reaction(values[mask], reason)
+        groups = self._death_group + ranks
+        self._death_group += 3 + len(explicit_codes)
+        self._record_death_rows(values, codes, groups)
+
+    def drain_death_columns(self) -> DeathColumns:
+        """Return and clear the columnar death rows collected since the last drain."""
+
+        names = tuple(self._death_reason_codes)
+        chunks = self._death_chunks
+        self._death_chunks = []
+        if not chunks:
+            return DeathColumns.empty(names)
+        if len(chunks) == 1:
+            return DeathColumns(*chunks[0], reason_names=names)
+        return DeathColumns(
+            np.concatenate([chunk[0] for chunk in chunks]),
+            np.concatenate([chunk[1] for chunk in chunks]),
+            np.concatenate([chunk[2] for chunk in chunks]),
+            np.concatenate([chunk[3] for chunk in chunks]),
+            np.concatenate([chunk[4] for chunk in chunks]),
+            names,
+        )
 
     def drain_lifecycle_batches(self) -> tuple[LifecycleBatch, ...]:
         """Return and clear formal batch facts collected since the last drain."""
 
-        values = tuple(self.lifecycle_batches)
-        self.lifecycle_batches.clear()
-        return values
+        return self.drain_death_columns().summarize()
 
     def _process_spawn_queue(self):
         new_queue = []
@@ -838,7 +1013,8 @@ class OptimizedBulletPool:
                            req.sprite_idx, req.radius, req.max_lifetime,
                            req.friction, req.tag, req.time_scale, req.flags,
                            req.angular_vel, req.render_angle, req.render_scale,
-                           req.curve_type, req.curve_param)
+                           req.curve_type, req.curve_param,
+                           req.speed_track, req.turn_track)
 
         if req.on_death:
             self.death_handlers[idx] = req.on_death
@@ -991,6 +1167,72 @@ class OptimizedBulletPool:
         self.data['time_scale'] = 1.0
         self.data['flags'] = FLAG_RENDER_ANGLE_LOCKED
         self.data['render_scale'] = 1.0
+        self.data['speed_track'] = TRACK_NONE
+        self.data['turn_track'] = TRACK_NONE
+
+    # ===== Seek checkpoints =====
+
+    def capture_checkpoint(self) -> Dict[str, Any]:
+        """Copy every simulation-relevant array and queue for an exact restore.
+
+        Render scratch buffers are derived per frame and are not captured.
+        Python callbacks are shared by reference; their closures are owned by
+        the caller that registered them.
+        """
+        return {
+            "data": self.data.copy(),
+            "last_alive": self.last_alive.copy(),
+            "free_indices": list(self.free_indices),
+            "death_handlers": dict(self.death_handlers),
+            "polar_motions": {
+                idx: replace(motion) for idx, motion in self.polar_motions.items()
+            },
+            "emitter_callbacks": dict(self.emitter_callbacks),
+            "spawn_queue": [replace(req) for req in self.spawn_queue],
+            "death_queue": list(self.death_queue),
+            "death_chunks": list(self._death_chunks),
+            "death_reason_codes": dict(self._death_reason_codes),
+            "death_group": self._death_group,
+            "termination_reasons": dict(self._termination_reasons),
+            "termination_batch_reactions": {
+                tag: dict(spec)
+                for tag, spec in self._termination_batch_reactions.items()
+            },
+            "termination_batch_queue": [
+                (sources.copy(), dict(spec), tag)
+                for sources, spec, tag in self._termination_batch_queue
+            ],
+            "batch_spawn_calls": self.batch_spawn_calls,
+        }
+
+    def restore_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        data = checkpoint["data"]
+        if data.shape != self.data.shape or data.dtype != self.data.dtype:
+            raise ValueError("checkpoint does not match this pool's layout")
+        self.data[:] = data
+        self.last_alive[:] = checkpoint["last_alive"]
+        self.free_indices = list(checkpoint["free_indices"])
+        self.death_handlers = dict(checkpoint["death_handlers"])
+        self.polar_motions = {
+            idx: replace(motion)
+            for idx, motion in checkpoint["polar_motions"].items()
+        }
+        self.emitter_callbacks = dict(checkpoint["emitter_callbacks"])
+        self.spawn_queue = [replace(req) for req in checkpoint["spawn_queue"]]
+        self.death_queue = list(checkpoint["death_queue"])
+        self._death_chunks = list(checkpoint["death_chunks"])
+        self._death_reason_codes = dict(checkpoint["death_reason_codes"])
+        self._death_group = int(checkpoint["death_group"])
+        self._termination_reasons = dict(checkpoint["termination_reasons"])
+        self._termination_batch_reactions = {
+            tag: dict(spec)
+            for tag, spec in checkpoint["termination_batch_reactions"].items()
+        }
+        self._termination_batch_queue = [
+            (sources.copy(), dict(spec), tag)
+            for sources, spec, tag in checkpoint["termination_batch_queue"]
+        ]
+        self.batch_spawn_calls = int(checkpoint["batch_spawn_calls"])
 
     # ===== 极坐标运动 API =====
 
@@ -1182,12 +1424,35 @@ def _prepare_render_data_sorted_numba(
 
 
 @njit(cache=True)
-def _update_bullets_optimized(data, dt):
+def _sample_track(track, t, track_starts, track_lengths, track_times, track_values):
+    """分段线性轨道求值（首键之前取首值，末键之后取末值）"""
+    start = track_starts[track]
+    end = start + track_lengths[track] - 1
+    if t <= track_times[start]:
+        return track_values[start]
+    if t >= track_times[end]:
+        return track_values[end]
+    lo = start
+    hi = end
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if track_times[mid] <= t:
+            lo = mid
+        else:
+            hi = mid
+    span = track_times[hi] - track_times[lo]
+    alpha = (t - track_times[lo]) / span
+    return track_values[lo] + (track_values[hi] - track_values[lo]) * alpha
+
+
+@njit(cache=True)
+def _update_bullets_optimized(data, dt, track_starts, track_lengths,
+                              track_times, track_values):
     """
     v2 子弹更新内核（Numba JIT）
 
     新增处理：time_scale, friction, render_angle/angular_vel,
-    bounce, curve, emitter 边界豁免
+    bounce, curve, motion track, emitter 边界豁免
     """
     n = len(data)
     for i in range(n):
@@ -1233,6 +1498,20 @@ def _update_bullets_optimized(data, dt):
             elif ct == 5:  # DELAYED_TURN: amp=angular velocity, freq=delay
                 if t >= freq:
                     data[i]['angle'] += amp * local_dt
+
+        # ---- 分段线性运动轨道 ----
+        st = data[i]['speed_track']
+        if st >= 0:
+            data[i]['speed'] = _sample_track(
+                st, data[i]['lifetime'],
+                track_starts, track_lengths, track_times, track_values,
+            )
+        tt = data[i]['turn_track']
+        if tt >= 0:
+            data[i]['angle'] += _sample_track(
+                tt, data[i]['lifetime'],
+                track_starts, track_lengths, track_times, track_values,
+            ) * local_dt
 
         # ---- 摩擦力 / 阻尼 ----
         friction = data[i]['friction']
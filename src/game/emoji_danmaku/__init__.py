@@ -29,8 +29,8 @@ QQ 群弹幕 emoji 子系统外观类。
 from typing import TYPE_CHECKING
 
 # emoji_gl_renderer 依赖 moderngl，延迟到运行时导入（主进程有 GL 上下文）
-from .emoji_pool import BASE_RENDER_PX_SIZE, EMOJI_LIST, EmojiObjectPool
-from .heat_system import HeatSystem
+from .emoji_pool import BASE_RENDER_PX_SIZE, EMOJI_LIST, GAME_Y_SCALE, EmojiObjectPool
+from .heat_system import HEAT_PER_MSG, HeatSystem
 from .main_pool_bridge import (
     TAG_EXTERNAL_DANMAKU,
     register_emoji_bullet_assets,
@@ -66,7 +66,7 @@ _HEAT_COLORS = {       # 每个 emoji 对应热度条填充色
 # 抽奖大字显示的坐标（相对屏幕，居中于游戏区域）
 _DRAW_TEXT_ALPHA_BG = 0.55   # 抽奖背景遮罩透明度
 
-_GAME_Y_SCALE = 384.0 / 448.0
+_GAME_Y_SCALE = GAME_Y_SCALE
 
 
 def _game_to_screen(
@@ -93,12 +93,6 @@ def _screen_to_game(
     return gx, gy
 
 
-def _emoji_radius_game(obj, gvw: int) -> float:
-    px_radius = BASE_RENDER_PX_SIZE * float(getattr(obj, "scale", 1.0))
-    px_radius *= float(getattr(obj, "hitbox_factor", 0.42))
-    return px_radius / (gvw / 2.0)
-
-
 class EmojiDanmakuSystem:
     """QQ 群 emoji 弹幕子系统。"""
 
@@ -137,12 +131,16 @@ class EmojiDanmakuSystem:
         self._receiver.stop()
         self._gl.cleanup()
 
+    @property
+    def lane_stats(self) -> dict[str, dict]:
+        """UDP 事件总线各 lane 的丢弃/合并计数。"""
+        return self._receiver.lane_stats
+
     def clear(self) -> None:
         """清空所有飘落 emoji 和发射弹（不清空热度状态）。
         Continue 复活时调用，避免一复活就被残余 emoji 弹打死。
         """
-        self._pool.falling.clear()
-        self._pool.projectiles.clear()
+        self._pool.clear()
         if self._bullet_pool is not None and hasattr(self._bullet_pool, "clear_by_tag"):
             self._bullet_pool.clear_by_tag(TAG_EXTERNAL_DANMAKU)
 
@@ -157,11 +155,13 @@ class EmojiDanmakuSystem:
         # 1. 处理 UDP 事件
         for ev in self._receiver.poll():
             emoji = ev["emoji"]
-            self._heat.add_heat(emoji)
-            if self._bullet_pool is not None:
-                spawn_falling_emoji_bullet(self._bullet_pool, self.game_viewport, emoji)
-            else:
-                self._pool.spawn_falling(emoji)
+            count = ev["count"]
+            self._heat.add_heat(emoji, HEAT_PER_MSG * count)
+            for _ in range(count):
+                if self._bullet_pool is not None:
+                    spawn_falling_emoji_bullet(self._bullet_pool, self.game_viewport, emoji)
+                else:
+                    self._pool.spawn_falling(emoji)
 
         # 2. 更新池（飘落 + 发射弹）
         if self._bullet_pool is None:
@@ -181,8 +181,7 @@ class EmojiDanmakuSystem:
         self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
         if self._bullet_pool is not None:
             return
-        all_objs = self._pool.falling + self._pool.projectiles
-        self._gl.render_list(all_objs, clip_rect=self.game_viewport)
+        self._gl.render_pool(self._pool, clip_rect=self.game_viewport)
 
     def render_ui(self, ui_renderer: "UIRenderer") -> None:
         """
@@ -255,46 +254,19 @@ class EmojiDanmakuSystem:
 
         坐标系：
           player.get_hit_position() → 游戏坐标 (x ∈[-1,1], y ∈[-1,~1])
-          emoji 弹储存的是屏幕像素坐标，先逆变换到游戏坐标再比较，
-          避免 Y_SCALE 带来的误差。
+          emoji 池本身以游戏坐标存储，整池一次向量化距离判定即可。
         """
         if getattr(self, "_bullet_pool", None) is not None:
             return False
-
-        collidable = self._pool.falling + self._pool.projectiles
-        if not collidable:
+        if not len(self._pool):
             return False
 
         hit_x, hit_y = player.get_hit_position()
-
-        # ── 屏幕像素 → 游戏坐标的逆变换 ─────────────────────────────────────
-        # 正变换（_game_to_screen）：
-        #   sx = gvx + (gx + 1) / 2 * gvw
-        #   ndc_y = gy * Y_SCALE
-        #   sy = gvy + (1 - ndc_y) / 2 * gvh
-        # 逆变换：
-        #   gx = (sx - gvx) / gvw * 2 - 1
-        #   gy = (1 - (sy - gvy) / gvh * 2) / Y_SCALE
-        gvx, gvy, gvw, gvh = self.gvx, self.gvy, self.gvw, self.gvh
-
-        hit_occurred = False
-        for obj in collidable:
-            if not obj.alive:
-                continue
-            # 逆变换
-            gx, gy = _screen_to_game(obj.x, obj.y, gvx, gvy, gvw, gvh)
-            dx = gx - hit_x
-            dy = gy - hit_y
-            threshold_sq = (player.hit_radius + _emoji_radius_game(obj, gvw)) ** 2
-            if dx * dx + dy * dy < threshold_sq:
-                obj.alive = False
-                hit_occurred = True
-                break
-
-        if hit_occurred:
-            self._pool.falling = [p for p in self._pool.falling if p.alive]
-            self._pool.projectiles = [p for p in self._pool.projectiles if p.alive]
-        return hit_occurred
+        index = self._pool.hit_index(float(hit_x), float(hit_y), float(player.hit_radius))
+        if index < 0:
+            return False
+        self._pool.remove(index)
+        return True
 
     def _do_fire(self, player) -> None:
         """根据抽奖结果生成发射弹。"""
@@ -1,8 +1,8 @@
 """
 Emoji OpenGL 渲染器
 
-使用 PIL 将 emoji 字符渲染为 RGBA 纹理，再通过简单的带旋转/缩放的四边形着色器
-在屏幕像素坐标系中绘制每个 emoji 对象。
+使用 PIL 将 emoji 字符渲染为 RGBA 图块并烘焙进同一张图集纹理，再以实例化
+四边形（每实例 UV / 位置 / 尺寸 / 旋转 / 透明度）在屏幕像素坐标系中一次绘制整层。
 
 字体查找顺序（跨平台）：
   Linux  : NotoColorEmoji → NotoEmoji → unifont（逐路径尝试）
@@ -10,7 +10,8 @@ Emoji OpenGL 渲染器
   macOS  : AppleColorEmoji.ttc
   最终回退：使用纯色块 + 字母代替
 
-每个 emoji 字符单独创建一张 EMOJI_TEX_SIZE × EMOJI_TEX_SIZE 的 RGBA 纹理。
+每个 emoji 占图集中一个 EMOJI_TEX_SIZE × EMOJI_TEX_SIZE 格子；运行时遇到新 emoji
+时按格子局部上传，图集写满后行数翻倍并拷贝旧内容。
 """
 import math
 import os
@@ -23,6 +24,17 @@ from PIL import Image, ImageDraw, ImageFont
 
 EMOJI_TEX_SIZE = 96       # emoji 纹理边长（像素）
 RENDER_PX_SIZE = 48.0     # 屏幕上的默认显示尺寸（scale=1.0 时）
+ATLAS_COLUMNS = 8         # 图集每行格子数
+ATLAS_INITIAL_ROWS = 1    # 图集初始行数（写满后翻倍）
+
+# 每实例顶点属性：'2f 1f 1f 1f 4f /i'
+EMOJI_INSTANCE_DTYPE = np.dtype([
+    ("pos", "f4", 2),       # 屏幕中心像素坐标
+    ("size", "f4"),         # 边长像素
+    ("rot", "f4"),          # 旋转弧度
+    ("alpha", "f4"),
+    ("uv_rect", "f4", 4),   # 图集 UV (u0, v0, u1, v1)
+])
 
 _FONT_CANDIDATES: list[str] = [
     # Linux
@@ -143,37 +155,38 @@ def _make_emoji_image(emoji_char: str) -> "Image":
 class EmojiGLRenderer:
     """
     OpenGL 渲染器，负责：
-      1. 将 4 个 emoji 字符烘焙成 GL 纹理
-      2. 每帧将 FallingEmoji / EmojiProjectile 列表绘制到屏幕
+      1. 将 emoji 字符烘焙进一张可增长的图集纹理
+      2. 每帧把整层 emoji 打包为实例数组，一次 instanced draw 绘制
     """
 
     _VERT = """
 #version 330
 uniform vec2 u_screen_size;
-uniform vec2 u_pos;        // 屏幕中心像素坐标
-uniform float u_rot;       // 旋转弧度
-uniform vec2 u_size;       // 宽高像素
-uniform float u_alpha;
 
 in vec2 in_vert;   // 单位正方形 [-0.5, 0.5]
 in vec2 in_uv;
+in vec2 in_pos;    // 每实例：屏幕中心像素坐标
+in float in_size;  // 每实例：边长像素
+in float in_rot;   // 每实例：旋转弧度
+in float in_alpha;
+in vec4 in_uv_rect;
 
 out vec2 v_uv;
 out float v_alpha;
 
 void main() {
-    vec2 scaled = in_vert * u_size;
-    float s = sin(u_rot);
-    float c = cos(u_rot);
+    vec2 scaled = in_vert * in_size;
+    float s = sin(in_rot);
+    float c = cos(in_rot);
     vec2 rot = vec2(scaled.x * c - scaled.y * s,
                     scaled.x * s + scaled.y * c);
-    vec2 pos = rot + u_pos;
+    vec2 pos = rot + in_pos;
     // 像素 → NDC，Y 轴翻转（屏幕坐标原点在左上）
     vec2 ndc = (pos / u_screen_size) * 2.0 - 1.0;
     ndc.y = -ndc.y;
     gl_Position = vec4(ndc, 0.0, 1.0);
-    v_uv    = in_uv;
-    v_alpha = u_alpha;
+    v_uv    = mix(in_uv_rect.xy, in_uv_rect.zw, in_uv);
+    v_alpha = in_alpha;
 }
 """
 
@@ -200,7 +213,15 @@ void main() {
     ) -> None:
         self.ctx = ctx
         self.screen_w, self.screen_h = screen_size
-        self._textures: dict[str, moderngl.Texture] = {}
+        self._slots: dict[str, int] = {}
+        self._failed: set[str] = set()
+        self._atlas_rows = ATLAS_INITIAL_ROWS
+        self._atlas: moderngl.Texture = self._create_atlas(self._atlas_rows)
+        self._uv_table = np.zeros((0, 4), dtype="f4")
+        self._uv_baked = np.zeros(0, dtype=bool)
+        self._uv_table_key: tuple[str, ...] = ()
+        self._one = np.zeros(1, dtype=EMOJI_INSTANCE_DTYPE)
+        self._instances = np.zeros(256, dtype=EMOJI_INSTANCE_DTYPE)
 
         self._init_shader()
         self._init_geometry()
@@ -227,9 +248,14 @@ void main() {
             -0.5,  0.5,  0.0, 0.0,
         ], dtype="f4")
         self.vbo = self.ctx.buffer(verts.tobytes())
+        self.instance_buffer = self.ctx.buffer(reserve=self._instances.nbytes)
         self.vao = self.ctx.vertex_array(
             self.prog,
-            [(self.vbo, "2f 2f", "in_vert", "in_uv")],
+            [
+                (self.vbo, "2f 2f", "in_vert", "in_uv"),
+                (self.instance_buffer, "2f 1f 1f 1f 4f /i",
+                 "in_pos", "in_size", "in_rot", "in_alpha", "in_uv_rect"),
+            ],
         )
 
     # emoji → 文件名映射（assets/images/emoji/ 目录下的 PNG 文件名，不含 .png）
@@ -245,54 +271,148 @@ void main() {
         os.path.dirname(__file__), "..", "..", "..", "assets", "images", "emoji"
     )
 
-    def _load_png_to_texture(self, png_path: str) -> Optional[moderngl.Texture]:
-        """从 PNG 文件创建 GL 纹理，失败返回 None。"""
+    def _load_png_bytes(self, png_path: str) -> Optional[bytes]:
+        """读取 PNG 为翻转后的 RGBA 字节，失败返回 None。"""
         try:
             img = Image.open(png_path).convert("RGBA")
             img = img.resize((EMOJI_TEX_SIZE, EMOJI_TEX_SIZE), Image.LANCZOS)
             img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-            data = img.tobytes("raw", "RGBA")
-            tex = self.ctx.texture((EMOJI_TEX_SIZE, EMOJI_TEX_SIZE), 4, data)
-            tex.filter = (moderngl.LINEAR, moderngl.LINEAR)
-            return tex
+            return img.tobytes("raw", "RGBA")
         except Exception as e:
             print(f"    PNG 加载失败 {png_path}: {e}")
             return None
 
-    def _bake_textures(self, emoji_chars: list[str]) -> None:
-        _safe_print("[emoji_danmaku] 正在加载 emoji 纹理...")
-        asset_dir = os.path.normpath(self._ASSET_DIR)
+    def _glyph_bytes(self, ch: str) -> bytes:
+        # ── 优先：读取预生成的 PNG 文件 ─────────────────────────────────
+        fn = self._FILENAMES.get(ch)
+        if fn:
+            png_path = os.path.join(os.path.normpath(self._ASSET_DIR), f"{fn}.png")
+            if os.path.exists(png_path):
+                data = self._load_png_bytes(png_path)
+                if data:
+                    _safe_print(f"  {ch}  ← {fn}.png ✓")
+                    return data
+
+        # ── 回退：PIL 即时渲染 ────────────────────────────────────────
+        img = _make_emoji_image(ch)
+        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+        _safe_print(f"  {ch}  ← PIL 渲染（未找到预生成 PNG）✓")
+        return img.tobytes("raw", "RGBA")
 
+    def _bake_textures(self, emoji_chars: list[str]) -> None:
+        _safe_print("[emoji_danmaku] 正在烘焙 emoji 图集...")
         for ch in emoji_chars:
-            try:
-                tex: Optional[moderngl.Texture] = None
-
-                # ── 优先：读取预生成的 PNG 文件 ─────────────────────────────
-                fn = self._FILENAMES.get(ch)
-                if fn:
-                    png_path = os.path.join(asset_dir, f"{fn}.png")
-                    if os.path.exists(png_path):
-                        tex = self._load_png_to_texture(png_path)
-                        if tex:
-                            _safe_print(f"  {ch}  ← {fn}.png ✓")
-
-                # ── 回退：PIL 即时渲染 ────────────────────────────────────
-                if tex is None:
-                    img = _make_emoji_image(ch)
-                    img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                    data = img.tobytes("raw", "RGBA")
-                    tex = self.ctx.texture((EMOJI_TEX_SIZE, EMOJI_TEX_SIZE), 4, data)
-                    tex.filter = (moderngl.LINEAR, moderngl.LINEAR)
-                    _safe_print(f"  {ch}  ← PIL 渲染（未找到预生成 PNG）✓")
-
-                self._textures[ch] = tex
-            except Exception as e:
-                _safe_print(f"  {ch}  加载失败: {e}")
-
-        _safe_print("[emoji_danmaku] emoji 纹理加载完成。")
+            self.add_glyph(ch)
+        _safe_print("[emoji_danmaku] emoji 图集烘焙完成。")
+
+    # ── 图集 ─────────────────────────────────────────────────────────────────
+
+    def _create_atlas(self, rows: int) -> moderngl.Texture:
+        tex = self.ctx.texture(
+            (ATLAS_COLUMNS * EMOJI_TEX_SIZE, rows * EMOJI_TEX_SIZE), 4
+        )
+        tex.filter = (moderngl.LINEAR, moderngl.LINEAR)
+        return tex
+
+    def _grow_atlas(self) -> None:
+        """行数翻倍：新建图集并把旧图集整块拷入底部行。"""
+        old = self._atlas
+        rows = self._atlas_rows * 2
+        atlas = self._create_atlas(rows)
+        atlas.write(old.read(), viewport=(0, 0, old.width, old.height))
+        old.release()
+        self._atlas = atlas
+        self._atlas_rows = rows
+        self._uv_table_key = ()
+
+    def add_glyph(self, emoji: str) -> bool:
+        """把 emoji 烘焙进图集的下一个空格子（局部上传），已存在则直接返回。"""
+        if emoji in self._slots:
+            return True
+        if emoji in self._failed:
+            return False
+        try:
+            data = self._glyph_bytes(emoji)
+        except Exception as e:
+            _safe_print(f"  {emoji}  加载失败: {e}")
+            self._failed.add(emoji)
+            return False
+        slot = len(self._slots)
+        if slot >= ATLAS_COLUMNS * self._atlas_rows:
+            self._grow_atlas()
+        col, row = slot % ATLAS_COLUMNS, slot // ATLAS_COLUMNS
+        self._atlas.write(
+            data,
+            viewport=(col * EMOJI_TEX_SIZE, row * EMOJI_TEX_SIZE, EMOJI_TEX_SIZE, EMOJI_TEX_SIZE),
+        )
+        self._slots[emoji] = slot
+        self._uv_table_key = ()
+        return True
+
+    def uv_rect(self, emoji: str) -> tuple[float, float, float, float] | None:
+        slot = self._slots.get(emoji)
+        if slot is None:
+            return None
+        col, row = slot % ATLAS_COLUMNS, slot // ATLAS_COLUMNS
+        return (
+            col / ATLAS_COLUMNS,
+            row / self._atlas_rows,
+            (col + 1) / ATLAS_COLUMNS,
+            (row + 1) / self._atlas_rows,
+        )
+
+    def _uv_lookup(self, emojis: list[str]) -> np.ndarray:
+        """按 glyph 序号排列的 UV 表；未知 emoji 先烘焙，失败的行为空矩形。
+
+        ``_uv_baked`` 同步记录每个 glyph 是否有图集格子。
+        """
+        key = tuple(emojis)
+        if key != self._uv_table_key:
+            for ch in key:
+                self.add_glyph(ch)
+            table = np.zeros((len(key), 4), dtype="f4")
+            baked = np.zeros(len(key), dtype=bool)
+            for index, ch in enumerate(key):
+                rect = self.uv_rect(ch)
+                if rect is not None:
+                    table[index] = rect
+                    baked[index] = True
+            self._uv_table = table
+            self._uv_baked = baked
+            self._uv_table_key = tuple(emojis)
+        return self._uv_table
 
     # ── 渲染 ─────────────────────────────────────────────────────────────────
 
+    def _draw(self, instances: np.ndarray, clip_rect=None) -> None:
+        """上传实例数组并发出一次 instanced draw。"""
+        count = len(instances)
+        if count == 0:
+            return
+        if self.instance_buffer.size < instances.nbytes:
+            self.instance_buffer.orphan(instances.nbytes)
+        self.instance_buffer.write(instances.tobytes())
+
+        # scissor 裁剪到游戏区域（OpenGL scissor 使用左下原点）
+        if clip_rect is not None:
+            cx, cy, cw, ch = clip_rect
+            gl_scissor_y = self.screen_h - (cy + ch)
+            self.ctx.scissor = (cx, gl_scissor_y, cw, ch)
+
+        self._atlas.use(0)
+        self.vao.render(moderngl.TRIANGLES, instances=count)
+
+        # 恢复 scissor
+        if clip_rect is not None:
+            self.ctx.scissor = None
+
+    def _instance_rows(self, count: int) -> np.ndarray:
+        if len(self._instances) < count:
+            self._instances = np.zeros(
+                max(count, len(self._instances) * 2), dtype=EMOJI_INSTANCE_DTYPE
+            )
+        return self._instances[:count]
+
     def render_object(
         self,
         emoji: str,
@@ -303,18 +423,15 @@ void main() {
         alpha: float = 1.0,
     ) -> None:
         """渲染单个 emoji 对象（屏幕像素坐标，中心为锚点）。"""
-        tex = self._textures.get(emoji)
-        if tex is None:
+        if not self.add_glyph(emoji):
             return
-
-        px = RENDER_PX_SIZE * scale
-        self.prog["u_pos"].value = (x, y)
-        self.prog["u_rot"].value = math.radians(rotation_deg)
-        self.prog["u_size"].value = (px, px)
-        self.prog["u_alpha"].value = max(0.0, min(1.0, alpha))
-
-        tex.use(0)
-        self.vao.render(moderngl.TRIANGLES)
+        one = self._one
+        one["pos"] = (x, y)
+        one["size"] = RENDER_PX_SIZE * scale
+        one["rot"] = math.radians(rotation_deg)
+        one["alpha"] = max(0.0, min(1.0, alpha))
+        one["uv_rect"] = self.uv_rect(emoji)
+        self._draw(one)
 
     def render_list(
         self,
@@ -322,41 +439,70 @@ void main() {
         clip_rect: tuple[int, int, int, int] | None = None,
     ) -> None:
         """
-        批量渲染 FallingEmoji / EmojiProjectile 列表。
+        批量渲染 FallingEmoji / EmojiProjectile 列表（一次 instanced draw）。
         对象需有属性: emoji, x, y, scale, rotation, alpha, alive
 
         clip_rect: (x, y, w, h) 屏幕像素裁剪区域（top-left 原点），
                    传入后用 GL scissor 限制渲染范围，防止溢出到 UI 区域。
         """
-        if not objects:
+        visible = [obj for obj in objects if obj.alive and self.add_glyph(obj.emoji)]
+        if not visible:
             return
+        rows = self._instance_rows(len(visible))
+        rows["pos"] = [(obj.x, obj.y) for obj in visible]
+        rows["size"] = [RENDER_PX_SIZE * obj.scale for obj in visible]
+        rows["rot"] = np.radians([obj.rotation for obj in visible])
+        rows["alpha"] = np.clip([obj.alpha for obj in visible], 0.0, 1.0)
+        rows["uv_rect"] = [self.uv_rect(obj.emoji) for obj in visible]
 
         # 启用透明度混合
         self.ctx.enable(moderngl.BLEND)
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self._draw(rows, clip_rect)
 
-        # scissor 裁剪到游戏区域（OpenGL scissor 使用左下原点）
-        if clip_rect is not None:
-            cx, cy, cw, ch = clip_rect
-            gl_scissor_y = self.screen_h - (cy + ch)
-            self.ctx.scissor = (cx, gl_scissor_y, cw, ch)
+    def render_pool(
+        self,
+        pool,
+        clip_rect: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        """直接从 EmojiObjectPool 的 SoA 列打包实例，整层一次 instanced draw。
 
-        for obj in objects:
-            if not obj.alive:
-                continue
-            self.render_object(
-                obj.emoji, obj.x, obj.y,
-                scale=obj.scale,
-                rotation_deg=obj.rotation,
-                alpha=obj.alpha,
-            )
+        实例按 kind 稳定排序：下落 emoji 在下、弹幕 emoji 在上，
+        与原先 falling + projectiles 两段列表的绘制层次一致。
+        """
+        n = pool.count
+        if n == 0:
+            return
+        kinds = pool.kind[:n]
+        order = (
+            np.argsort(kinds, kind="stable")
+            if (kinds[1:] < kinds[:-1]).any()
+            else slice(0, n)
+        )
+        uv_table = self._uv_lookup(pool.emojis)
+        baked = self._uv_baked[pool.glyph[order]]
+        if not baked.all():
+            # 烘焙失败的 glyph 没有图集格子，与 render_list 一样跳过
+            order = np.arange(n)[order][baked]
+            n = len(order)
+            if n == 0:
+                return
+        rows = self._instance_rows(n)
+        sx, sy = pool.game_to_screen(pool.x[order], pool.y[order])
+        rows["pos"][:, 0] = sx
+        rows["pos"][:, 1] = sy
+        rows["size"] = RENDER_PX_SIZE * pool.scale[order]
+        rows["rot"] = np.radians(pool.rotation[order])
+        rows["alpha"] = np.clip(pool.alpha[order], 0.0, 1.0)
+        rows["uv_rect"] = uv_table[pool.glyph[order]]
 
-        # 恢复 scissor
-        if clip_rect is not None:
-            self.ctx.scissor = None
+        self.ctx.enable(moderngl.BLEND)
+        self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self._draw(rows, clip_rect)
 
     def cleanup(self) -> None:
-        for tex in self._textures.values():
-            tex.release()
-        self._textures.clear()
+        self._atlas.release()
+        self._slots.clear()
+        self._uv_table_key = ()
+        self.instance_buffer.release()
         self.vbo.release()
@@ -1,17 +1,30 @@
 """
 飘落 emoji 池 + 发射弹对象池
 
-坐标系：屏幕像素空间，原点左上角，Y 向下为正。
-所有对象均以 float(px) 存储。
+坐标系：对象以 numpy SoA 列存储，位置/速度直接使用游戏坐标
+（x ∈ [-1, 1] 左负右正，y 底为 0、向上为正，应用 GAME_Y_SCALE 映射到视口）。
+生成接口仍接受屏幕像素（原点左上角，Y 向下为正），入池时一次性换算。
 """
 import math
 import random
 from dataclasses import dataclass
 
+import numpy as np
+from numba import njit
+
 EMOJI_LIST: list[str] = ["😂", "😡", "💩", "😅"]
 BASE_RENDER_PX_SIZE: float = 48.0
 DEFAULT_HITBOX_FACTOR: float = 0.42
 PROJECTILE_LIFETIME: float = 7.0
+GAME_Y_SCALE: float = 384.0 / 448.0
+
+KIND_FALLING = 0
+KIND_PROJECTILE = 1
+
+# update 内核写回的行状态
+_ROW_ALIVE = 0
+_ROW_DEAD = 1
+_ROW_EXITED = 2
 
 # 每个 emoji 在备用渲染时使用的色调（PIL 或 OpenGL tint）
 EMOJI_FALLBACK_COLORS: dict[str, tuple[int, int, int]] = {
@@ -60,15 +73,203 @@ class EmojiProjectile:
 # ── 池 ───────────────────────────────────────────────────────────────────────
 
 class EmojiObjectPool:
-    """管理所有飘落 emoji 和发射弹，坐标均为屏幕像素。"""
+    """管理所有飘落 emoji 和发射弹。
+
+    存活对象紧凑排列在各列的 ``[:count]`` 区间内，按生成顺序排列；
+    ``falling`` / ``projectiles`` 仅提供屏幕像素坐标的只读快照。
+    """
 
-    def __init__(self, game_viewport: tuple[int, int, int, int]) -> None:
+    _FLOAT_COLUMNS = (
+        "x", "y", "vx", "vy", "scale", "rotation", "rot_speed",
+        "alpha", "radius", "lifetime", "max_lifetime",
+    )
+
+    def __init__(
+        self,
+        game_viewport: tuple[int, int, int, int],
+        capacity: int = 256,
+    ) -> None:
         """
         game_viewport: (x, y, w, h) 游戏区域在屏幕上的像素矩形
         """
         self.gvx, self.gvy, self.gvw, self.gvh = game_viewport
-        self.falling: list[FallingEmoji] = []
-        self.projectiles: list[EmojiProjectile] = []
+        self.emojis: list[str] = list(EMOJI_LIST)
+        self._glyph_index: dict[str, int] = {e: i for i, e in enumerate(self.emojis)}
+        self.count = 0
+        self.capacity = 0
+        self.kind = np.zeros(0, dtype=np.int8)
+        self.glyph = np.zeros(0, dtype=np.int16)
+        self.hitbox_factor = np.zeros(0, dtype=np.float64)
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        self._state = np.zeros(0, dtype=np.int8)
+        self._reserve(max(1, int(capacity)))
+
+        # 出界判定（游戏坐标）：飘落对象越过底部 80px，发射弹离开视口外扩 200px
+        _, self.exit_y = self.screen_to_game(0.0, self.gvy + self.gvh + 80.0)
+        margin = 200.0
+        self.bounds_left, self.bounds_top = self.screen_to_game(
+            self.gvx - margin, self.gvy - margin
+        )
+        self.bounds_right, self.bounds_bottom = self.screen_to_game(
+            self.gvx + self.gvw + margin, self.gvy + self.gvh + margin
+        )
+
+    # ── 坐标换算 ─────────────────────────────────────────────────────────────
+
+    def screen_to_game(self, sx: float, sy: float) -> tuple[float, float]:
+        gx = (sx - self.gvx) / self.gvw * 2.0 - 1.0
+        gy = (1.0 - (sy - self.gvy) / self.gvh * 2.0) / GAME_Y_SCALE
+        return gx, gy
+
+    def game_to_screen(self, gx, gy):
+        """游戏坐标 → 屏幕像素（标量或数组均可）。"""
+        sx = self.gvx + (gx + 1.0) / 2.0 * self.gvw
+        sy = self.gvy + (1.0 - gy * GAME_Y_SCALE) / 2.0 * self.gvh
+        return sx, sy
+
+    def _velocity_to_game(self, svx, svy):
+        return svx * 2.0 / self.gvw, -svy * 2.0 / (self.gvh * GAME_Y_SCALE)
+
+    def _velocity_to_screen(self, vx, vy):
+        return vx * self.gvw / 2.0, -vy * self.gvh * GAME_Y_SCALE / 2.0
+
+    # ── 存储 ─────────────────────────────────────────────────────────────────
+
+    def _columns(self) -> tuple[str, ...]:
+        return ("kind", "glyph", "hitbox_factor", "_state") + self._FLOAT_COLUMNS
+
+    def _reserve(self, needed: int) -> None:
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, self.capacity * 2)
+        for name in self._columns():
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[: self.count] = old[: self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def _glyph_of(self, emoji: str) -> int:
+        index = self._glyph_index.get(emoji)
+        if index is None:
+            index = self._glyph_index[emoji] = len(self.emojis)
+            self.emojis.append(emoji)
+        return index
+
+    def _append(
+        self,
+        kind: int,
+        emoji: str,
+        sx,
+        sy,
+        svx,
+        svy,
+        scale,
+        rotation,
+        rot_speed,
+        *,
+        hitbox_factor: float = DEFAULT_HITBOX_FACTOR,
+        lifetime: float = 0.0,
+        max_lifetime: float = math.inf,
+        alpha: float = 1.0,
+    ) -> None:
+        """按屏幕像素参数追加一批行（数组参数逐行广播）。"""
+        n = int(np.broadcast(sx, sy, svx, svy, scale, rotation, rot_speed).size)
+        start = self.count
+        self._reserve(start + n)
+        rows = slice(start, start + n)
+        gx, gy = self.screen_to_game(np.asarray(sx, dtype=np.float64), np.asarray(sy, dtype=np.float64))
+        vx, vy = self._velocity_to_game(np.asarray(svx, dtype=np.float64), np.asarray(svy, dtype=np.float64))
+        self.kind[rows] = kind
+        self.glyph[rows] = self._glyph_of(emoji)
+        self.x[rows] = gx
+        self.y[rows] = gy
+        self.vx[rows] = vx
+        self.vy[rows] = vy
+        self.scale[rows] = scale
+        self.rotation[rows] = rotation
+        self.rot_speed[rows] = rot_speed
+        self.alpha[rows] = alpha
+        self.hitbox_factor[rows] = hitbox_factor
+        self.radius[rows] = (
+            BASE_RENDER_PX_SIZE * self.scale[rows] * hitbox_factor / (self.gvw / 2.0)
+        )
+        self.lifetime[rows] = lifetime
+        self.max_lifetime[rows] = max_lifetime
+        self.count = start + n
+
+    def add(self, obj: "FallingEmoji | EmojiProjectile") -> None:
+        """以屏幕像素对象追加一行（测试 / 兼容入口）。"""
+        if not obj.alive:
+            return
+        if isinstance(obj, EmojiProjectile):
+            self._append(
+                KIND_PROJECTILE, obj.emoji, obj.x, obj.y, obj.vx, obj.vy,
+                obj.scale, obj.rotation, obj.rot_speed,
+                hitbox_factor=obj.hitbox_factor, lifetime=obj.lifetime,
+                max_lifetime=obj.max_lifetime, alpha=obj.alpha,
+            )
+        else:
+            self._append(
+                KIND_FALLING, obj.emoji, obj.x, obj.y, 0.0, obj.vy,
+                obj.scale, obj.rotation, obj.rot_speed,
+                hitbox_factor=obj.hitbox_factor, alpha=obj.alpha,
+            )
+
+    def remove(self, index: int) -> None:
+        """删除一行并保持其余对象的生成顺序。"""
+        n = self.count
+        if not 0 <= index < n:
+            raise IndexError(index)
+        for name in self._columns():
+            column = getattr(self, name)
+            column[index : n - 1] = column[index + 1 : n]
+        self.count = n - 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ── 快照（屏幕像素） ─────────────────────────────────────────────────────
+
+    def _snapshot(self, kind: int) -> list:
+        rows = np.flatnonzero(self.kind[: self.count] == kind)
+        sx, sy = self.game_to_screen(self.x[rows], self.y[rows])
+        svx, svy = self._velocity_to_screen(self.vx[rows], self.vy[rows])
+        objects = []
+        for i, row in enumerate(rows):
+            common = dict(
+                emoji=self.emojis[self.glyph[row]],
+                x=float(sx[i]),
+                y=float(sy[i]),
+                vy=float(svy[i]),
+                scale=float(self.scale[row]),
+                rotation=float(self.rotation[row]),
+                rot_speed=float(self.rot_speed[row]),
+                alpha=float(self.alpha[row]),
+                hitbox_factor=float(self.hitbox_factor[row]),
+            )
+            if kind == KIND_FALLING:
+                objects.append(FallingEmoji(**common))
+            else:
+                objects.append(EmojiProjectile(
+                    vx=float(svx[i]),
+                    lifetime=float(self.lifetime[row]),
+                    max_lifetime=float(self.max_lifetime[row]),
+                    **common,
+                ))
+        return objects
+
+    @property
+    def falling(self) -> list[FallingEmoji]:
+        return self._snapshot(KIND_FALLING)
+
+    @property
+    def projectiles(self) -> list[EmojiProjectile]:
+        return self._snapshot(KIND_PROJECTILE)
 
     # ── 生成接口 ─────────────────────────────────────────────────────────────
 
@@ -79,54 +280,48 @@ class EmojiObjectPool:
         vy = random.uniform(55.0, 120.0)
         scale = random.uniform(0.85, 1.15)
         rot_speed = random.uniform(-50.0, 50.0)
-        self.falling.append(FallingEmoji(
-            emoji=emoji, x=x, y=y, vy=vy, scale=scale,
-            rotation=random.uniform(0, 360), rot_speed=rot_speed,
-        ))
+        self._append(
+            KIND_FALLING, emoji, x, y, 0.0, vy, scale,
+            random.uniform(0, 360), rot_speed,
+        )
 
     def spawn_bloom(self, emoji: str, ox: float, oy: float, count: int = 16) -> None:
         """开花：从 (ox, oy) 向四周均匀发射。"""
-        for i in range(count):
-            angle = (i / count) * math.tau
-            speed = random.uniform(50.0, 110.0)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.projectiles.append(EmojiProjectile(
-                emoji=emoji, x=ox, y=oy, vx=vx, vy=vy,
-                rot_speed=random.uniform(-150, 150),
-            ))
+        angles = np.arange(count) / count * math.tau
+        speeds = np.array([random.uniform(50.0, 110.0) for _ in range(count)])
+        rot_speeds = np.array([random.uniform(-150, 150) for _ in range(count)])
+        self._append(
+            KIND_PROJECTILE, emoji, ox, oy,
+            np.cos(angles) * speeds, np.sin(angles) * speeds,
+            1.4, 0.0, rot_speeds, max_lifetime=PROJECTILE_LIFETIME,
+        )
 
     def spawn_aimed(self, emoji: str, ox: float, oy: float,
                     player_sx: float, player_sy: float) -> None:
         """自机狙：3 颗朝玩家方向发射（±8° 扩散）。"""
-        dx = player_sx - ox
-        dy = player_sy - oy
-        base = math.atan2(dy, dx)
-        for delta in (-0.14, 0.0, 0.14):
-            a = base + delta
-            speed = random.uniform(180.0, 240.0)
-            vx = math.cos(a) * speed
-            vy = math.sin(a) * speed
-            self.projectiles.append(EmojiProjectile(
-                emoji=emoji, x=ox, y=oy, vx=vx, vy=vy, scale=1.3,
-                rot_speed=random.uniform(-120, 120),
-            ))
+        base = math.atan2(player_sy - oy, player_sx - ox)
+        angles = base + np.array((-0.14, 0.0, 0.14))
+        speeds = np.array([random.uniform(180.0, 240.0) for _ in range(3)])
+        rot_speeds = np.array([random.uniform(-120, 120) for _ in range(3)])
+        self._append(
+            KIND_PROJECTILE, emoji, ox, oy,
+            np.cos(angles) * speeds, np.sin(angles) * speeds,
+            1.3, 0.0, rot_speeds, max_lifetime=PROJECTILE_LIFETIME,
+        )
 
     def spawn_scatter(self, emoji: str, ox: float, oy: float) -> None:
         """散射弹：7 颗扇形向下散射。"""
         count = 7
         center = math.pi / 2   # 屏幕空间 Y 向下，π/2 = 正下方
         spread = math.pi * 0.55
-        for i in range(count):
-            t = i / (count - 1) if count > 1 else 0.5
-            a = center - spread / 2 + t * spread
-            speed = random.uniform(135.0, 205.0)
-            vx = math.cos(a) * speed
-            vy = math.sin(a) * speed
-            self.projectiles.append(EmojiProjectile(
-                emoji=emoji, x=ox, y=oy, vx=vx, vy=vy,
-                rot_speed=random.uniform(-100, 100),
-            ))
+        angles = center - spread / 2 + np.linspace(0.0, 1.0, count) * spread
+        speeds = np.array([random.uniform(135.0, 205.0) for _ in range(count)])
+        rot_speeds = np.array([random.uniform(-100, 100) for _ in range(count)])
+        self._append(
+            KIND_PROJECTILE, emoji, ox, oy,
+            np.cos(angles) * speeds, np.sin(angles) * speeds,
+            1.4, 0.0, rot_speeds, max_lifetime=PROJECTILE_LIFETIME,
+        )
 
     # ── 更新 ─────────────────────────────────────────────────────────────────
 
@@ -135,43 +330,62 @@ class EmojiObjectPool:
         每帧更新，返回本帧"离开底部"的 emoji 列表（用于增加热度）。
         注意：热度实际上由 UDP 事件直接增加，此处返回值备用。
         """
-        exited: list[str] = []
-        bottom = self.gvy + self.gvh + 80.0
+        n = self.count
+        if n == 0:
+            return []
+        state = self._state[:n]
+        _advance_emoji(
+            self.kind[:n], self.x[:n], self.y[:n], self.vx[:n], self.vy[:n],
+            self.rotation[:n], self.rot_speed[:n], self.lifetime[:n],
+            self.max_lifetime[:n], self.alpha[:n], state, float(dt),
+            self.exit_y, self.bounds_left, self.bounds_right,
+            self.bounds_bottom, self.bounds_top,
+        )
+        exited = [self.emojis[g] for g in self.glyph[:n][state == _ROW_EXITED]]
+        keep = np.flatnonzero(state == _ROW_ALIVE)
+        if keep.size != n:
+            for name in self._columns():
+                column = getattr(self, name)
+                column[: keep.size] = column[keep]
+            self.count = int(keep.size)
+        return exited
 
-        for obj in self.falling:
-            if not obj.alive:
-                continue
-            obj.y += obj.vy * dt
-            obj.rotation += obj.rot_speed * dt
-            if obj.y > bottom:
-                obj.alive = False
-                exited.append(obj.emoji)
+    # ── 碰撞 ─────────────────────────────────────────────────────────────────
 
-        self.falling = [o for o in self.falling if o.alive]
+    def hit_index(self, hx: float, hy: float, hit_radius: float) -> int:
+        """返回与判定圆相交的对象行号（飘落对象优先），无命中返回 -1。"""
+        n = self.count
+        if n == 0:
+            return -1
+        dx = self.x[:n] - hx
+        dy = self.y[:n] - hy
+        reach = self.radius[:n] + hit_radius
+        hits = np.flatnonzero(dx * dx + dy * dy < reach * reach)
+        if hits.size == 0:
+            return -1
+        falling = hits[self.kind[hits] == KIND_FALLING]
+        return int(falling[0] if falling.size else hits[0])
 
-        # 发射弹：运动 + 淡出 + 出界销毁
-        margin = 200.0
-        left = self.gvx - margin
-        right = self.gvx + self.gvw + margin
-        top_b = self.gvy - margin
-        bot_b = self.gvy + self.gvh + margin
-
-        for p in self.projectiles:
-            if not p.alive:
-                continue
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.rotation += p.rot_speed * dt
-            p.lifetime += dt
-
-            # 最后 30% 时间淡出
-            t = p.lifetime / p.max_lifetime
-            p.alpha = max(0.0, 1.0 - max(0.0, (t - 0.70) / 0.30))
-
-            if p.lifetime >= p.max_lifetime:
-                p.alive = False
-            elif not (left < p.x < right and top_b < p.y < bot_b):
-                p.alive = False
-
-        self.projectiles = [p for p in self.projectiles if p.alive]
-        return exited
+
+@njit(cache=True)
+def _advance_emoji(kind, x, y, vx, vy, rotation, rot_speed, lifetime,
+                   max_lifetime, alpha, state, dt, exit_y,
+                   left, right, bottom, top):
+    """运动 + 旋转 + 发射弹淡出，并写回每行状态（存活 / 销毁 / 离开底部）。"""
+    for i in range(x.shape[0]):
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        rotation[i] += rot_speed[i] * dt
+        if kind[i] == KIND_FALLING:
+            state[i] = _ROW_EXITED if y[i] < exit_y else _ROW_ALIVE
+            continue
+        lifetime[i] += dt
+        # 最后 30% 时间淡出
+        t = lifetime[i] / max_lifetime[i]
+        alpha[i] = max(0.0, 1.0 - max(0.0, (t - 0.70) / 0.30))
+        if lifetime[i] >= max_lifetime[i]:
+            state[i] = _ROW_DEAD
+        elif x[i] <= left or x[i] >= right or y[i] <= bottom or y[i] >= top:
+            state[i] = _ROW_DEAD
+        else:
+            state[i] = _ROW_ALIVE
@@ -3,15 +3,40 @@ UDP 后台监听线程（E7.1 重构版）
 
 传输层委托给 ``UDPAdapter``（typed EventAdapter），事件经 ``EventBus``
 规范化后由主线程 poll() 消费；emoji 过滤语义保持不变。
+不含任何 emoji 原始字节的数据报在解码前即被丢弃；同一帧内相同 emoji
+合并为一条带 ``count`` 的事件。
 """
 from __future__ import annotations
 
+import itertools
+import json
+
 from src.game.adapters import UDPAdapter
 from src.game.events import EventBus
 
 EMOJI_SET: frozenset[str] = frozenset(["😂", "😡", "💩", "😅"])
 
 
+def _escape_variants(emoji: str) -> set[bytes]:
+    """``\\uXXXX`` forms of *emoji* in every upper/lower case mix of the hex digits."""
+    escaped = json.dumps(emoji)[1:-1]
+    choices = [
+        (char,) if char in "\\u" or char.isdigit() else (char.lower(), char.upper())
+        for char in escaped
+    ]
+    return {"".join(chars).encode("ascii") for chars in itertools.product(*choices)}
+
+
+# Raw-byte prefilter: UTF-8 form plus every JSON ``\uXXXX`` escape spelling,
+# since JSON hex digits are case-insensitive.
+EMOJI_NEEDLES: tuple[bytes, ...] = tuple(
+    sorted(
+        {emoji.encode("utf-8") for emoji in EMOJI_SET}
+        | {needle for emoji in EMOJI_SET for needle in _escape_variants(emoji)}
+    )
+)
+
+
 class UDPReceiver:
     """UDP 监听器（daemon 线程，主线程只需 poll() 取事件）。
 
@@ -22,15 +47,18 @@ class UDPReceiver:
     def __init__(self, host: str = "127.0.0.1", port: int = 9999) -> None:
         self.host = host
         self.port = port
-        self._adapter = UDPAdapter(host=host, port=port)
-        self._bus = EventBus()
-        self._queue: list[dict] = []
+        self._adapter = UDPAdapter(
+            host=host, port=port, require_any=EMOJI_NEEDLES, coalesce=True
+        )
+        self._bus = EventBus(batch_dispatch=True)
+        self._queue: dict[str, dict] = {}
 
     # ── 生命周期 ──────────────────────────────────────────────────────────────
 
     def start(self) -> None:
         self._bus.subscribe(
-            "adapter.udp", lambda event: self._dispatch(event.payload)
+            "adapter.udp",
+            lambda event: self._dispatch(event.payload, getattr(event, "count", 1)),
         )
         self._adapter.start(self._bus)
         print(f"[emoji_danmaku] UDP 监听已启动 {self.host}:{self.port}")
@@ -41,26 +69,37 @@ class UDPReceiver:
     # ── 主线程接口 ────────────────────────────────────────────────────────────
 
     def poll(self) -> list[dict]:
-        """取出本帧所有待处理事件，主线程调用，无锁安全。"""
+        """取出本帧所有待处理事件（每种 emoji 一条，``count`` 为合并条数）。"""
         self._bus.dispatch()
-        events = self._queue
-        self._queue = []
+        events = list(self._queue.values())
+        self._queue = {}
         return events
 
+    @property
+    def lane_stats(self) -> dict[str, dict]:
+        """事件总线各 lane 的积压与丢弃/合并计数（供 --profile 输出）。"""
+        return self._bus.lane_stats
+
     # ── 内部 ─────────────────────────────────────────────────────────────────
 
-    def _dispatch(self, payload: dict) -> None:
+    def _dispatch(self, payload: dict, count: int = 1) -> None:
         cmd = str(payload.get("cmd", ""))
-        nickname = str(payload.get("nickname", ""))
-        user_id = int(payload.get("user_id", 0))
-
         if cmd == "emoji":
             emoji = str(payload.get("emoji", "")).strip()
-            if emoji in EMOJI_SET:
-                self._queue.append({"emoji": emoji, "nickname": nickname, "user_id": user_id})
-
         elif cmd == "stg":
             # 支持 /stg 😂 这种写法（Bot 那边透传 args）
-            args = str(payload.get("args", "")).strip()
-            if args in EMOJI_SET:
-                self._queue.append({"emoji": args, "nickname": nickname, "user_id": user_id})
+            emoji = str(payload.get("args", "")).strip()
+        else:
+            return
+        if emoji not in EMOJI_SET:
+            return
+        queued = self._queue.get(emoji)
+        if queued is not None:
+            queued["count"] += count
+            return
+        self._queue[emoji] = {
+            "emoji": emoji,
+            "nickname": str(payload.get("nickname", "")),
+            "user_id": int(payload.get("user_id", 0)),
+            "count": count,
+        }
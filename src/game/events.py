@@ -8,15 +8,28 @@ re-entered by an event they publish while the current inbox is dispatching.
 ``dispatch()`` keeps the old immediate test/adapter entry point for callers
 that do not own a frame loop.  Formal runtime code should use
 ``dispatch_frame()`` or the explicit ``tick(); dispatch(strict=True)`` pair.
+
+``EventBus(batch_dispatch=True)`` takes the whole Inbox under one lock
+acquisition and delivers it lock-free on the dispatching thread.  Payload
+normalization follows ``validate_payloads`` (``__debug__`` by default); an
+unvalidated payload is still checked when the event is serialized.
+
+Queued events are split into lanes (``engine`` for lifecycle facts,
+``external`` for ``adapter.*`` input, ``gameplay`` for everything else), each
+with its own capacity and overflow policy, so an adapter flood cannot evict
+lifecycle events.  ``max_queue`` still bounds the total across lanes: when it
+is reached the fullest lane overflows.  ``lane_stats`` reports per-lane
+drop/coalesce counters.
 """
 
 from __future__ import annotations
 
+import heapq
 import math
 import threading
 import uuid
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Any, Callable, Iterable
 
 
@@ -45,6 +58,15 @@ def _json_value(value: Any, path: str = "payload") -> Any:
     raise EventBusError(f"{path} contains unsupported type {type(value).__name__}")
 
 
+def _shallow_payload(value: Any) -> Any:
+    """Copy the top-level container so later caller mutations do not leak."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value
+
+
 def _validate_owner(owner: Any, path: str = "owner") -> str | None:
     if owner is None:
         return None
@@ -131,8 +153,11 @@ class Event:
     causal_chain: tuple[str, ...] = ()
     schema_version: int = 1
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # False skips the recursive payload walk (EventBus validate_payloads);
+    # to_dict() still validates when the event is serialized.
+    validate_payload: InitVar[bool] = True
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, validate_payload: bool = True) -> None:
         if not isinstance(self.type, str) or not self.type.strip():
             raise EventBusError("event type must be a non-empty string")
         if not isinstance(self.source, str) or not self.source.strip():
@@ -148,7 +173,11 @@ class Event:
         object.__setattr__(self, "owner", _validate_owner(self.owner))
         object.__setattr__(self, "causal_chain", _validate_chain(self.causal_chain))
         object.__setattr__(self, "event_id", self.event_id.strip())
-        object.__setattr__(self, "payload", _json_value(self.payload))
+        object.__setattr__(
+            self,
+            "payload",
+            _json_value(self.payload) if validate_payload else _shallow_payload(self.payload),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -172,8 +201,8 @@ class LifecycleEvent(Event):
     representative_ids: tuple[str, ...] = ()
     density: str = "batch"
 
-    def __post_init__(self) -> None:
-        Event.__post_init__(self)
+    def __post_init__(self, validate_payload: bool = True) -> None:
+        Event.__post_init__(self, validate_payload)
         if self.reason is not None and (not isinstance(self.reason, str) or not self.reason.strip()):
             raise EventBusError("lifecycle reason must be a non-empty string or null")
         if isinstance(self.count, bool) or not isinstance(self.count, int) or self.count < 1:
@@ -199,6 +228,50 @@ class LifecycleEvent(Event):
 
 EventHandler = Callable[[Event], None]
 
+LANE_ENGINE = "engine"
+LANE_GAMEPLAY = "gameplay"
+LANE_EXTERNAL = "external"
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+
+@dataclass(frozen=True)
+class EventLane:
+    """Capacity and overflow policy for one queue lane.
+
+    ``coalesce`` replaces the newest not-yet-published event with the same
+    type, source and owner; when none is queued it falls back to dropping
+    the lane's oldest event.
+    """
+
+    name: str
+    capacity: int
+    overflow: str = "drop_oldest"
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.name, str) or not self.name.strip():
+            raise EventBusError("event lane name must be a non-empty string")
+        if isinstance(self.capacity, bool) or not isinstance(self.capacity, int) or self.capacity < 1:
+            raise EventBusError("event lane capacity must be a positive integer")
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise EventBusError(
+                f"event lane overflow must be one of {', '.join(OVERFLOW_POLICIES)}"
+            )
+        object.__setattr__(self, "name", self.name.strip())
+
+
+def _coalesce_key(event: Event) -> tuple[str, str, str | None]:
+    return (event.type, event.source, event.owner)
+
+
+def _queued(queues: dict[str, deque[tuple[int, Event]]]) -> int:
+    return sum(len(queue) for queue in queues.values())
+
+
+def _merged(queues: dict[str, deque[tuple[int, Event]]]) -> list[Event]:
+    """Interleave per-lane queues back into global FIFO order."""
+
+    return [event for _sequence, event in heapq.merge(*queues.values())]
+
 
 @dataclass
 class Subscription:
@@ -219,7 +292,15 @@ class Subscription:
 class EventBus:
     """Deterministic event queue with explicit frame boundaries."""
 
-    def __init__(self, max_queue: int = 256, *, max_causal_depth: int = 32) -> None:
+    def __init__(
+        self,
+        max_queue: int = 256,
+        *,
+        max_causal_depth: int = 32,
+        batch_dispatch: bool = False,
+        validate_payloads: bool = __debug__,
+        lanes: Iterable[EventLane] = (),
+    ) -> None:
         self.max_queue = int(max_queue)
         if self.max_queue < 1:
             raise ValueError("max_queue must be positive")
@@ -231,28 +312,55 @@ class EventBus:
         self.cancelled = 0
         self.errors: list[tuple[Event, Exception]] = []
         self._last_dispatched: tuple[Event, ...] = ()
-        self._inbox: deque[Event] = deque()
-        self._outbox: deque[Event] = deque()
-        self._handlers: dict[str, list[Subscription]] = {}
+        # Live subscriptions keyed by order, so removal is O(1) and iteration
+        # keeps subscription order.  Dispatch reads cached snapshots which may
+        # hold cancelled tombstones until enough accumulate to rebuild them.
+        self._handlers: dict[str, dict[int, Subscription]] = {}
+        self._owner_handlers: dict[str, dict[int, Subscription]] = {}
+        self._snapshots: dict[str, tuple[Subscription, ...]] = {}
+        self._tombstones: dict[str, int] = {}
+        self._owner_pending: dict[str, int] = {}
+        self._lanes = {
+            name: EventLane(name, self.max_queue)
+            for name in (LANE_ENGINE, LANE_GAMEPLAY, LANE_EXTERNAL)
+        }
+        for lane in lanes:
+            if not isinstance(lane, EventLane):
+                raise EventBusError("lanes must be EventLane values")
+            self._lanes[lane.name] = lane
+        # Each lane queues (sequence, event) pairs so overflow pops its own
+        # oldest event directly; dispatch merges the lanes back by sequence.
+        self._sequence = 0
+        self._lane_inbox: dict[str, deque[tuple[int, Event]]] = {
+            name: deque() for name in self._lanes
+        }
+        self._lane_outbox: dict[str, deque[tuple[int, Event]]] = {
+            name: deque() for name in self._lanes
+        }
+        self._lane_dropped = dict.fromkeys(self._lanes, 0)
+        self._lane_coalesced = dict.fromkeys(self._lanes, 0)
         self._order = 0
         self._closed = False
         self._dispatching = False
         self._lock = threading.RLock()
+        self.batch_dispatch = bool(batch_dispatch)
+        self.validate_payloads = bool(validate_payloads)
+        self._batch_cancelled: set[str] = set()
 
     @property
     def pending(self) -> int:
         with self._lock:
-            return len(self._inbox) + len(self._outbox)
+            return _queued(self._lane_inbox) + _queued(self._lane_outbox)
 
     @property
     def inbox_pending(self) -> int:
         with self._lock:
-            return len(self._inbox)
+            return _queued(self._lane_inbox)
 
     @property
     def outbox_pending(self) -> int:
         with self._lock:
-            return len(self._outbox)
+            return _queued(self._lane_outbox)
 
     @property
     def closed(self) -> bool:
@@ -263,6 +371,22 @@ class EventBus:
     def last_dispatched(self) -> tuple[Event, ...]:
         return self._last_dispatched
 
+    @property
+    def lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-lane capacity, policy, queue depth and overflow counters."""
+
+        with self._lock:
+            return {
+                name: {
+                    "capacity": lane.capacity,
+                    "overflow": lane.overflow,
+                    "pending": self._lane_pending_locked(name),
+                    "dropped": self._lane_dropped[name],
+                    "coalesced": self._lane_coalesced[name],
+                }
+                for name, lane in self._lanes.items()
+            }
+
     def tick(self) -> int:
         """Advance one fixed frame and publish the previous outbox to Inbox."""
 
@@ -283,10 +407,11 @@ class EventBus:
         causal_chain: Iterable[str] = (),
         schema_version: int = 1,
         spec: EventSpec | None = None,
+        lane: str | None = None,
     ) -> Event:
         with self._lock:
             self._ensure_open()
-            normalized = spec.normalize(payload) if spec is not None else _json_value(payload)
+            normalized = self._normalize_payload(payload, spec)
             if spec is not None:
                 if event_type and event_type != spec.type:
                     raise EventBusError("event type does not match event spec")
@@ -305,8 +430,9 @@ class EventBus:
                 owner=owner,
                 causal_chain=chain,
                 schema_version=schema_version,
+                validate_payload=self.validate_payloads,
             )
-            self._enqueue_locked(event)
+            self._enqueue_locked(event, lane)
             return event
 
     def emit_lifecycle(
@@ -322,10 +448,11 @@ class EventBus:
         causal_chain: Iterable[str] = (),
         schema_version: int = 1,
         spec: EventSpec | None = None,
+        lane: str | None = LANE_ENGINE,
     ) -> LifecycleEvent:
         with self._lock:
             self._ensure_open()
-            normalized = spec.normalize(payload) if spec is not None else _json_value(payload)
+            normalized = self._normalize_payload(payload, spec)
             if spec is not None:
                 if event_type and event_type != spec.type:
                     raise EventBusError("event type does not match event spec")
@@ -349,8 +476,9 @@ class EventBus:
                 reason=reason,
                 count=count,
                 representative_ids=tuple(representative_ids),
+                validate_payload=self.validate_payloads,
             )
-            self._enqueue_locked(event)
+            self._enqueue_locked(event, lane)
             return event
 
     publish = emit
@@ -376,34 +504,189 @@ class EventBus:
                 order=self._order,
                 owner=normalized_owner,
             )
-            self._handlers.setdefault(subscription.event_type, []).append(subscription)
+            self._handlers.setdefault(subscription.event_type, {})[subscription.order] = subscription
+            if normalized_owner is not None:
+                self._owner_handlers.setdefault(normalized_owner, {})[subscription.order] = subscription
+            self._snapshots.pop(subscription.event_type, None)
+            self._tombstones.pop(subscription.event_type, None)
             return subscription
 
+    def _handler_snapshot_locked(self, event_type: str) -> tuple[Subscription, ...]:
+        snapshot = self._snapshots.get(event_type)
+        if snapshot is None:
+            live = self._handlers.get(event_type)
+            snapshot = tuple(live.values()) if live else ()
+            self._snapshots[event_type] = snapshot
+            self._tombstones.pop(event_type, None)
+        return snapshot
+
+    def _unindex_locked(self, subscription: Subscription) -> None:
+        event_type = subscription.event_type
+        live = self._handlers.get(event_type)
+        if live is not None and live.pop(subscription.order, None) is not None:
+            if not live:
+                del self._handlers[event_type]
+            snapshot = self._snapshots.get(event_type)
+            if snapshot is not None:
+                stale = self._tombstones.get(event_type, 0) + 1
+                if stale * 2 > len(snapshot):
+                    # Compact: the next dispatch rebuilds from live handlers.
+                    del self._snapshots[event_type]
+                    self._tombstones.pop(event_type, None)
+                else:
+                    self._tombstones[event_type] = stale
+        if subscription.owner is not None:
+            owned = self._owner_handlers.get(subscription.owner)
+            if owned is not None:
+                owned.pop(subscription.order, None)
+                if not owned:
+                    del self._owner_handlers[subscription.owner]
+
+    def _normalize_payload(self, payload: Any, spec: EventSpec | None) -> Any:
+        if spec is not None:
+            return spec.normalize(payload)
+        if not self.validate_payloads:
+            # Deferred: Event.to_dict() still validates at serialization.
+            return payload
+        return _json_value(payload)
+
     def _ensure_open(self) -> None:
         if self._closed:
             raise EventBusError("event bus is closed")
 
     def _promote_outbox_locked(self) -> None:
-        while self._outbox:
-            self._inbox.append(self._outbox.popleft())
-
-    def _enqueue_locked(self, event: Event) -> None:
-        self._outbox.append(event)
-        while len(self._inbox) + len(self._outbox) > self.max_queue:
-            if self._inbox:
-                self._inbox.popleft()
-            else:
-                self._outbox.popleft()
+        for name, outbox in self._lane_outbox.items():
+            self._lane_inbox[name].extend(outbox)
+            outbox.clear()
+
+    def _route(self, event: Event, lane: str | None) -> str:
+        if lane is None:
+            if isinstance(event, LifecycleEvent):
+                return LANE_ENGINE
+            if event.type.startswith("adapter."):
+                return LANE_EXTERNAL
+            return LANE_GAMEPLAY
+        if lane not in self._lanes:
+            raise EventBusError(f"unknown event lane {lane!r}")
+        return lane
+
+    def _lane_pending_locked(self, lane: str) -> int:
+        return len(self._lane_inbox[lane]) + len(self._lane_outbox[lane])
+
+    def _enqueue_locked(self, event: Event, lane: str | None = None) -> None:
+        name = self._route(event, lane)
+        if self._lane_pending_locked(name) >= self._lanes[name].capacity:
+            if self._overflow_locked(event, name):
+                return
+        elif _queued(self._lane_inbox) + _queued(self._lane_outbox) >= self.max_queue:
+            # The bus-wide bound charges the fullest lane; ties go to the
+            # incoming lane so its own policy decides.
+            fullest = max(
+                self._lanes,
+                key=lambda other: (self._lane_pending_locked(other), other == name),
+            )
+            if fullest != name:
+                self._drop_oldest_locked(fullest)
+            elif self._overflow_locked(event, name):
+                return
+        self._sequence += 1
+        self._lane_outbox[name].append((self._sequence, event))
+        self._remember_locked(event)
+
+    def _overflow_locked(self, event: Event, lane: str) -> bool:
+        """Apply the lane policy; return True when ``event`` was absorbed."""
+
+        overflow = self._lanes[lane].overflow
+        if overflow == "drop_newest":
+            self._lane_dropped[lane] += 1
             self.dropped += 1
+            return True
+        if overflow == "coalesce" and self._coalesce_locked(event, lane):
+            return True
+        self._drop_oldest_locked(lane)
+        return False
+
+    def _coalesce_locked(self, event: Event, lane: str) -> bool:
+        # Only the Outbox is eligible: the Inbox is this frame's fixed snapshot.
+        key = _coalesce_key(event)
+        outbox = self._lane_outbox[lane]
+        for index in range(len(outbox) - 1, -1, -1):
+            sequence, queued = outbox[index]
+            if _coalesce_key(queued) == key:
+                self._forget_locked(queued)
+                outbox[index] = (sequence, event)
+                self._remember_locked(event)
+                self._lane_coalesced[lane] += 1
+                return True
+        return False
+
+    def _drop_oldest_locked(self, lane: str) -> None:
+        queue = self._lane_inbox[lane] or self._lane_outbox[lane]
+        if queue:
+            _sequence, queued = queue.popleft()
+            self._forget_locked(queued)
+            self._lane_dropped[lane] += 1
+            self.dropped += 1
+
+    def _pop_inbox_locked(self) -> Event | None:
+        """Pop the oldest Inbox event across lanes."""
+
+        head: deque[tuple[int, Event]] | None = None
+        for queue in self._lane_inbox.values():
+            if queue and (head is None or queue[0][0] < head[0][0]):
+                head = queue
+        if head is None:
+            return None
+        _sequence, event = head.popleft()
+        self._forget_locked(event)
+        return event
+
+    def _remember_locked(self, event: Event) -> None:
+        if event.owner is not None:
+            self._owner_pending[event.owner] = self._owner_pending.get(event.owner, 0) + 1
+
+    def _forget_locked(self, event: Event) -> None:
+        """Remove one queued event from the owner accounting."""
+
+        owner = event.owner
+        if owner is None:
+            return
+        remaining = self._owner_pending.get(owner, 0) - 1
+        if remaining > 0:
+            self._owner_pending[owner] = remaining
+        else:
+            self._owner_pending.pop(owner, None)
+
+    def _recount_locked(self) -> None:
+        self._owner_pending = {}
+        for queues in (self._lane_inbox, self._lane_outbox):
+            for queue in queues.values():
+                for _sequence, event in queue:
+                    self._remember_locked(event)
+
+    def _requeue_locked(
+        self,
+        inbox: Iterable[Event],
+        outbox: Iterable[Event],
+        lanes: dict[str, str],
+    ) -> None:
+        """Rebuild lane queues from checkpointed FIFO order."""
+
+        for queues in (self._lane_inbox, self._lane_outbox):
+            for queue in queues.values():
+                queue.clear()
+        for queues, events in ((self._lane_inbox, inbox), (self._lane_outbox, outbox)):
+            for event in events:
+                lane = lanes.get(event.event_id)
+                if lane not in self._lanes:
+                    lane = self._route(event, None)
+                self._sequence += 1
+                queues[lane].append((self._sequence, event))
+        self._recount_locked()
 
     def _cancel(self, subscription: Subscription) -> None:
         with self._lock:
-            subscriptions = self._handlers.get(subscription.event_type)
-            if subscriptions is None:
-                return
-            self._handlers[subscription.event_type] = [
-                item for item in subscriptions if item is not subscription
-            ]
+            self._unindex_locked(subscription)
 
     def cancel_owner(self, owner: str) -> int:
         """Cancel subscriptions and pending facts owned by one scope."""
@@ -412,29 +695,79 @@ class EventBus:
         assert normalized is not None
         with self._lock:
             removed = 0
-            for subscriptions in self._handlers.values():
-                for subscription in subscriptions:
-                    if subscription.owner == normalized and not subscription._cancelled:
-                        subscription._cancelled = True
-                        removed += 1
-            for queue in (self._inbox, self._outbox):
-                kept = deque()
-                while queue:
-                    event = queue.popleft()
-                    if event.owner == normalized:
-                        removed += 1
-                    else:
-                        kept.append(event)
-                queue.extend(kept)
+            for subscription in tuple(self._owner_handlers.get(normalized, {}).values()):
+                subscription._cancelled = True
+                self._unindex_locked(subscription)
+                removed += 1
+            if self._owner_pending.get(normalized):
+                for queues in (self._lane_inbox, self._lane_outbox):
+                    for queue in queues.values():
+                        kept = deque()
+                        while queue:
+                            item = queue.popleft()
+                            if item[1].owner == normalized:
+                                self._forget_locked(item[1])
+                                removed += 1
+                            else:
+                                kept.append(item)
+                        queue.extend(kept)
+            if self._dispatching and self.batch_dispatch:
+                # The detached batch is skipped (and counted) as it drains.
+                self._batch_cancelled.add(normalized)
             self.cancelled += removed
             return removed
 
+    def capture_checkpoint(self) -> dict[str, Any]:
+        """Copy frame counters and queued facts; subscriptions stay live."""
+
+        with self._lock:
+            return {
+                "frame": self.frame,
+                "dropped": self.dropped,
+                "cancelled": self.cancelled,
+                "errors": tuple(self.errors),
+                "last_dispatched": self._last_dispatched,
+                "inbox": tuple(_merged(self._lane_inbox)),
+                "outbox": tuple(_merged(self._lane_outbox)),
+                "lanes": {
+                    event.event_id: name
+                    for queues in (self._lane_inbox, self._lane_outbox)
+                    for name, queue in queues.items()
+                    for _sequence, event in queue
+                },
+                "lane_dropped": dict(self._lane_dropped),
+                "lane_coalesced": dict(self._lane_coalesced),
+            }
+
+    def restore_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        with self._lock:
+            if self._dispatching:
+                raise EventBusError("cannot restore a checkpoint during dispatch")
+            self.frame = int(checkpoint["frame"])
+            self.dropped = int(checkpoint["dropped"])
+            self.cancelled = int(checkpoint["cancelled"])
+            self.errors = list(checkpoint["errors"])
+            self._last_dispatched = tuple(checkpoint["last_dispatched"])
+            for counters, key in (
+                (self._lane_dropped, "lane_dropped"),
+                (self._lane_coalesced, "lane_coalesced"),
+            ):
+                for name in counters:
+                    counters[name] = int(checkpoint.get(key, {}).get(name, 0))
+            self._requeue_locked(
+                checkpoint["inbox"],
+                checkpoint["outbox"],
+                dict(checkpoint.get("lanes", {})),
+            )
+
     def drain_inbox(self) -> tuple[Event, ...]:
         """Remove and return the current Inbox without invoking handlers."""
 
         with self._lock:
-            values = tuple(self._inbox)
-            self._inbox.clear()
+            values = tuple(_merged(self._lane_inbox))
+            for queue in self._lane_inbox.values():
+                queue.clear()
+            self._recount_locked()
             return values
 
     def dispatch(self, *, strict: bool = False) -> int:
@@ -444,25 +777,41 @@ class EventBus:
         compatibility default promotes an outbox when Inbox is empty, which
         preserves the historical ``emit(); dispatch()`` adapter/test pattern.
         In both modes, facts emitted by handlers remain for a later dispatch.
+        A batch-mode call made from a handler returns 0 and leaves the
+        running batch's state alone.
         """
 
         with self._lock:
+            if self._dispatching and self.batch_dispatch:
+                return 0
             if self._closed:
                 self._last_dispatched = ()
                 return 0
-            if not strict and not self._inbox and self._outbox and not self._dispatching:
+            count = _queued(self._lane_inbox)
+            if not strict and not count and not self._dispatching:
                 self._promote_outbox_locked()
-            count = len(self._inbox)
+                count = _queued(self._lane_inbox)
             self._dispatching = True
+            if self.batch_dispatch:
+                batch = _merged(self._lane_inbox)
+                for queue in self._lane_inbox.values():
+                    queue.clear()
+                self._recount_locked()
+                handlers_by_type = {
+                    event_type: self._handler_snapshot_locked(event_type)
+                    for event_type in tuple(self._handlers)
+                }
+        if self.batch_dispatch:
+            return self._dispatch_batch(batch, handlers_by_type)
         delivered: list[Event] = []
         try:
             for _ in range(count):
                 with self._lock:
-                    if self._closed or not self._inbox:
+                    event = None if self._closed else self._pop_inbox_locked()
+                    if event is None:
                         break
-                    event = self._inbox.popleft()
-                    handlers = tuple(self._handlers.get(event.type, ()))
-                    wildcards = tuple(self._handlers.get("*", ()))
+                    handlers = self._handler_snapshot_locked(event.type)
+                    wildcards = self._handler_snapshot_locked("*")
                 delivered.append(event)
                 self._deliver(event, handlers)
                 self._deliver(event, wildcards)
@@ -472,6 +821,42 @@ class EventBus:
                 self._dispatching = False
                 self._last_dispatched = tuple(delivered)
 
+    def _dispatch_batch(
+        self,
+        batch: list[Event],
+        handlers_by_type: dict[str, tuple[Subscription, ...]],
+    ) -> int:
+        """Deliver a detached Inbox without taking the lock per event.
+
+        Subscriptions are snapshotted once for the batch: handlers added
+        during delivery see the next dispatch, while cancellations still
+        take effect immediately through the subscription flag and
+        ``cancel_owner``.
+        """
+
+        count = len(batch)
+        empty: tuple[Subscription, ...] = ()
+        wildcards = handlers_by_type.get("*", empty)
+        cancelled = self._batch_cancelled
+        delivered: list[Event] = []
+        try:
+            for event in batch:
+                if self._closed:
+                    break
+                if cancelled and event.owner in cancelled:
+                    with self._lock:
+                        self.cancelled += 1
+                    continue
+                delivered.append(event)
+                self._deliver(event, handlers_by_type.get(event.type, empty))
+                self._deliver(event, wildcards)
+            return count
+        finally:
+            with self._lock:
+                self._dispatching = False
+                self._batch_cancelled.clear()
+                self._last_dispatched = tuple(delivered)
+
     def dispatch_frame(self) -> int:
         """Advance one fixed frame, then dispatch only that frame's Inbox."""
 
@@ -491,8 +876,10 @@ class EventBus:
     def close(self) -> None:
         with self._lock:
             self._closed = True
-            self._inbox.clear()
-            self._outbox.clear()
+            for queues in (self._lane_inbox, self._lane_outbox):
+                for queue in queues.values():
+                    queue.clear()
+            self._recount_locked()
 
 
 __all__ = [
@@ -500,7 +887,12 @@ __all__ = [
     "EventBus",
     "EventBusError",
     "EventHandler",
+    "EventLane",
     "EventSpec",
+    "LANE_ENGINE",
+    "LANE_EXTERNAL",
+    "LANE_GAMEPLAY",
     "LifecycleEvent",
+    "OVERFLOW_POLICIES",
     "Subscription",
 ]
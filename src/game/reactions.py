@@ -9,14 +9,19 @@ from __future__ import annotations
 
 import inspect
 import json
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import Enum
 from itertools import count
-from typing import Any, Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any, Callable, Generic, Iterable, Iterator, Mapping, TypeVar, overload
 
 from .events import Event, EventBus, LifecycleEvent
 
 
+DEFAULT_REACTION_TRACE_CAPACITY = 4096
+DEFAULT_TASK_TRACE_CAPACITY = 256
+
 _ACTIVATION_KINDS = {"at_frame", "when_variable", "on_event", "on_lifecycle"}
 _ACTIVATION_OPERATORS = {"==", "!=", ">", ">=", "<", "<=", "truthy", "falsy"}
 _ACTIVATION_EDGES = {"on_rise", "while_true", "on_fall", "on_change"}
@@ -274,6 +279,102 @@ def _compare_value(left: Any, operator: str, right: Any) -> bool:
     return False
 
 
+_Record = TypeVar("_Record")
+
+
+class TraceRing(Generic[_Record]):
+    """Fixed-capacity trace history with an optional NDJSON sink.
+
+    Only the newest ``capacity`` records stay in memory; ``total`` counts
+    every append so callers can take the records added since an earlier mark
+    with ``since``.  A sink (path or text stream) receives every record as
+    one JSON line, so a full trace survives the in-memory retention window;
+    ``close`` releases a sink the ring opened itself.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_REACTION_TRACE_CAPACITY,
+        *,
+        sink: str | Path | IO[str] | None = None,
+    ) -> None:
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("trace capacity must be a positive integer")
+        self.capacity = capacity
+        self._items: deque[_Record] = deque(maxlen=capacity)
+        self.total = 0
+        self._owns_sink = isinstance(sink, (str, Path))
+        self._sink: IO[str] | None = (
+            open(sink, "a", encoding="utf-8") if self._owns_sink else sink  # noqa: SIM115
+        )
+
+    @property
+    def dropped(self) -> int:
+        return self.total - len(self._items)
+
+    def append(self, record: _Record) -> None:
+        self._items.append(record)
+        self.total += 1
+        if self._sink is not None:
+            self._sink.write(json.dumps(_trace_record(record), ensure_ascii=False, default=str))
+            self._sink.write("\n")
+
+    def extend(self, records: Iterable[_Record]) -> None:
+        for record in records:
+            self.append(record)
+
+    def since(self, mark: int) -> tuple[_Record, ...]:
+        """Return retained records appended after ``total`` was ``mark``."""
+
+        added = self.total - mark
+        if added <= 0:
+            return ()
+        items = tuple(self._items)
+        return items[-added:] if added < len(items) else items
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.total = 0
+
+    def flush(self) -> None:
+        if self._sink is not None:
+            self._sink.flush()
+
+    def close(self) -> None:
+        if self._sink is not None and self._owns_sink:
+            self._sink.close()
+        self._sink = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[_Record]:
+        return iter(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> _Record: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_Record]: ...
+
+    def __getitem__(self, index: int | slice) -> _Record | list[_Record]:
+        if isinstance(index, slice):
+            return list(self._items)[index]
+        return self._items[index]
+
+
+def _trace_record(record: Any) -> Any:
+    to_dict = getattr(record, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if is_dataclass(record) and not isinstance(record, type):
+        return asdict(record)
+    return record
+
+
 class TaskScopeState(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
@@ -337,6 +438,7 @@ class TaskScope:
         *,
         owner_id: str | None = None,
         parent: "TaskScope | None" = None,
+        trace_capacity: int = DEFAULT_TASK_TRACE_CAPACITY,
     ) -> None:
         if not isinstance(scope_id, str) or not scope_id.strip():
             raise ValueError("scope_id must be a non-empty string")
@@ -347,7 +449,7 @@ class TaskScope:
         self.cancel_token = CancellationToken()
         self.children: dict[str, TaskScope] = {}
         self._tasks: dict[str, _Task] = {}
-        self._trace: list[TaskTrace] = []
+        self._trace: TraceRing[TaskTrace] = TraceRing(trace_capacity)
         if parent is not None:
             parent.add_child(self)
 
@@ -818,7 +920,13 @@ class _ReactionInstance:
 
 
 class ReactionScheduler:
-    """Deterministic matcher and owner-aware reaction instance scheduler."""
+    """Deterministic matcher and owner-aware reaction instance scheduler.
+
+    Finished instances are retired together with their task scope, so
+    ``instances`` and ``scopes`` only hold live work; their history stays in
+    the bounded ``trace``.  Call ``close`` when the scheduler is discarded to
+    release a trace sink.
+    """
 
     def __init__(
         self,
@@ -826,14 +934,20 @@ class ReactionScheduler:
         max_causal_depth: int = 32,
         max_instances_per_frame: int = 4096,
         event_bus: EventBus | None = None,
+        trace_capacity: int = DEFAULT_REACTION_TRACE_CAPACITY,
+        trace_sink: str | Path | IO[str] | None = None,
+        task_trace_capacity: int = DEFAULT_TASK_TRACE_CAPACITY,
     ) -> None:
         self.max_causal_depth = max(1, int(max_causal_depth))
         self.max_instances_per_frame = max(1, int(max_instances_per_frame))
         self.specs: dict[str, ReactionSpec] = {}
+        # (event_type, owner) -> specs; owner None holds the owner-agnostic ones.
+        self._index: dict[tuple[str, str | None], dict[str, ReactionSpec]] = {}
         self.scopes: dict[str, TaskScope] = {}
         self.instances: dict[str, _ReactionInstance] = {}
-        self.trace: list[ReactionTrace] = []
-        self.diagnostics: list[dict[str, Any]] = []
+        self.trace: TraceRing[ReactionTrace] = TraceRing(trace_capacity, sink=trace_sink)
+        self.diagnostics: TraceRing[dict[str, Any]] = TraceRing(trace_capacity)
+        self.task_trace_capacity = task_trace_capacity
         self._serial = count(1)
         self._started: set[tuple[str, str]] = set()
         self._last_start: dict[tuple[str, str], int] = {}
@@ -858,11 +972,20 @@ class ReactionScheduler:
         if spec.reaction_id in self.specs:
             raise ValueError(f"duplicate reaction id: {spec.reaction_id}")
         self.specs[spec.reaction_id] = spec
+        self._index.setdefault((spec.event_type, spec.owner), {})[spec.reaction_id] = spec
 
     add = register
 
     def unregister(self, reaction_id: str) -> None:
-        self.specs.pop(reaction_id, None)
+        spec = self.specs.pop(reaction_id, None)
+        if spec is None:
+            return
+        key = (spec.event_type, spec.owner)
+        bucket = self._index.get(key)
+        if bucket is not None:
+            bucket.pop(reaction_id, None)
+            if not bucket:
+                del self._index[key]
 
     def create_scope(
         self,
@@ -874,7 +997,9 @@ class ReactionScheduler:
         if scope_id in self.scopes and self.scopes[scope_id].active:
             return self.scopes[scope_id]
         parent = self.scopes.get(parent_id) if parent_id else None
-        scope = TaskScope(scope_id, owner_id=owner_id, parent=parent)
+        scope = TaskScope(
+            scope_id, owner_id=owner_id, parent=parent, trace_capacity=self.task_trace_capacity
+        )
         self.scopes[scope_id] = scope
         return scope
 
@@ -915,7 +1040,7 @@ class ReactionScheduler:
                         activation_snapshot=instance.activation_snapshot,
                     )
                 )
-                self.instances.pop(instance_id, None)
+                self._retire(instance_id)
 
     def process(
         self,
@@ -938,10 +1063,8 @@ class ReactionScheduler:
             self._started_this_frame = 0
         scope = self.create_scope(scope_id, owner_id=scope_id)
         values = tuple(events)
-        before = len(self.trace)
-        definitions = self.specs.values() if specs is None else tuple(specs)
-        for spec in sorted(definitions, key=lambda item: item.reaction_id):
-            matched = [event for event in values if self._matches(spec, event, variables, context)]
+        before = self.trace.total
+        for spec, matched in self._matched_events(values, specs, variables, context):
             if not matched:
                 continue
             if spec.policy == "first_per_frame":
@@ -974,7 +1097,7 @@ class ReactionScheduler:
                     if spec.reentry == "restart":
                         for item in tuple(active):
                             item.scope.cancel("replaced", frame=frame)
-                            self.instances.pop(item.instance_id, None)
+                            self._retire(item.instance_id)
                             self.trace.append(
                                 ReactionTrace(
                                     frame,
@@ -1021,7 +1144,7 @@ class ReactionScheduler:
                 )
                 if instance is not None:
                     self._started_this_frame += 1
-        return tuple(self.trace[before:])
+        return self.trace.since(before)
 
     def process_pending(
         self,
@@ -1060,6 +1183,16 @@ class ReactionScheduler:
         if clear_trace:
             self.trace.clear()
             self.diagnostics.clear()
+        # Records before the reset stay complete on disk for replay diffing.
+        self.trace.flush()
+
+    def close(self, *, frame: int = 0) -> None:
+        """Cancel runtime work, detach from the bus and release trace sinks."""
+
+        self.reset(frame=frame, clear_trace=False)
+        self.bind_event_bus(None)
+        self.trace.close()
+        self.diagnostics.close()
 
     def cancel_owner(self, owner_id: str, reason: str = "owner_cancelled", frame: int = 0) -> int:
         """Cancel every scope belonging to one authoring/runtime owner."""
@@ -1121,7 +1254,7 @@ class ReactionScheduler:
                     activation_snapshot=instance.activation_snapshot,
                 )
             )
-            self.instances.pop(instance_id, None)
+            self._retire(instance_id)
             cancelled += 1
         return cancelled
 
@@ -1150,9 +1283,61 @@ class ReactionScheduler:
                         activation_snapshot=instance.activation_snapshot,
                     )
                 )
-                self.instances.pop(instance_id, None)
+                self._retire(instance_id)
+
+    def _matched_events(
+        self,
+        events: tuple[Event, ...],
+        specs: Iterable[ReactionSpec] | None,
+        variables: Any,
+        context: Any,
+    ) -> Iterator[tuple[ReactionSpec, list[Event]]]:
+        """Yield each reaction with its matching events in reaction-id order.
+
+        Registered specs are reached through the type/owner index, so an
+        event only visits reactions that could fire.  Guards still run per
+        reaction when it is yielded, after earlier reactions have started.
+        """
+
+        if specs is not None:
+            for spec in sorted(specs, key=lambda item: item.reaction_id):
+                yield spec, [event for event in events if self._matches(spec, event, variables, context)]
+            return
+        candidates: dict[str, tuple[ReactionSpec, list[Event]]] = {}
+        index = self._index
+        for event in events:
+            keys = ((event.type, None),) if event.owner is None else ((event.type, None), (event.type, event.owner))
+            for key in keys:
+                bucket = index.get(key)
+                if not bucket:
+                    continue
+                for reaction_id, spec in bucket.items():
+                    if not self._matches_event(spec, event):
+                        continue
+                    entry = candidates.get(reaction_id)
+                    if entry is None:
+                        candidates[reaction_id] = (spec, [event])
+                    else:
+                        entry[1].append(event)
+        for reaction_id in sorted(candidates):
+            spec, matched = candidates[reaction_id]
+            if spec.guard is not None:
+                matched = [
+                    event
+                    for event in matched
+                    if bool(_invoke_guard(spec.guard, event, variables, context))
+                ]
+            yield spec, matched
 
     def _matches(self, spec: ReactionSpec, event: Event, variables: Any, context: Any) -> bool:
+        if not self._matches_event(spec, event):
+            return False
+        if spec.guard is not None and not bool(_invoke_guard(spec.guard, event, variables, context)):
+            return False
+        return True
+
+    @staticmethod
+    def _matches_event(spec: ReactionSpec, event: Event) -> bool:
         if event.type != spec.event_type:
             return False
         if spec.source is not None and event.source != spec.source:
@@ -1167,8 +1352,6 @@ class ReactionScheduler:
                 return False
             elif not isinstance(event.payload, Mapping):
                 return False
-        if spec.guard is not None and not bool(_invoke_guard(spec.guard, event, variables, context)):
-            return False
         return True
 
     def _start(
@@ -1187,7 +1370,12 @@ class ReactionScheduler:
         action_resolver: Callable[[str], Callable[..., Any] | None] | None = None,
     ) -> _ReactionInstance | None:
         instance_id = f"{clip_id or spec.reaction_id}@{scope.scope_id}#{next(self._serial)}"
-        child = TaskScope(instance_id, owner_id=owner_id or instance_id, parent=scope)
+        child = TaskScope(
+            instance_id,
+            owner_id=owner_id or instance_id,
+            parent=scope,
+            trace_capacity=self.task_trace_capacity,
+        )
         self.scopes[instance_id] = child
         identity = clip_id or spec.reaction_id
         self._started.add((identity, scope.scope_id))
@@ -1260,8 +1448,7 @@ class ReactionScheduler:
                         activation_snapshot=activation_snapshot,
                     )
                 )
-                self.instances.pop(instance_id, None)
-                self.scopes.pop(instance_id, None)
+                self._retire(instance_id)
                 return None
         if action is None:
             child.complete(frame)
@@ -1293,11 +1480,26 @@ class ReactionScheduler:
                         activation_snapshot=activation_snapshot,
                     )
                 )
-                self.instances.pop(instance_id, None)
-                self.scopes.pop(instance_id, None)
+                self._retire(instance_id)
                 return None
         return instance
 
+    def _retire(self, instance_id: str) -> None:
+        """Forget a finished instance and its scope; the trace keeps its history.
+
+        Without this, every instance scope stayed in ``scopes`` and in its
+        parent's ``children`` for the scheduler's lifetime, so a long run
+        grew without bound even with ring-backed traces.
+        """
+
+        instance = self.instances.pop(instance_id, None)
+        scope = self.scopes.pop(instance_id, None)
+        if scope is None and instance is not None:
+            scope = instance.scope
+        if scope is not None and scope.parent is not None:
+            if scope.parent.children.get(instance_id) is scope:
+                del scope.parent.children[instance_id]
+
     def _suppress(
         self,
         spec: ReactionSpec,
@@ -1395,6 +1597,26 @@ def _aggregate_events(events: list[Event], frame: int) -> LifecycleEvent:
     )
 
 
+def _death_events(deaths: Any, frame: int) -> tuple[LifecycleEvent, ...]:
+    events = []
+    for batch in deaths.summarize():
+        payload = dict(batch.payload or {})
+        payload["count"] = int(batch.count)
+        events.append(
+            LifecycleEvent(
+                type=batch.event_type,
+                source=batch.source,
+                frame=frame,
+                payload=payload,
+                owner=batch.owner,
+                reason=batch.reason,
+                count=int(batch.count),
+                representative_ids=batch.representative_ids,
+            )
+        )
+    return tuple(events)
+
+
 class ReactiveTimeline:
     """Owns armed ``ReactiveClip`` definitions for one state/timeline."""
 
@@ -1445,6 +1667,12 @@ class ReactiveTimeline:
         self._pending.clear()
         self._generation = 0
 
+    def close(self, *, frame: int = 0) -> None:
+        """Drop pending work and close the scheduler's trace sinks."""
+
+        self.reset(frame=frame)
+        self.scheduler.close(frame=frame)
+
     def cancel_owner(
         self,
         owner_id: str,
@@ -1502,7 +1730,16 @@ class ReactiveTimeline:
         advance_scheduler: bool = True,
         action_resolver: Callable[[str], Callable[..., Any] | None] | None = None,
         local_frame: int | None = None,
+        deaths: Any = None,
     ) -> tuple[ReactionTrace, ...]:
+        """Arm clips for ``state_id`` and start reactions due this frame.
+
+        ``deaths`` accepts a bullet pool ``DeathColumns`` buffer directly; it
+        is folded into one lifecycle event per recorded clear and tag (see
+        ``DeathColumns.summarize``) before matching, so matching cost does
+        not depend on how many bullets died.
+        """
+
         scope_id = self._state_scopes.get(state_id) or self.enter_state(state_id, frame)
         activation_frame = frame if local_frame is None else local_frame
         active = tuple(
@@ -1547,7 +1784,9 @@ class ReactiveTimeline:
                 )
         self._armed_by_state[state_id] = active_ids
         incoming = tuple(events)
-        before = len(self.scheduler.trace)
+        if deaths is not None:
+            incoming += _death_events(deaths, frame)
+        before = self.scheduler.trace.total
         for clip in active:
             rule = clip.effective_activation
             key = (state_id, clip.clip_id)
@@ -1608,7 +1847,7 @@ class ReactiveTimeline:
                 )
         if advance_scheduler:
             self.scheduler.tick(frame)
-        return tuple(self.scheduler.trace[before:])
+        return self.scheduler.trace.since(before)
 
     @property
     def active_instances(self) -> tuple[dict[str, Any], ...]:
@@ -1772,6 +2011,8 @@ class BackgroundTransition:
 
 
 __all__ = [
+    "DEFAULT_REACTION_TRACE_CAPACITY",
+    "DEFAULT_TASK_TRACE_CAPACITY",
     "ActivationRule",
     "BackgroundTransition",
     "CancellationToken",
@@ -1784,4 +2025,5 @@ __all__ = [
     "TaskScopeState",
     "TaskTrace",
     "TaskWait",
+    "TraceRing",
 ]
@@ -79,7 +79,6 @@ class StageManager:
         自动完成：loading 画面 → 音频加载 → StageContext 创建 → 关卡运行 → 清理。
         """
         from .context import StageContext
-        from ..audio import StageAudioBank
 
         bullet_pool = self._engine_refs['bullet_pool']
         player = self._engine_refs['player']
@@ -99,20 +98,12 @@ class StageManager:
 
         if self._audio_manager and stage_dir:
             stage_id = getattr(stage_class, 'id', 'unknown')
-            # SE 加载（磁盘 I/O）
-            stage_bank = StageAudioBank(stage_id)
-            se_dir = os.path.join(stage_dir, "audio", "se")
-            if os.path.isdir(se_dir):
-                stage_bank.load_se_directory(se_dir)
+            # SE 交给后台线程解码，BGM 只登记路径；未就绪的 SE 首次播放时排队
+            self._audio_manager.load_stage_bank(stage_id, stage_dir)
+            stall_ms = self._audio_manager.last_transition_stall_ms
+            print(f"[StageManager] 关卡音频切换停顿 {stall_ms:.1f} ms")
             yield
 
-            # BGM 注册（轻量，只记路径）
-            bgm_dir = os.path.join(stage_dir, "audio", "music")
-            if os.path.isdir(bgm_dir):
-                stage_bank.load_bgm_directory(bgm_dir)
-
-            self._audio_manager.set_stage_bank(stage_bank)
-
         self.loading_info["hint"] = "Ready"
         yield
 
@@ -340,6 +331,7 @@ from .program import (  # noqa: E402
     PatternSchedule,
     StageAction,
     StageAutomation,
+    StageCheckpoint,
     StageKeyframe,
     StageNode,
     StageProgram,
@@ -373,6 +365,7 @@ __all__ = [
     "PatternSchedule",
     "StageAction",
     "StageAutomation",
+    "StageCheckpoint",
     "StageKeyframe",
     "StageManager",
     "StageNode",
@@ -9,6 +9,7 @@
     ctx = StageContext(bullet_pool=bullet_pool, player=player)
 """
 
+import copy
 import json
 import math
 import os
@@ -21,6 +22,7 @@ from ..events import EventBus, EventBusError, LifecycleEvent
 from ..bullet import (
     FLAG_BOUNCE_X, FLAG_BOUNCE_Y, FLAG_IS_EMITTER, FLAG_RENDER_ANGLE_LOCKED,
     CURVE_NONE, CURVE_SIN_SPEED, CURVE_SIN_ANGLE, CURVE_COS_SPEED, CURVE_LINEAR_SPEED,
+    TRACK_NONE,
 )
 
 
@@ -230,12 +232,16 @@ class StageContext(SpellCardContext):
         render_scale: float = 1.0,
         curve_type: int = 0,
         curve_param: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0),
+        speed_keys=None,
+        turn_keys=None,
     ) -> np.ndarray:
         """Create a heterogeneous formal-runtime burst in one pool operation.
 
         This is the batch equivalent of :meth:`create_bullet`: public angles
         are degrees and speeds are per second, while the pool receives radians
-        and normalized units per frame.
+        and normalized units per frame. ``speed_keys`` (speed per second) and
+        ``turn_keys`` (degrees per second) are ``(frame, value)`` pairs that
+        the pool interpolates linearly over each bullet's lifetime.
         """
         position_array = np.asarray(positions, dtype=np.float32)
         angle_array = np.asarray(angles, dtype=np.float32)
@@ -260,6 +266,8 @@ class StageContext(SpellCardContext):
 
         angle_radians = np.deg2rad(angle_array).astype(np.float32, copy=False)
         speed_per_frame = speed_array / 60.0
+        speed_track = self._motion_track(speed_keys, 1.0 / 60.0)
+        turn_track = self._motion_track(turn_keys, math.pi / 180.0)
         if hasattr(self.bullet_pool, "spawn_bullets_batch"):
             indices = self.bullet_pool.spawn_bullets_batch(
                 positions=position_array,
@@ -276,6 +284,8 @@ class StageContext(SpellCardContext):
                 render_scale=render_scale,
                 curve_type=curve_type,
                 curve_param=curve_param,
+                speed_track=speed_track,
+                turn_track=turn_track,
             )
         else:
             spawned = []
@@ -298,6 +308,8 @@ class StageContext(SpellCardContext):
                     render_scale=render_scale,
                     curve_type=curve_type,
                     curve_param=curve_param,
+                    speed_track=speed_track,
+                    turn_track=turn_track,
                 )
                 if idx >= 0:
                     spawned.append(idx)
@@ -318,6 +330,16 @@ class StageContext(SpellCardContext):
             )
         return result
 
+    def _motion_track(self, keys, value_scale: float) -> int:
+        """Register ``(frame, value)`` keys as a pool track in pool units."""
+        if not keys:
+            return TRACK_NONE
+        register = getattr(self.bullet_pool, "register_motion_track", None)
+        if register is None:
+            raise ValueError("this bullet pool does not support motion tracks")
+        key_array = np.asarray(keys, dtype=np.float64).reshape((-1, 2))
+        return register(key_array[:, 0] / 60.0, key_array[:, 1] * value_scale)
+
     def create_polar_bullet(self, center, orbit_radius: float, theta: float,
                             radial_speed: float = 0.0, angular_velocity: float = 0.0,
                             bullet_type: str = "ball_m", color: str = "red",
@@ -822,6 +844,43 @@ class StageContext(SpellCardContext):
         self._background_transitions.clear()
         self._lifecycle_trace.clear()
 
+    def capture_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Capture authored stage state plus pool and EventBus for seek.
+
+        Returns ``None`` when an attached pool cannot be checkpointed, so
+        the StageRunner falls back to replaying from frame 0.
+        """
+        pool_hook = getattr(self.bullet_pool, "capture_checkpoint", None)
+        if self.bullet_pool is not None and not callable(pool_hook):
+            return None
+        return {
+            "node_positions": dict(self._authored_node_positions),
+            "node_properties": copy.deepcopy(self._authored_node_properties),
+            "timeline_events": tuple(self._timeline_events),
+            "background_transitions": tuple(self._background_transitions),
+            "lifecycle_trace": tuple(self._lifecycle_trace),
+            "runtime_frame": self._runtime_frame,
+            "bullet_indices": tuple(self._bullet_indices),
+            "bullet_pool": pool_hook() if callable(pool_hook) else None,
+            "event_bus": (
+                self._event_bus.capture_checkpoint()
+                if self._event_bus is not None else None
+            ),
+        }
+
+    def restore_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        self._authored_node_positions = dict(checkpoint["node_positions"])
+        self._authored_node_properties = copy.deepcopy(checkpoint["node_properties"])
+        self._timeline_events = list(checkpoint["timeline_events"])
+        self._background_transitions = list(checkpoint["background_transitions"])
+        self._lifecycle_trace = list(checkpoint["lifecycle_trace"])
+        self._runtime_frame = int(checkpoint["runtime_frame"])
+        self._bullet_indices = list(checkpoint["bullet_indices"])
+        if checkpoint["bullet_pool"] is not None:
+            self.bullet_pool.restore_checkpoint(checkpoint["bullet_pool"])
+        if checkpoint["event_bus"] is not None and self._event_bus is not None:
+            self._event_bus.restore_checkpoint(checkpoint["event_bus"])
+
     # ==================== 音频 API ====================
 
     @property
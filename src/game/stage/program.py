@@ -7,13 +7,26 @@ formal bullet pool; a StageProgram only schedules sparse semantic work.
 
 from __future__ import annotations
 
-import hashlib
+import bisect
+import copy
+import itertools
 import json
 import math
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from src.core.checkpoints import (
+    DEFAULT_CHECKPOINT_BUDGET_BYTES,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointRing,
+    capture_context_checkpoint,
+    checkpoint_nbytes,
+    context_player_position,
+)
 from src.authoring.variables import (
     VariableError,
     VariableOutputMapping,
@@ -27,6 +40,12 @@ if TYPE_CHECKING:
     from src.game.reactions import ReactiveClip, ReactiveTimeline
 
 
+STAGE_TRACE_MODES = ("off", "summary", "full")
+DEFAULT_TRACE_CAPACITY = 65_536
+DEFAULT_SPAWN_TRACE_CAPACITY = 16_384
+DEFAULT_AUDIO_TRACE_CAPACITY = 1_024
+
+
 def _decode_json(value: str) -> Any:
     return json.loads(value)
 
@@ -291,6 +310,116 @@ class _ActivePattern:
     loop_index: int
     end_frame: int
     runner: PatternRunner
+    context: _PatternContext | None = None
+
+
+@dataclass(frozen=True)
+class StageCheckpoint:
+    """Opaque StageRunner + context state at the start of ``frame``."""
+
+    frame: int
+    runner: dict[str, Any]
+    context: Any | None
+    nbytes: int
+
+
+class SpawnTraceBuffer:
+    """Fixed-capacity columnar ring of pattern spawn records.
+
+    One record per PatternRunner emission: integer columns plus the runner's
+    64-bit BLAKE2b digest of the burst's raw float64 positions/angles/speeds.
+    Clip ids are interned so no per-record Python objects are retained.
+    """
+
+    COLUMNS = (
+        ("frame", np.int64),
+        ("clip", np.int32),
+        ("loop_index", np.int32),
+        ("pattern_loop_index", np.int32),
+        ("burst_index", np.int32),
+        ("requested_count", np.int32),
+        ("spawned_count", np.int32),
+        ("spawn_hash", np.uint64),
+    )
+
+    def __init__(self, capacity: int = DEFAULT_SPAWN_TRACE_CAPACITY) -> None:
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("spawn trace capacity must be a positive integer")
+        self.capacity = capacity
+        self._columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS
+        }
+        self.clip_ids: list[str] = []
+        self._clip_index: dict[str, int] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self.total - self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def clear(self) -> None:
+        self.total = 0
+        self.clip_ids.clear()
+        self._clip_index.clear()
+
+    def append(
+        self,
+        frame: int,
+        clip_id: str,
+        loop_index: int,
+        pattern_loop_index: int,
+        burst_index: int,
+        requested_count: int,
+        spawned_count: int,
+        spawn_hash: int,
+    ) -> None:
+        clip = self._clip_index.get(clip_id)
+        if clip is None:
+            clip = self._clip_index[clip_id] = len(self.clip_ids)
+            self.clip_ids.append(clip_id)
+        slot = self.total % self.capacity
+        columns = self._columns
+        columns["frame"][slot] = frame
+        columns["clip"][slot] = clip
+        columns["loop_index"][slot] = loop_index
+        columns["pattern_loop_index"][slot] = pattern_loop_index
+        columns["burst_index"][slot] = burst_index
+        columns["requested_count"][slot] = requested_count
+        columns["spawned_count"][slot] = spawned_count
+        columns["spawn_hash"][slot] = spawn_hash
+        self.total += 1
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Return retained records oldest-first as independent arrays."""
+
+        count = len(self)
+        start = self.total % self.capacity if self.total > self.capacity else 0
+        order = (np.arange(count) + start) % self.capacity
+        return {name: column[order] for name, column in self._columns.items()}
+
+    def capture(self) -> dict[str, Any]:
+        count = len(self)
+        return {
+            "total": self.total,
+            "clip_ids": tuple(self.clip_ids),
+            "columns": {
+                name: column[:count].copy() for name, column in self._columns.items()
+            },
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        self.total = int(state["total"])
+        self.clip_ids = list(state["clip_ids"])
+        self._clip_index = {clip_id: index for index, clip_id in enumerate(self.clip_ids)}
+        for name, values in state["columns"].items():
+            self._columns[name][: len(values)] = values
 
 
 class _ShiftedPlayer:
@@ -323,10 +452,8 @@ class _PatternContext:
 
     def create_bullets_batch(self, **kwargs):
         dx, dy = self._delta()
-        kwargs["positions"] = tuple(
-            (float(x) + dx, float(y) + dy)
-            for x, y in kwargs.get("positions", ())
-        )
+        positions = np.asarray(kwargs.get("positions", ()), dtype=np.float64)
+        kwargs["positions"] = positions.reshape((-1, 2)) + (dx, dy)
         return self._context.create_bullets_batch(**kwargs)
 
     def get_player(self):
@@ -387,15 +514,62 @@ def _ease(mode: str, amount: float) -> float:
 class StageRunner:
     """Execute one immutable, hierarchical StageProgram at a fixed tick rate."""
 
-    def __init__(self, program: StageProgram) -> None:
+    def __init__(
+        self,
+        program: StageProgram,
+        *,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        checkpoint_budget_bytes: int = DEFAULT_CHECKPOINT_BUDGET_BYTES,
+        trace_mode: str = "full",
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+        spawn_trace_capacity: int = DEFAULT_SPAWN_TRACE_CAPACITY,
+        audio_trace_capacity: int = DEFAULT_AUDIO_TRACE_CAPACITY,
+    ) -> None:
+        if trace_mode not in STAGE_TRACE_MODES:
+            raise ValueError(f"trace_mode must be one of {', '.join(STAGE_TRACE_MODES)}")
+        if isinstance(trace_capacity, bool) or not isinstance(trace_capacity, int) or trace_capacity < 1:
+            raise ValueError("trace_capacity must be a positive integer")
+        if (
+            isinstance(audio_trace_capacity, bool)
+            or not isinstance(audio_trace_capacity, int)
+            or audio_trace_capacity < 1
+        ):
+            raise ValueError("audio_trace_capacity must be a positive integer")
+        if (
+            isinstance(checkpoint_interval, bool)
+            or not isinstance(checkpoint_interval, int)
+            or checkpoint_interval < 0
+        ):
+            raise ValueError("checkpoint_interval must be a non-negative integer")
         self.program = program
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = CheckpointRing(checkpoint_budget_bytes)
+        self._checkpoint_context: Any | None = None
+        self._checkpoint_player: tuple[float, float] | None = None
         self.state = StageRunnerState.STOPPED
         self.frame = 0
         self.last_error: StageRuntimeError | None = None
         self.node_state: dict[str, dict[str, Any]] = {}
-        self.trace: list[StageTraceEvent] = []
+        # ``trace`` keeps the newest semantic events; spawn records live in
+        # the columnar ``spawn_trace`` and are mirrored into ``trace`` only in
+        # "full" mode.  "off" records neither.  Audio events are always kept
+        # in their own ring so BGM restore does not depend on ``trace``; events
+        # leaving that ring are folded into ``_audio_base`` first.
+        self.trace_mode = trace_mode
+        self.trace: deque[StageTraceEvent] = deque(maxlen=trace_capacity)
+        self.spawn_trace = SpawnTraceBuffer(spawn_trace_capacity)
+        self._audio_trace: deque[StageTraceEvent] = deque(maxlen=audio_trace_capacity)
+        self._audio_base: tuple[str, dict[str, Any], str, str, str | None] | None = None
         self.last_events: tuple[StageTraceEvent, ...] = ()
         self._active_patterns: dict[tuple[str, str, int], _ActivePattern] = {}
+        # Tick order of ``_active_patterns`` as ((state depth, schedule order,
+        # start sequence), key), with depths taken from ``_pattern_order_path``.
+        # Starts and stops bisect into it through ``_pattern_entries``; it is
+        # only re-sorted when the active state path changes.
+        self._pattern_order: list[tuple[tuple[Any, ...], tuple[str, str, int]]] = []
+        self._pattern_entries: dict[tuple[str, str, int], tuple[tuple[Any, ...], tuple[str, str, int]]] = {}
+        self._pattern_order_path: tuple[str, ...] = ()
+        self._pattern_sequence = itertools.count()
         self._context: Any | None = None
         self._audio_started = False
         self._audio_paused = False
@@ -410,6 +584,8 @@ class StageRunner:
         self._actions_by_state = self._group_by_state(program.actions)
         self._variable_automations_by_state = self._group_by_state(program.variable_automations)
         self.variables = VariableStore(program.variable_specs)
+        # Timeline writers compiled by VariableStore.compile_writer, per clip.
+        self._variable_writers: dict[str, Any] = {}
         self._automation_values = {
             item.clip_id: tuple(keyframe.value for keyframe in item.keyframes)
             for item in program.automations
@@ -425,6 +601,7 @@ class StageRunner:
         self._local_frames: dict[str, int] = {}
         self._completed_children: set[str] = set()
         self._requested_state_completions: set[str] = set()
+        self._state_entries: dict[str, int] = {}
         # Capture the reset baseline immediately so replay metadata is useful
         # before the first start/reset call as well as after it.
         self.initial_variable_snapshot: dict[str, dict[str, dict[str, Any]]] = self.variables.snapshot()
@@ -597,7 +774,7 @@ class StageRunner:
                 events,
                 dispatch=dispatch_actions,
             )
-            self.trace.extend(events)
+            self._record_trace(events)
             self.last_events = tuple(events)
 
     def pause(self) -> None:
@@ -635,10 +812,14 @@ class StageRunner:
         self._local_frames.clear()
         self._completed_children.clear()
         self._requested_state_completions.clear()
+        self._state_entries.clear()
         self.frame = 0
         self.state = StageRunnerState.STOPPED
         self.last_error = None
         self.trace.clear()
+        self.spawn_trace.clear()
+        self._audio_trace.clear()
+        self._audio_base = None
         self.last_events = ()
         self._restore_node_state()
         self.variables.reset()
@@ -662,6 +843,70 @@ class StageRunner:
             item.runner.stop(context, clear_owned=clear_owned and context is not None)
             self._destroy_pattern_scopes(item)
         self._active_patterns.clear()
+        self._pattern_order.clear()
+        self._pattern_entries.clear()
+
+    def _pattern_depth(self, state_id: str) -> int:
+        path = self._pattern_order_path
+        return path.index(state_id) if state_id in path else 10_000
+
+    def _add_active_pattern(self, key: tuple[str, str, int], item: _ActivePattern) -> None:
+        if key in self._active_patterns:
+            self._remove_active_pattern(key)
+        entry = (
+            (
+                self._pattern_depth(item.state_id),
+                item.schedule.order_key,
+                next(self._pattern_sequence),
+            ),
+            key,
+        )
+        self._active_patterns[key] = item
+        self._pattern_entries[key] = entry
+        bisect.insort(self._pattern_order, entry)
+
+    def _remove_active_pattern(self, key: tuple[str, str, int]) -> _ActivePattern:
+        # Start sequences are unique, so bisect finds exactly this entry.
+        entry = self._pattern_entries.pop(key)
+        del self._pattern_order[bisect.bisect_left(self._pattern_order, entry)]
+        return self._active_patterns.pop(key)
+
+    def _ordered_active_patterns(self, path: tuple[str, ...]) -> list[_ActivePattern]:
+        """Active patterns in tick order for the state ``path``."""
+        if path != self._pattern_order_path:
+            self._pattern_order_path = path
+            self._pattern_order = sorted(
+                (
+                    (self._pattern_depth(self._active_patterns[key].state_id), order_key, sequence),
+                    key,
+                )
+                for ((_, order_key, sequence), key) in self._pattern_entries.values()
+            )
+            self._pattern_entries = {entry[1]: entry for entry in self._pattern_order}
+        return [self._active_patterns[key] for _, key in self._pattern_order]
+
+    def _pattern_emission_due(self, items: list[_ActivePattern]) -> list[bool | None]:
+        """Batch emission checks of runners that share a compiled program.
+
+        ``None`` leaves a runner on its full tick path: it is alone in its
+        group, not running, or its timing depends on bindings or a script.
+        """
+
+        from src.pattern import PatternRunner, PatternRunnerState
+
+        due: list[bool | None] = [None] * len(items)
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            runner = item.runner
+            if runner.state == PatternRunnerState.RUNNING and runner.static_timing:
+                groups.setdefault(runner.program.content_hash, []).append(index)
+        for indices in groups.values():
+            if len(indices) < 2:
+                continue
+            mask = PatternRunner.emission_due_batch([items[index].runner for index in indices])
+            for index, value in zip(indices, mask.tolist()):
+                due[index] = value
+        return due
 
     def _destroy_pattern_scopes(self, item: _ActivePattern) -> None:
         for scope, owner in (("behavior", item.runner.instance_id), ("clip", item.schedule.clip_id)):
@@ -676,7 +921,7 @@ class StageRunner:
         if current >= self.program.duration_frames:
             events: list[StageTraceEvent] = []
             self._finish(context, events=events, dispatch=dispatch_actions)
-            self.trace.extend(events)
+            self._record_trace(events)
             self.last_events = tuple(events)
             return StageTickResult(
                 current,
@@ -718,24 +963,41 @@ class StageRunner:
                     events,
                     dispatch=dispatch_actions,
                 )
-            depth_order = {state_id: index for index, state_id in enumerate(active_ids)}
-            for key in sorted(
-                self._active_patterns,
-                key=lambda value: (
-                    depth_order.get(value[0], 10_000),
-                    self._active_patterns[value].schedule.order_key,
-                ),
-            ):
-                item = self._active_patterns[key]
+            items = self._ordered_active_patterns(active_ids)
+            # Timing of static-schedule runners never reads the context, so
+            # the grouped check can run before any runner in this tick spawns.
+            due = self._pattern_emission_due(items)
+            for item, item_due in zip(items, due):
                 active_clip = item.schedule.clip_id
                 active_state_id = item.state_id
                 target_state = self.node_state.get(item.schedule.target_id or "", {})
                 if target_state.get("enabled", True) is False:
                     continue
-                result = item.runner.tick(_PatternContext(context, self, item.schedule))
+                if item_due is False:
+                    item.runner.tick_idle()
+                    continue
+                pattern_context = item.context
+                if pattern_context is None or pattern_context._context is not context:
+                    pattern_context = item.context = _PatternContext(context, self, item.schedule)
+                result = item.runner.tick(pattern_context)
                 if result.event is not None:
                     spawned_count += result.spawned_count
+                    if self.trace_mode == "off":
+                        continue
                     pattern_event = result.event
+                    spawn_hash = item.runner.spawn_trace.last_hash
+                    self.spawn_trace.append(
+                        current,
+                        item.schedule.clip_id,
+                        item.loop_index,
+                        pattern_event.loop_index,
+                        pattern_event.burst_index,
+                        pattern_event.requested_count,
+                        pattern_event.spawned_count,
+                        spawn_hash,
+                    )
+                    if self.trace_mode != "full":
+                        continue
                     events.append(
                         self._trace_event(
                             current,
@@ -750,7 +1012,7 @@ class StageRunner:
                                 "burst_index": pattern_event.burst_index,
                                 "requested_count": pattern_event.requested_count,
                                 "spawned_count": pattern_event.spawned_count,
-                                "spawn_hash": self._spawn_hash(pattern_event),
+                                "spawn_hash": f"{spawn_hash:016x}",
                             },
                             state_id=item.state_id,
                             local_frame=self._local_frames.get(item.state_id, 0),
@@ -800,7 +1062,7 @@ class StageRunner:
             self.state = StageRunnerState.ERROR
             raise error from exc
 
-        self.trace.extend(events)
+        self._record_trace(events)
         self.last_events = tuple(events)
         return StageTickResult(
             current,
@@ -831,17 +1093,26 @@ class StageRunner:
         *,
         dispatch_actions: bool = False,
     ) -> tuple[StageTickResult, ...]:
-        """Reset and replay fixed ticks to ``frame`` through the formal runner."""
+        """Replay fixed ticks to ``frame`` through the formal runner.
+
+        Without action dispatch the replay starts from the nearest recorded
+        checkpoint at or before ``frame`` (or from a reset at frame 0) and
+        records new checkpoints every ``checkpoint_interval`` frames.  The
+        returned results cover only the ticks that were actually replayed.
+        """
 
         if isinstance(frame, bool) or not isinstance(frame, int) or frame < 0:
             raise ValueError("frame must be a non-negative integer")
         if frame > self.program.duration_frames:
             raise ValueError("frame must not exceed stage duration")
-        self.reset(context)
-        self.start(context, reset=False, dispatch_actions=dispatch_actions)
+        checkpoint = None
+        if not dispatch_actions:
+            self._bind_checkpoint_context(context)
+            checkpoint = self.checkpoints.latest(frame)
+        self._begin_replay(context, checkpoint, dispatch_actions)
         results = tuple(
-            self.tick(context, dispatch_actions=dispatch_actions)
-            for _ in range(frame)
+            self._replay_tick(context, dispatch_actions)
+            for _ in range(frame - self.frame)
         )
         self.pause()
         self.replay_identity["actual_trigger_frames"] = [item.frame for item in self.trace]
@@ -871,11 +1142,12 @@ class StageRunner:
         *,
         dispatch_actions: bool = False,
     ) -> tuple[StageTickResult, ...]:
-        """Reset and replay to a deterministic local frame of one State.
+        """Replay to a deterministic local frame of one State.
 
         ``frame`` follows :meth:`seek`: it is the number of fixed ticks
         replayed after the State is entered, so actions scheduled on the
-        requested frame have not yet been dispatched.
+        requested frame have not yet been dispatched.  Checkpoints are used
+        only while the State's first entry has not overshot ``frame``.
         """
 
         if state_id not in self._states_by_id:
@@ -885,21 +1157,171 @@ class StageRunner:
             raise ValueError("state frame must be a non-negative integer")
         if state.duration_frames > 0 and frame >= state.duration_frames:
             raise ValueError("state frame must be less than the state duration")
-        self.reset(context)
-        self.start(context, reset=False, dispatch_actions=dispatch_actions)
+        checkpoint = None
+        if not dispatch_actions:
+            self._bind_checkpoint_context(context)
+            for candidate in self.checkpoints.newest_first():
+                entries = candidate.runner["state_entries"].get(state_id, 0)
+                local = candidate.runner["local_frames"].get(state_id)
+                if entries == 0 or (entries == 1 and local is not None and local <= frame):
+                    checkpoint = candidate
+                    break
+        self._begin_replay(context, checkpoint, dispatch_actions)
         results: list[StageTickResult] = []
         while state_id not in self.current_state_path:
             if self.state != StageRunnerState.RUNNING:
                 raise ValueError(f"state {state_id!r} was not reached during replay")
-            results.append(self.tick(context, dispatch_actions=dispatch_actions))
+            results.append(self._replay_tick(context, dispatch_actions))
         while self._local_frames.get(state_id, 0) < frame:
             if self.state != StageRunnerState.RUNNING or state_id not in self.current_state_path:
                 raise ValueError(f"state {state_id!r} ended before local frame {frame}")
-            results.append(self.tick(context, dispatch_actions=dispatch_actions))
+            results.append(self._replay_tick(context, dispatch_actions))
         self.pause()
         self.replay_identity["actual_trigger_frames"] = [item.frame for item in self.trace]
         return tuple(results)
 
+    def _begin_replay(
+        self,
+        context: Any,
+        checkpoint: StageCheckpoint | None,
+        dispatch_actions: bool,
+    ) -> None:
+        if checkpoint is None:
+            self.reset(context)
+            self.start(context, reset=False, dispatch_actions=dispatch_actions)
+        else:
+            self.restore_checkpoint(context, checkpoint)
+
+    def _replay_tick(self, context: Any, dispatch_actions: bool) -> StageTickResult:
+        result = self.tick(context, dispatch_actions=dispatch_actions)
+        interval = self.checkpoint_interval
+        if (
+            not dispatch_actions
+            and interval
+            and self.frame % interval == 0
+            and self.frame not in self.checkpoints
+        ):
+            checkpoint = self.capture_checkpoint(context)
+            if checkpoint is not None:
+                self.checkpoints.add(checkpoint.frame, checkpoint, checkpoint.nbytes)
+        return result
+
+    # ----- seek checkpoints -----
+
+    def _bind_checkpoint_context(self, context: Any) -> None:
+        # Checkpoints embed the context's pool and EventBus state, so they
+        # are only valid for the context that produced them.  Player aim
+        # reads the live player position, so moving it invalidates them too.
+        player = context_player_position(context)
+        if context is not self._checkpoint_context or player != self._checkpoint_player:
+            self.checkpoints.clear()
+            self._checkpoint_context = context
+            self._checkpoint_player = player
+
+    def capture_checkpoint(self, context: Any) -> StageCheckpoint | None:
+        """Capture the complete replay state at the current frame boundary.
+
+        Returns ``None`` when part of the simulation lives outside the
+        captured state: reactive clips, script-hosted patterns, or a context
+        that owns a pool/EventBus without ``capture_checkpoint`` support.
+        """
+
+        if self.state != StageRunnerState.RUNNING or self.reactive_timeline is not None:
+            return None
+        if not all(item.runner.supports_checkpoints for item in self._active_patterns.values()):
+            return None
+        supported, context_state = capture_context_checkpoint(context)
+        if not supported:
+            return None
+        runner_state = {
+            "frame": self.frame,
+            "node_state": copy.deepcopy(self.node_state),
+            "trace": tuple(self.trace),
+            "audio_trace": tuple(self._audio_trace),
+            "audio_base": self._audio_base,
+            "spawn_trace": self.spawn_trace.capture(),
+            "last_events": self.last_events,
+            "audio": (
+                self._audio_started,
+                self._audio_paused,
+                self._active_audio_clip_id,
+                self._active_audio_state_id,
+            ),
+            "active_graphs": tuple(self._active_graphs),
+            "active_states": tuple(self._active_states),
+            "local_frames": dict(self._local_frames),
+            "completed_children": frozenset(self._completed_children),
+            "requested_state_completions": frozenset(self._requested_state_completions),
+            "state_entries": dict(self._state_entries),
+            "variables": self.variables.capture_checkpoint(),
+            "patterns": tuple(
+                (
+                    key,
+                    item.state_id,
+                    item.schedule,
+                    item.loop_index,
+                    item.end_frame,
+                    item.runner.capture_checkpoint(),
+                )
+                for key, item in self._active_patterns.items()
+            ),
+        }
+        return StageCheckpoint(
+            self.frame,
+            runner_state,
+            context_state,
+            checkpoint_nbytes(runner_state) + checkpoint_nbytes(context_state),
+        )
+
+    def restore_checkpoint(self, context: Any, checkpoint: StageCheckpoint) -> None:
+        """Reset, then continue from ``checkpoint`` as if replayed linearly."""
+
+        from src.pattern import PatternRunner
+
+        self.reset(context)
+        state = checkpoint.runner
+        self.frame = state["frame"]
+        self.node_state = copy.deepcopy(state["node_state"])
+        self.trace.extend(state["trace"])
+        self._audio_trace.extend(state["audio_trace"])
+        self._audio_base = state["audio_base"]
+        self.spawn_trace.restore(state["spawn_trace"])
+        self.last_events = state["last_events"]
+        (
+            self._audio_started,
+            self._audio_paused,
+            self._active_audio_clip_id,
+            self._active_audio_state_id,
+        ) = state["audio"]
+        self._active_graphs = list(state["active_graphs"])
+        self._active_states = list(state["active_states"])
+        self._local_frames = dict(state["local_frames"])
+        self._completed_children = set(state["completed_children"])
+        self._requested_state_completions = set(state["requested_state_completions"])
+        self._state_entries = dict(state["state_entries"])
+        self.variables.restore_checkpoint(state["variables"])
+        for key, state_id, schedule, loop_index, end_frame, runner_state in state["patterns"]:
+            runner = PatternRunner(
+                schedule.program,
+                instance_id=runner_state["instance_id"],
+                owner_tag=runner_state["owner_tag"],
+            )
+            runner.restore_checkpoint(runner_state)
+            self._add_active_pattern(
+                key,
+                _ActivePattern(
+                    state_id=state_id,
+                    schedule=schedule,
+                    loop_index=loop_index,
+                    end_frame=end_frame,
+                    runner=runner,
+                    context=_PatternContext(context, self, schedule),
+                ),
+            )
+        if checkpoint.context is not None:
+            context.restore_checkpoint(checkpoint.context)
+        self.state = StageRunnerState.RUNNING
+
     def reset_clip(
         self,
         context: Any,
@@ -955,6 +1377,7 @@ class StageRunner:
         self._active_graphs.append(graph)
         self._active_states.append(state)
         self._local_frames[state.state_id] = 0
+        self._state_entries[state.state_id] = self._state_entries.get(state.state_id, 0) + 1
         self.variables.enter_scope("state", state.state_id)
         if self.reactive_timeline is not None:
             self.reactive_timeline.enter_state(state.state_id, self.frame)
@@ -1151,7 +1574,7 @@ class StageRunner:
             if item.state_id == state_id and (force or item.end_frame <= local_frame)
         ]
         for key in sorted(expired):
-            item = self._active_patterns.pop(key)
+            item = self._remove_active_pattern(key)
             item.runner.stop(context, clear_owned=True)
             self._destroy_pattern_scopes(item)
             events.append(
@@ -1189,20 +1612,25 @@ class StageRunner:
             from src.pattern import PatternRunner
 
             runner = PatternRunner(schedule.program)
+            pattern_context = _PatternContext(context, self, schedule)
             self.variables.enter_scope("clip", schedule.clip_id)
             self.variables.enter_scope("behavior", runner.instance_id)
             try:
-                runner.start(_PatternContext(context, self, schedule), reset=False)
+                runner.start(pattern_context, reset=False)
             except Exception:
                 self.variables.exit_scope("behavior", runner.instance_id)
                 self.variables.exit_scope("clip", schedule.clip_id)
                 raise
-            self._active_patterns[key] = _ActivePattern(
-                state_id=state_id,
-                schedule=schedule,
-                loop_index=loop_index,
-                end_frame=local_frame + schedule.duration_frames,
-                runner=runner,
+            self._add_active_pattern(
+                key,
+                _ActivePattern(
+                    state_id=state_id,
+                    schedule=schedule,
+                    loop_index=loop_index,
+                    end_frame=local_frame + schedule.duration_frames,
+                    runner=runner,
+                    context=pattern_context,
+                ),
             )
             events.append(
                 self._trace_event(
@@ -1301,18 +1729,20 @@ class StageRunner:
                 local = item.duration_frames
             value = self._automation_value(item, local)
             try:
-                self.variables.write(
-                    item.ref,
-                    value,
-                    writer="timeline",
-                    operation=item.operation,
-                    owner_id=item.owner_id or (state_id if item.variable_scope == "state" else None),
-                    frame=global_frame,
-                    order=item.order_key[1],
-                    reducer=item.reducer,
-                )
+                write = self._variable_writers.get(item.clip_id)
+                if write is None:
+                    write = self._variable_writers[item.clip_id] = self.variables.compile_writer(
+                        item.ref,
+                        writer="timeline",
+                        operation=item.operation,
+                        owner_id=item.owner_id or (state_id if item.variable_scope == "state" else None),
+                        reducer=item.reducer,
+                    )
+                changed = write(value, frame=global_frame, order=item.clip_order)
             except VariableError as exc:
                 raise ValueError(str(exc)) from exc
+            if not changed:
+                continue
             events.append(
                 self._trace_event(
                     global_frame,
@@ -1497,29 +1927,9 @@ class StageRunner:
         self._stop_audio()
         if self.state == StageRunnerState.FINISHED:
             return
-        state: tuple[str, dict[str, Any], str, str, str | None] | None = None
-        for item in self.trace:
-            if item.kind != "audio":
-                continue
-            payload = dict(item.value)
-            bus = str(payload.get("bus") or item.channel or "se").lower()
-            if bus != "bgm":
-                continue
-            action = str(payload.get("action", "play"))
-            if action == "play":
-                state = ("play", payload, item.channel, item.clip_id, item.state_id)
-            elif action == "stop":
-                if (
-                    payload.get("automatic") is True
-                    and state is not None
-                    and state[3] != item.clip_id
-                ):
-                    continue
-                state = None
-            elif action == "pause" and state is not None:
-                state = ("pause", state[1], state[2], state[3], state[4])
-            elif action == "resume" and state is not None:
-                state = ("play", state[1], state[2], state[3], state[4])
+        state = self._audio_base
+        for item in self._audio_trace:
+            state = self._fold_bgm_state(state, item)
         if state is None or self._context is None:
             return
         mode, payload, channel, clip_id, state_id = state
@@ -1536,6 +1946,43 @@ class StageRunner:
                 hook()
                 self._audio_paused = True
 
+    @staticmethod
+    def _fold_bgm_state(
+        state: tuple[str, dict[str, Any], str, str, str | None] | None,
+        item: StageTraceEvent,
+    ) -> tuple[str, dict[str, Any], str, str, str | None] | None:
+        payload = dict(item.value)
+        bus = str(payload.get("bus") or item.channel or "se").lower()
+        if bus != "bgm":
+            return state
+        action = str(payload.get("action", "play"))
+        if action == "play":
+            return ("play", payload, item.channel, item.clip_id, item.state_id)
+        if action == "stop":
+            if (
+                payload.get("automatic") is True
+                and state is not None
+                and state[3] != item.clip_id
+            ):
+                return state
+            return None
+        if action == "pause" and state is not None:
+            return ("pause", state[1], state[2], state[3], state[4])
+        if action == "resume" and state is not None:
+            return ("play", state[1], state[2], state[3], state[4])
+        return state
+
+    def _record_trace(self, events: list[StageTraceEvent]) -> None:
+        if self.trace_mode != "off":
+            self.trace.extend(events)
+        audio = self._audio_trace
+        for item in events:
+            if item.kind != "audio":
+                continue
+            if len(audio) == audio.maxlen:
+                self._audio_base = self._fold_bgm_state(self._audio_base, audio[0])
+            audio.append(item)
+
     @staticmethod
     def _trace_event(
         frame: int,
@@ -1569,30 +2016,24 @@ class StageRunner:
             transition_id=transition_id,
         )
 
-    @staticmethod
-    def _spawn_hash(event: Any) -> str:
-        payload = json.dumps(
-            {
-                "positions": event.positions,
-                "angles": event.angles,
-                "speeds": event.speeds,
-            },
-            sort_keys=True,
-            separators=(",", ":"),
-            allow_nan=False,
-        )
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
 
 __all__ = [
+    "DEFAULT_AUDIO_TRACE_CAPACITY",
+    "DEFAULT_CHECKPOINT_BUDGET_BYTES",
+    "DEFAULT_CHECKPOINT_INTERVAL",
+    "DEFAULT_SPAWN_TRACE_CAPACITY",
+    "DEFAULT_TRACE_CAPACITY",
     "PatternSchedule",
     "StageAction",
     "StageAutomation",
+    "StageCheckpoint",
     "StageKeyframe",
     "StageNode",
     "StageProgram",
     "StageRunner",
     "StageRunnerState",
+    "STAGE_TRACE_MODES",
+    "SpawnTraceBuffer",
     "StageRuntimeError",
     "StageState",
     "StageStateGraph",
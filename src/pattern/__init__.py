@@ -6,6 +6,7 @@ from .compiler import (
     PatternCompiler,
     PatternDiagnostic,
     compile_pattern,
+    pattern_cache_dir,
 )
 from .curves import (
     CURVE_INTERPOLATIONS,
@@ -13,6 +14,7 @@ from .curves import (
     CurveDocument,
     CurveDocumentError,
     CurveKeyframe,
+    CurveSampler,
 )
 from .document import (
     AIM_MODES,
@@ -27,11 +29,14 @@ from .document import (
     ShapeSpec,
 )
 from .expressions import (
+    BULLET_VARIABLES,
     EXPRESSION_VARIABLES,
     CompiledExpression,
     ExpressionError,
     compile_expression,
+    expression_evaluator,
     parse_expression,
+    vector_evaluator,
 )
 from .graph import (
     GRAPH_NODE_CATEGORIES,
@@ -45,6 +50,7 @@ from .runtime import (
     PatternRunnerState,
     PatternRuntimeError,
     PatternSpawnEvent,
+    PatternSpawnTrace,
     PatternTickResult,
 )
 from .presets import (
@@ -86,6 +92,8 @@ __all__ = [
     "CurveDocument",
     "CurveDocumentError",
     "CurveKeyframe",
+    "CurveSampler",
+    "BULLET_VARIABLES",
     "EXPRESSION_VARIABLES",
     "ExpressionError",
     "GRAPH_NODE_CATEGORIES",
@@ -101,6 +109,7 @@ __all__ = [
     "PatternRunnerState",
     "PatternRuntimeError",
     "PatternSpawnEvent",
+    "PatternSpawnTrace",
     "PatternTickResult",
     "PresetDescriptor",
     "PresetDependencyLock",
@@ -123,5 +132,8 @@ __all__ = [
     "VirtualPresetNode",
     "compile_expression",
     "compile_pattern",
+    "expression_evaluator",
     "parse_expression",
+    "pattern_cache_dir",
+    "vector_evaluator",
 ]
@@ -111,7 +111,8 @@ class CompiledBinding:
     """Immutable data-only binding carried by ``PatternProgram``.
 
     ``curve_frames`` / ``curve_values`` / ``curve_interpolation`` /
-    ``curve_default`` hold the sampled curve data; ``expression_source`` /
+    ``curve_default`` hold the sampled curve data and ``curve_coefficients``
+    its precomputed per-segment terms; ``expression_source`` /
     ``expression_node`` hold the portable expression tree. Neither field ever
     holds a callable.
     """
@@ -123,5 +124,6 @@ class CompiledBinding:
     curve_values: tuple[float, ...] = ()
     curve_interpolation: str = "linear"
     curve_default: float = 0.0
+    curve_coefficients: tuple[tuple[float, ...], ...] = ()
     expression_source: str | None = None
     expression_node: tuple | None = None
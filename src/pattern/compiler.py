@@ -5,18 +5,29 @@ from __future__ import annotations
 import ast
 import hashlib
 import json
+import io
 import math
 import random
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, fields, is_dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
+
+import numpy as np
 
 from src.authoring.resources import ResourceDocumentError, ResourceReference
+from src.core.atomic_io import atomic_write_bytes
 from src.core.project_context import ProjectContext
 
 from .bindings import BindingSpec, CompiledBinding
-from .document import PatternDocument, PatternDocumentError
-from .expressions import ExpressionError, compile_expression
+from .document import (
+    ModifierSpec,
+    MotionSpec,
+    PatternDocument,
+    PatternDocumentError,
+    ShapeSpec,
+)
+from .expressions import BULLET_VARIABLES, ExpressionError, compile_expression
 from .graph import (
     GRAPH_NODE_CATEGORIES,
     NODE_TYPES,
@@ -30,6 +41,10 @@ from .script import ScriptBehavior, ScriptProgramData
 
 SpriteIndexResolver = Callable[[str], int]
 MAX_COMPILED_BULLETS = 1_000_000
+PATTERN_CACHE_DIR = Path(".pystg_cache") / "patterns"
+PATTERN_CACHE_LIMIT = 64 * 1024 * 1024
+# Bump when compiler output changes for an unchanged content hash.
+PATTERN_CACHE_SCHEMA = 1
 
 
 @dataclass(frozen=True)
@@ -70,6 +85,79 @@ def _diagnostic(
     )
 
 
+TRAJECTORY_TRACK_KEYS = {"speed_keys": "speed", "turn_keys": "turn"}
+
+
+def _trajectory_tracks(
+    document: PatternDocument,
+) -> tuple[tuple[str, tuple[tuple[float, float], ...]], ...]:
+    """Validate ``keyframed`` trajectory keys from pattern metadata.
+
+    ``speed_keys`` hold speed per second and ``turn_keys`` angular velocity
+    in degrees per second, each as ``[frame, value]`` pairs with strictly
+    increasing frames. The bullet kernel interpolates them linearly.
+    """
+
+    trajectory = document.header.metadata.get("trajectory") or {}
+    if trajectory.get("kind") != "keyframed":
+        return ()
+    tracks: list[tuple[str, tuple[tuple[float, float], ...]]] = []
+    for field_name, track_name in TRAJECTORY_TRACK_KEYS.items():
+        raw = trajectory.get(field_name)
+        if raw is None:
+            continue
+        path = f"metadata.trajectory.{field_name}"
+        keys: list[tuple[float, float]] = []
+        for item in raw if isinstance(raw, (list, tuple)) else (None,):
+            if (
+                not isinstance(item, (list, tuple))
+                or len(item) != 2
+                or any(
+                    isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                    or not math.isfinite(value)
+                    for value in item
+                )
+            ):
+                raise PatternCompileError(
+                    (
+                        _diagnostic(
+                            document,
+                            "invalid_trajectory",
+                            path,
+                            "keys must be finite [frame, value] pairs",
+                        ),
+                    )
+                )
+            frame, value = float(item[0]), float(item[1])
+            if frame < 0 or (keys and frame <= keys[-1][0]):
+                raise PatternCompileError(
+                    (
+                        _diagnostic(
+                            document,
+                            "invalid_trajectory",
+                            path,
+                            "key frames must be non-negative and strictly increasing",
+                        ),
+                    )
+                )
+            keys.append((frame, value))
+        if keys:
+            tracks.append((track_name, tuple(keys)))
+    if not tracks:
+        raise PatternCompileError(
+            (
+                _diagnostic(
+                    document,
+                    "invalid_trajectory",
+                    "metadata.trajectory",
+                    "keyframed trajectories need speed_keys or turn_keys",
+                ),
+            )
+        )
+    return tuple(tracks)
+
+
 # Bindable numeric/bool property paths. Boolean properties reject numeric
 # bindings with ``binding_type_mismatch``; unknown paths reject with
 # ``unknown_binding_target``.
@@ -97,6 +185,12 @@ BINDABLE_TARGETS = {
     "modifiers.speed_offset_per_burst": "float",
     "modifiers.random_speed_variation": "float",
 }
+# Bind-only targets without a document property, evaluated once per bullet
+# over a burst: expressions may also read ``index`` and ``count``.
+PER_BULLET_TARGETS = {
+    "bullet.angle_offset": "float",
+    "bullet.speed_scale": "float",
+}
 
 
 def _number(properties: dict, key: str, default: float) -> float:
@@ -482,12 +576,80 @@ def build_burst_template(
     else:  # PatternDocument validation makes this unreachable.
         raise PatternDocumentError("shape.kind", f"unsupported shape {shape.kind!r}")
 
-    return BurstTemplate(
-        position_offsets=tuple(
-            (_clean(x), _clean(y)) for x, y in positions
+    return BurstTemplate.from_values(
+        [(_clean(x), _clean(y)) for x, y in positions],
+        [_clean(value) for value in angles],
+        [_clean(base_speed * factor) for factor in speed_factors],
+    )
+
+
+def burst_template_key(
+    *,
+    kind: str,
+    count: int,
+    angle_span: float,
+    line_length: float,
+    line_angle: float,
+    speed: float,
+    angle_offset_per_burst: float,
+    speed_offset_per_burst: float,
+    random_speed_variation: float,
+    seed: int,
+    burst_index: int,
+) -> tuple:
+    """Return the parameter tuple that identifies one burst.
+
+    Floats are keyed exactly, so a cached template is always the one
+    :func:`build_burst_template` would return for these inputs.  Only
+    ``-0.0``/``0.0`` share an entry, and ``_clean`` makes their output equal.
+    """
+    return (
+        kind,
+        int(count),
+        float(angle_span),
+        float(line_length),
+        float(line_angle),
+        float(speed),
+        float(angle_offset_per_burst),
+        float(speed_offset_per_burst),
+        float(random_speed_variation),
+        int(seed) if kind == "random" else 0,
+        int(burst_index),
+    )
+
+
+@lru_cache(maxsize=4096)
+def cached_burst_template(key: tuple) -> BurstTemplate:
+    """Build (once) the burst identified by :func:`burst_template_key`."""
+    (
+        kind,
+        count,
+        angle_span,
+        line_length,
+        line_angle,
+        speed,
+        angle_offset_per_burst,
+        speed_offset_per_burst,
+        random_speed_variation,
+        seed,
+        burst_index,
+    ) = key
+    return build_burst_template(
+        shape=ShapeSpec(
+            kind=kind,
+            count=count,
+            angle_span=angle_span,
+            line_length=line_length,
+            line_angle=line_angle,
         ),
-        angle_offsets=tuple(_clean(value) for value in angles),
-        speeds=tuple(_clean(base_speed * factor) for factor in speed_factors),
+        motion=MotionSpec(speed=speed),
+        modifiers=ModifierSpec(
+            angle_offset_per_burst=angle_offset_per_burst,
+            speed_offset_per_burst=speed_offset_per_burst,
+            random_speed_variation=random_speed_variation,
+        ),
+        seed=seed,
+        burst_index=burst_index,
     )
 
 
@@ -504,15 +666,204 @@ def _shape_values(
     )
 
 
+def pattern_cache_dir(project: ProjectContext) -> Path:
+    """Return the project's on-disk compiled pattern cache directory."""
+    return project.root / PATTERN_CACHE_DIR
+
+
+def _module_version() -> str:
+    """Digest of this package's sources; compiler edits invalidate entries."""
+    hasher = hashlib.blake2b(digest_size=8)
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        hasher.update(path.name.encode("utf-8"))
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+_CACHE_VERSION = _module_version()
+_CACHE_DATACLASSES = {
+    cls.__name__: cls for cls in (PatternProgram, CompiledBinding, ScriptProgramData)
+}
+# Entries also record the IR field layout, so adding a program field
+# invalidates old entries even without a schema bump.
+_CACHE_FINGERPRINT = f"{PATTERN_CACHE_SCHEMA}|{_CACHE_VERSION}|" + "|".join(
+    f"{cls.__name__}:{','.join(item.name for item in fields(cls))}"
+    for cls in _CACHE_DATACLASSES.values()
+)
+
+
+def _encode_cached(value: Any) -> Any:
+    """Encode program data as tagged JSON; anything else is not cacheable."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple):
+        return {"tuple": [_encode_cached(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_cached(item) for item in value]
+    if isinstance(value, dict):
+        return {"dict": [[_encode_cached(k), _encode_cached(v)] for k, v in value.items()]}
+    if is_dataclass(value) and _CACHE_DATACLASSES.get(type(value).__name__) is type(value):
+        return {
+            "dataclass": type(value).__name__,
+            "fields": {
+                item.name: _encode_cached(getattr(value, item.name))
+                for item in fields(value)
+                if item.name != "templates"
+            },
+        }
+    raise TypeError(f"{type(value).__name__} is not cacheable")
+
+
+def _decode_cached(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_decode_cached(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "tuple" in data:
+        return tuple(_decode_cached(item) for item in data["tuple"])
+    if "dict" in data:
+        return {_decode_cached(k): _decode_cached(v) for k, v in data["dict"]}
+    cls = _CACHE_DATACLASSES[data["dataclass"]]
+    return cls(**{name: _decode_cached(value) for name, value in data["fields"].items()})
+
+
+def _encode_program(program: PatternProgram) -> bytes:
+    """Serialize ``program`` as an ``.npz`` that loads without pickle."""
+    counts = np.array([item.count for item in program.templates], dtype=np.int64)
+    meta = json.dumps(
+        {"fingerprint": _CACHE_FINGERPRINT, "program": _encode_cached(program)},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    stream = io.BytesIO()
+    np.savez(
+        stream,
+        meta=np.array(meta),
+        counts=counts,
+        offsets=np.concatenate([item.offset_array for item in program.templates] or [np.empty((0, 2))]),
+        angles=np.concatenate([item.angle_array for item in program.templates] or [np.empty(0)]),
+        speeds=np.concatenate([item.speed_array for item in program.templates] or [np.empty(0)]),
+    )
+    return stream.getvalue()
+
+
+def _decode_program(path: Path) -> PatternProgram | None:
+    with np.load(path, allow_pickle=False) as archive:
+        meta = json.loads(str(archive["meta"]))
+        if meta.get("fingerprint") != _CACHE_FINGERPRINT:
+            return None
+        counts = archive["counts"].tolist()
+        offsets, angles, speeds = archive["offsets"], archive["angles"], archive["speeds"]
+    bounds = np.cumsum([0, *counts]).tolist()
+    templates = tuple(
+        BurstTemplate.from_values(
+            offsets[start:stop], angles[start:stop], speeds[start:stop]
+        )
+        for start, stop in zip(bounds, bounds[1:])
+    )
+    data = meta["program"]
+    if data.get("dataclass") != PatternProgram.__name__:
+        return None
+    return PatternProgram(
+        templates=templates,
+        **{name: _decode_cached(value) for name, value in data["fields"].items()},
+    )
+
+
 class PatternCompiler:
-    """Compiler with content/dependency keyed in-memory caching."""
+    """Compiler with content/dependency keyed in-memory caching.
+
+    With ``cache_dir`` set, programs are also stored there as
+    ``<content_hash>-<module version>.npz`` so later processes skip template
+    generation.  Entries are plain arrays plus tagged JSON read with
+    ``allow_pickle=False``, so a cache file cannot run code.  They record the
+    cache schema, compiler source digest and IR field layout; a mismatched,
+    unreadable or corrupt entry is treated as a miss and rewritten.  Each
+    write removes entries of other module versions and evicts the least
+    recently used files once the directory grows past ``disk_limit`` bytes.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        *,
+        disk_limit: int = PATTERN_CACHE_LIMIT,
+    ) -> None:
         self._cache: dict[str, PatternProgram] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.disk_limit = max(0, int(disk_limit))
+        self.disk_hits = 0
+        self.disk_writes = 0
 
     def clear_cache(self) -> None:
         self._cache.clear()
 
+    def _disk_path(self, content_hash: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{content_hash}-{_CACHE_VERSION}.npz"
+
+    def _load_cached(self, content_hash: str) -> PatternProgram | None:
+        path = self._disk_path(content_hash)
+        if path is None:
+            return None
+        try:
+            program = _decode_program(path)
+        except Exception:  # noqa: BLE001 - missing or unreadable entries are misses
+            return None
+        if program is None or program.content_hash != content_hash:
+            return None
+        try:
+            # Touch the entry so eviction sees it as recently used.
+            path.touch()
+        except OSError:
+            pass
+        self.disk_hits += 1
+        return program
+
+    def _store_cached(self, program: PatternProgram) -> None:
+        path = self._disk_path(program.content_hash)
+        if path is None:
+            return
+        try:
+            payload = _encode_program(program)
+        except TypeError:
+            return
+        try:
+            atomic_write_bytes(path, payload)
+        except OSError:
+            return
+        self.disk_writes += 1
+        self._evict_cached(keep=path)
+
+    def _evict_cached(self, keep: Path) -> None:
+        """Drop other-version entries, then the least recently used past ``disk_limit``."""
+        try:
+            total = keep.stat().st_size
+        except OSError:
+            return
+        entries = []
+        for path in keep.parent.glob("*.npz"):
+            if path == keep:
+                continue
+            try:
+                if path.stem.rpartition("-")[2] != _CACHE_VERSION:
+                    path.unlink()
+                    continue
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, path, stat.st_size))
+            total += stat.st_size
+        for _, path, size in sorted(entries):
+            if total <= self.disk_limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
     def compile(
         self,
         document: PatternDocument,
@@ -590,6 +941,10 @@ class PatternCompiler:
         cached = self._cache.get(content_hash)
         if cached is not None:
             return cached
+        cached = self._load_cached(content_hash)
+        if cached is not None:
+            self._cache[content_hash] = cached
+            return cached
 
         compiled_bullets = compile_doc.shape.count * compile_doc.schedule.burst_count
         if compiled_bullets > MAX_COMPILED_BULLETS:
@@ -615,6 +970,8 @@ class PatternCompiler:
                 (_diagnostic(compile_doc, "invalid_program", exc.path, exc.detail),)
             ) from exc
 
+        trajectory_tracks = _trajectory_tracks(compile_doc)
+
         program = PatternProgram(
             resource_id=compile_doc.id,
             schema_version=compile_doc.schema_version,
@@ -671,6 +1028,7 @@ class PatternCompiler:
                     and not isinstance(value, bool)
                 )
             ),
+            trajectory_tracks=trajectory_tracks,
             termination_reaction=tuple(
                 sorted(
                     (str(key), value)
@@ -683,6 +1041,7 @@ class PatternCompiler:
             ),
         )
         self._cache[content_hash] = program
+        self._store_cached(program)
         return program
 
     def _compile_bindings(
@@ -712,7 +1071,7 @@ class PatternCompiler:
         tokens: list[str] = []
         for index, binding in enumerate(bindings):
             path = diagnostic_paths[index] if index < len(diagnostic_paths) else binding.path
-            target = BINDABLE_TARGETS.get(binding.path)
+            target = BINDABLE_TARGETS.get(binding.path) or PER_BULLET_TARGETS.get(binding.path)
             if target is None:
                 raise PatternCompileError(
                     (
@@ -779,12 +1138,20 @@ class PatternCompiler:
                         curve_values=curve_data["values"],
                         curve_interpolation=curve_data["interpolation"],
                         curve_default=curve_data["default"],
+                        curve_coefficients=curve_data["coefficients"],
                     )
                 )
                 tokens.append(token)
             elif binding.kind == "expression":
                 try:
-                    compiled_expression = compile_expression(binding.value)
+                    compiled_expression = compile_expression(
+                        binding.value,
+                        extra_variables=(
+                            BULLET_VARIABLES
+                            if binding.path in PER_BULLET_TARGETS
+                            else frozenset()
+                        ),
+                    )
                 except ExpressionError as exc:
                     raise PatternCompileError(
                         (
@@ -875,7 +1242,11 @@ class PatternCompiler:
                     ),
                 )
             ) from exc
-        from src.pattern.curves import CurveDocument, CurveDocumentError
+        from src.pattern.curves import (
+            CurveDocument,
+            CurveDocumentError,
+            curve_coefficients,
+        )
 
         try:
             curve = CurveDocument.from_dict(payload)
@@ -892,12 +1263,14 @@ class PatternCompiler:
             ) from exc
         dependency_hash = hashlib.sha256(source_bytes).hexdigest()
         token = f"{reference.uri}:{dependency_hash}"
+        values = tuple(item.value for item in curve.keyframes)
         return (
             {
                 "frames": tuple(item.frame for item in curve.keyframes),
-                "values": tuple(item.value for item in curve.keyframes),
+                "values": values,
                 "interpolation": curve.interpolation,
                 "default": curve.default,
+                "coefficients": curve_coefficients(values, curve.interpolation),
             },
             token,
         )
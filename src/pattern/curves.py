@@ -11,13 +11,20 @@ Established curve-resource contract:
 
   ``y(t) = 0.5 * (2*P1 + (-P0+P2)*t + (2*P0-5*P1+4*P2-P3)*t^2
   + (-P0+3*P1-3*P2+P3)*t^3)`` with t in [0, 1].
+
+``curve_coefficients`` precomputes those per-segment terms once;
+``CurveSampler`` evaluates them with a last-segment cursor (falling back to
+``bisect``) and samples whole frame arrays for timeline previews.
 """
 
 from __future__ import annotations
 
+import bisect
 import math
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
+
+import numpy as np
 
 from src.authoring.resources import (
     CURVE_RESOURCE_TYPE,
@@ -110,6 +117,22 @@ class CurveDocument:
                 )
             previous = keyframe.frame
 
+    def sampler(self) -> "CurveSampler":
+        """Return a precomputed-segment sampler with the same semantics."""
+        frames = tuple(item.frame for item in self.keyframes)
+        values = tuple(item.value for item in self.keyframes)
+        return CurveSampler(
+            frames,
+            curve_coefficients(values, self.interpolation),
+            self.interpolation,
+            self.default,
+            values[-1] if values else self.default,
+        )
+
+    def sample_array(self, frames: Any) -> np.ndarray:
+        """Sample every frame in ``frames`` at once, e.g. for a timeline lane."""
+        return self.sampler().sample_array(frames)
+
     def evaluate(self, frame: float) -> float:
         """Sample the curve at ``frame`` with clamp/default semantics."""
         if not self.keyframes:
@@ -264,3 +287,125 @@ class CurveDocument:
         )
         document.validate()
         return document
+
+
+def curve_coefficients(
+    values: Sequence[float], interpolation: str
+) -> tuple[tuple[float, ...], ...]:
+    """Precompute one coefficient tuple per keyframe segment.
+
+    ``step`` keeps the left value, ``linear`` stores ``(left, right - left)``
+    and ``cubic`` the four Catmull-Rom terms before the ``0.5`` scale.  The
+    arithmetic matches :meth:`CurveDocument.evaluate` term for term, so
+    sampled values are bit-identical.
+    """
+    if interpolation not in CURVE_INTERPOLATIONS:
+        raise CurveDocumentError(
+            "interpolation", f"unsupported interpolation {interpolation!r}"
+        )
+    segments = []
+    last = len(values) - 1
+    for index in range(last):
+        left = values[index]
+        right = values[index + 1]
+        if interpolation == "step":
+            segments.append((float(left),))
+        elif interpolation == "linear":
+            segments.append((float(left), float(right - left)))
+        else:
+            p0 = values[index - 1] if index > 0 else left
+            p3 = values[index + 2] if index + 2 <= last else right
+            segments.append(
+                (
+                    float(2 * left),
+                    float(-p0 + right),
+                    float(2 * p0 - 5 * left + 4 * right - p3),
+                    float(-p0 + 3 * left - 3 * right + p3),
+                )
+            )
+    return tuple(segments)
+
+
+class CurveSampler:
+    """Evaluate precomputed curve segments.
+
+    Playback is usually monotonic, so the segment found by the previous call
+    is tried first; any other frame falls back to ``bisect``.
+    """
+
+    __slots__ = ("frames", "coefficients", "interpolation", "default", "last_value", "_cursor")
+
+    def __init__(
+        self,
+        frames: Sequence[int],
+        coefficients: Sequence[tuple[float, ...]],
+        interpolation: str,
+        default: float,
+        last_value: float,
+    ) -> None:
+        if frames and len(coefficients) != len(frames) - 1:
+            raise CurveDocumentError("coefficients", "need one segment per keyframe pair")
+        self.frames = [float(frame) for frame in frames]
+        self.coefficients = tuple(coefficients)
+        self.interpolation = interpolation
+        self.default = float(default)
+        self.last_value = float(last_value)
+        self._cursor = 0
+
+    @classmethod
+    def from_binding(cls, binding: Any) -> "CurveSampler":
+        """Build a sampler from a compiled curve binding."""
+        coefficients = binding.curve_coefficients or curve_coefficients(
+            binding.curve_values, binding.curve_interpolation
+        )
+        return cls(
+            binding.curve_frames,
+            coefficients,
+            binding.curve_interpolation,
+            binding.curve_default,
+            binding.curve_values[-1] if binding.curve_values else binding.curve_default,
+        )
+
+    def sample(self, frame: float) -> float:
+        frames = self.frames
+        if not frames or frame < frames[0]:
+            return self.default
+        if frame >= frames[-1]:
+            return self.last_value
+        index = self._cursor
+        if not frames[index] <= frame < frames[index + 1]:
+            index = self._cursor = bisect.bisect_right(frames, frame) - 1
+        segment = self.coefficients[index]
+        if self.interpolation == "step":
+            return segment[0]
+        start = frames[index]
+        t = (frame - start) / (frames[index + 1] - start)
+        if self.interpolation == "linear":
+            return segment[0] + segment[1] * t
+        c0, c1, c2, c3 = segment
+        return 0.5 * (c0 + c1 * t + c2 * t * t + c3 * t * t * t)
+
+    def sample_array(self, frames: Any) -> np.ndarray:
+        x = np.asarray(frames, dtype=np.float64)
+        result = np.full(x.shape, self.default, dtype=np.float64)
+        keys = np.asarray(self.frames, dtype=np.float64)
+        if not len(keys):
+            return result
+        result[x >= keys[-1]] = self.last_value
+        inside = (x >= keys[0]) & (x < keys[-1])
+        if not inside.any():
+            return result
+        xs = x[inside]
+        index = np.searchsorted(keys, xs, side="right") - 1
+        segments = np.asarray(self.coefficients, dtype=np.float64)[index]
+        if self.interpolation == "step":
+            result[inside] = segments[:, 0]
+            return result
+        start = keys[index]
+        t = (xs - start) / (keys[index + 1] - start)
+        if self.interpolation == "linear":
+            result[inside] = segments[:, 0] + segments[:, 1] * t
+        else:
+            c0, c1, c2, c3 = segments.T
+            result[inside] = 0.5 * (c0 + c1 * t + c2 * t * t + c3 * t * t * t)
+        return result
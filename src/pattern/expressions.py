@@ -11,17 +11,24 @@ This module implements the established expression contract:
 - ``random`` draws from the deterministic RNG provided in the evaluation
   context (``context["rng"]``); it never reads global state.
 
-Compiled expressions are plain data (nested tuples) with an interpreter, so
-``PatternProgram`` can carry them without installing any callable or calling
-``eval``/``exec``.
+Compiled expressions are plain data (nested tuples), so ``PatternProgram``
+can carry them without installing any callable.  ``evaluate_node`` interprets
+a tree directly; ``expression_evaluator`` lowers a validated tree once into
+composed closures, still without ``eval``/``exec``, checking finiteness only
+on the result.  ``vector_evaluator`` lowers the same tree onto NumPy arrays
+so one call yields a whole burst column.
 """
 
 from __future__ import annotations
 
 import ast as _ast
 import math
+import operator
 from dataclasses import dataclass
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import Any, Callable, Mapping
+
+import numpy as np
 
 EXPRESSION_VARIABLES = frozenset(
     {
@@ -36,6 +43,9 @@ EXPRESSION_VARIABLES = frozenset(
     }
 )
 
+# Per-bullet inputs, only declared for expressions evaluated over a burst.
+BULLET_VARIABLES = frozenset({"index", "count"})
+
 _WHITELISTED_FUNCTIONS = frozenset({"min", "max", "abs", "clamp"})
 _FUNCTION_ARITY = {
     "min": (1, None),
@@ -197,7 +207,7 @@ class CompiledExpression:
     node: tuple
 
     def eval(self, context: Mapping[str, Any]) -> float:
-        return evaluate_node(self.node, context)
+        return expression_evaluator(self.node)(context)
 
     def to_dict(self) -> dict[str, Any]:
         return {"source": self.source, "node": self.node}
@@ -402,3 +412,301 @@ def evaluate_node(node: tuple, context: Mapping[str, Any]) -> float:
         raise
     except (ArithmeticError, IndexError, KeyError, TypeError, ValueError) as exc:
         raise ExpressionError("runtime", f"malformed or invalid expression: {exc}") from exc
+
+
+# --------------------------------------------------------------------------
+# One-time lowering to composed closures
+# --------------------------------------------------------------------------
+
+
+def _mod(left: float, right: float) -> float:
+    if right == 0.0:
+        raise ZeroDivisionError("division by zero")
+    return math.fmod(left, right)
+
+
+def _draw(rng: Any) -> float:
+    if rng is None:
+        raise ExpressionError(
+            "runtime", "random requires a deterministic rng in the context"
+        )
+    return float(rng.random())
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+def _invalid(exc: Exception) -> ExpressionError:
+    if isinstance(exc, ZeroDivisionError):
+        return ExpressionError("runtime", "division by zero")
+    return ExpressionError("runtime", f"malformed or invalid expression: {exc}")
+
+
+# Lowered closures take ``values``: every referenced variable read and
+# converted once per call, with the rng stored under the ``None`` key.
+_RNG = None
+
+_BIN_FUNCTIONS: dict[str, Callable[[Any, Any], Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "floordiv": lambda left, right: math.floor(left / right),
+    "mod": _mod,
+    "pow": math.pow,
+}
+_CMP_FUNCTIONS: dict[str, Callable[[Any, Any], Any]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+# Array lowering: both conditional branches are evaluated and selected per
+# lane, so division by zero or a domain error in an unselected lane is
+# harmless; a selected one surfaces through the final finiteness check.
+_VECTOR_BIN_FUNCTIONS: dict[str, Callable[[Any, Any], Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": np.true_divide,
+    "floordiv": lambda left, right: np.floor(np.true_divide(left, right)),
+    "mod": np.fmod,
+    "pow": np.power,
+}
+
+_RUNTIME_ERRORS = (ArithmeticError, IndexError, KeyError, TypeError, ValueError)
+
+
+def _pairwise(pair: Callable[[Any, Any], Any], first: Callable, second: Callable) -> Callable:
+    return lambda values, size: pair(first(values, size), second(values, size))
+
+
+def _column(value: Any, size: int) -> np.ndarray:
+    result = np.empty(size, dtype=np.float64)
+    result[...] = value
+    if not np.isfinite(result).all():
+        raise ExpressionError("runtime", "expression must not produce non-finite values")
+    return result
+
+
+def _vector_draw(rng: Any, size: int) -> np.ndarray:
+    if rng is None:
+        raise ExpressionError(
+            "runtime", "random requires a deterministic rng in the context"
+        )
+    return np.asarray(rng.random(size), dtype=np.float64)
+
+
+def _load_values(names: tuple[str, ...], rng: bool, context: Mapping[str, Any]) -> dict:
+    values = {name: float(context.get(name, 0.0)) for name in names}
+    if rng:
+        values[_RNG] = context.get("rng")
+    return values
+
+
+def _names(variables: set[str | None]) -> tuple[str, ...]:
+    return tuple(sorted(name for name in variables if name is not _RNG))
+
+
+def _checked_call(name: str, count: int) -> None:
+    if name not in _WHITELISTED_FUNCTIONS:
+        raise ExpressionError("expression", f"unknown whitelisted function {name!r}")
+    arity_error = _arity_error(name, count)
+    if arity_error is not None:
+        raise arity_error
+
+
+def _lower_leaf(node: tuple, variables: set[str | None]) -> Callable[[dict], Any] | None:
+    """Lower ``num`` and scalar ``var`` nodes; ``None`` for anything else."""
+    kind = node[0]
+    if kind == "num":
+        value = node[1]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ExpressionError("expression", "compiled numeric node is malformed")
+        constant = float(value)
+        return lambda values: constant
+    if kind == "var" and node[1] != "random":
+        name = node[1]
+        if not isinstance(name, str) or not name.isidentifier():
+            raise ExpressionError("expression", "compiled variable node is malformed")
+        variables.add(name)
+        return lambda values: values[name]
+    return None
+
+
+def _lower(node: tuple, variables: set[str | None]) -> Callable[[dict], Any]:
+    leaf = _lower_leaf(node, variables)
+    if leaf is not None:
+        return leaf
+    kind = node[0]
+    if kind == "var":
+        variables.add(_RNG)
+        return lambda values: _draw(values[_RNG])
+    if kind == "bin":
+        function = _BIN_FUNCTIONS.get(node[1])
+        if function is None:
+            raise ExpressionError("expression", f"unknown binary operator {node[1]!r}")
+        left = _lower(node[2], variables)
+        right = _lower(node[3], variables)
+        return lambda values: function(left(values), right(values))
+    if kind == "unary":
+        if node[1] not in {"neg", "pos"}:
+            raise ExpressionError("expression", f"unknown unary operator {node[1]!r}")
+        operand = _lower(node[2], variables)
+        if node[1] == "pos":
+            return operand
+        return lambda values: -operand(values)
+    if kind == "call":
+        name, args = node[1], node[2]
+        _checked_call(name, len(args))
+        lowered = tuple(_lower(item, variables) for item in args)
+        if name == "abs":
+            (only,) = lowered
+            return lambda values: abs(only(values))
+        if name == "clamp":
+            value, low, high = lowered
+            return lambda values: _clamp(value(values), low(values), high(values))
+        reduce = min if name == "min" else max
+        return lambda values: reduce([item(values) for item in lowered])
+    if kind == "cmp":
+        compare = _CMP_FUNCTIONS.get(node[1])
+        if compare is None:
+            raise ExpressionError("expression", f"unknown comparison {node[1]!r}")
+        left = _lower(node[2], variables)
+        right = _lower(node[3], variables)
+        return lambda values: 1.0 if compare(left(values), right(values)) else 0.0
+    if kind == "cond":
+        test = _lower(node[1], variables)
+        body = _lower(node[2], variables)
+        orelse = _lower(node[3], variables)
+        return lambda values: body(values) if test(values) != 0.0 else orelse(values)
+    raise ExpressionError("expression", f"unknown expression node kind {kind!r}")
+
+
+@lru_cache(maxsize=1024)
+def expression_evaluator(node: tuple) -> Callable[[Mapping[str, Any]], float]:
+    """Lower a validated node tree once into ``evaluate(context) -> float``.
+
+    The tree becomes composed closures with operator dispatch resolved up
+    front.  Each referenced variable is read once per call, operands are
+    evaluated in the interpreter's order (so ``random`` draws line up) and
+    failures raise the same :class:`ExpressionError` family.  Intermediate
+    values are not checked; the result must be finite.  Trees too deep to
+    lower fall back to :func:`evaluate_node`.
+    """
+    variables: set[str | None] = set()
+    try:
+        root = _lower(node, variables)
+    except RecursionError:
+        return lambda context: evaluate_node(node, context)
+    names, rng = _names(variables), _RNG in variables
+
+    def evaluate(context: Mapping[str, Any]) -> float:
+        try:
+            result = float(root(_load_values(names, rng, context)))
+        except ExpressionError:
+            raise
+        except _RUNTIME_ERRORS as exc:
+            raise _invalid(exc) from exc
+        if not math.isfinite(result):
+            raise ExpressionError("runtime", "expression must not produce non-finite values")
+        return result
+
+    return evaluate
+
+
+def _lower_vector(node: tuple, variables: set[str | None]) -> Callable[[dict, int], Any]:
+    kind = node[0]
+    if kind == "var" and node[1] == "random":
+        variables.add(_RNG)
+        return lambda values, size: _vector_draw(values[_RNG], size)
+    if kind == "var" and node[1] in BULLET_VARIABLES:
+        name = node[1]
+        return lambda values, size: values[name]
+    leaf = _lower_leaf(node, variables)
+    if leaf is not None:
+        return lambda values, size: leaf(values)
+    if kind == "unary":
+        if node[1] not in {"neg", "pos"}:
+            raise ExpressionError("expression", f"unknown unary operator {node[1]!r}")
+        operand = _lower_vector(node[2], variables)
+        if node[1] == "pos":
+            return operand
+        return lambda values, size: -operand(values, size)
+    if kind == "bin":
+        function = _VECTOR_BIN_FUNCTIONS.get(node[1])
+        if function is None:
+            raise ExpressionError("expression", f"unknown binary operator {node[1]!r}")
+        left = _lower_vector(node[2], variables)
+        right = _lower_vector(node[3], variables)
+        return lambda values, size: function(left(values, size), right(values, size))
+    if kind == "call":
+        name, args = node[1], node[2]
+        _checked_call(name, len(args))
+        lowered = [_lower_vector(item, variables) for item in args]
+        if name == "abs":
+            (only,) = lowered
+            return lambda values, size: np.abs(only(values, size))
+        if name == "clamp":
+            value, low, high = lowered
+            return lambda values, size: np.maximum(
+                low(values, size), np.minimum(high(values, size), value(values, size))
+            )
+        pair = np.minimum if name == "min" else np.maximum
+        result = lowered[0]
+        for item in lowered[1:]:
+            result = _pairwise(pair, result, item)
+        return result
+    if kind == "cmp":
+        compare = _CMP_FUNCTIONS.get(node[1])
+        if compare is None:
+            raise ExpressionError("expression", f"unknown comparison {node[1]!r}")
+        left = _lower_vector(node[2], variables)
+        right = _lower_vector(node[3], variables)
+        return lambda values, size: np.where(
+            compare(left(values, size), right(values, size)), 1.0, 0.0
+        )
+    if kind == "cond":
+        test = _lower_vector(node[1], variables)
+        body = _lower_vector(node[2], variables)
+        orelse = _lower_vector(node[3], variables)
+        return lambda values, size: np.where(
+            test(values, size) != 0.0, body(values, size), orelse(values, size)
+        )
+    raise ExpressionError("expression", f"unknown expression node kind {kind!r}")
+
+
+@lru_cache(maxsize=1024)
+def vector_evaluator(node: tuple) -> Callable[[Mapping[str, Any], int], np.ndarray]:
+    """Lower a node tree once into ``evaluate(context, size) -> ndarray``.
+
+    ``index`` is ``0..size-1`` and ``count`` is ``size``; every other
+    variable is a scalar read from ``context``.  Each ``random`` occurrence
+    draws a whole column with ``context["rng"].random(size)`` (for example a
+    ``numpy.random.Generator``), in the interpreter's operand order.  Both
+    conditional branches are evaluated, so draws never depend on data.  Lane
+    ``i`` matches :func:`expression_evaluator` with ``index=i`` given the same
+    random values, and the result must be finite in every lane.
+    """
+    variables: set[str | None] = set()
+    root = _lower_vector(node, variables)
+    names, rng = _names(variables), _RNG in variables
+
+    def evaluate(context: Mapping[str, Any], size: int) -> np.ndarray:
+        values = _load_values(names, rng, context)
+        values["index"] = np.arange(size, dtype=np.float64)
+        values["count"] = float(size)
+        try:
+            with np.errstate(all="ignore"):
+                value = root(values, size)
+        except ExpressionError:
+            raise
+        except _RUNTIME_ERRORS as exc:
+            raise _invalid(exc) from exc
+        return _column(value, size)
+
+    return evaluate
@@ -4,23 +4,83 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+def _frozen_array(values, shape: tuple[int, ...]) -> np.ndarray:
+    array = np.array(values, dtype=np.float64).reshape(shape)
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
 class BurstTemplate:
-    """Precomputed per-bullet values for one burst within a schedule loop."""
+    """Precomputed per-bullet values for one burst within a schedule loop.
 
-    position_offsets: tuple[tuple[float, float], ...]
-    angle_offsets: tuple[float, ...]
-    speeds: tuple[float, ...]
+    Values are stored as read-only contiguous float64 arrays so a template
+    can be shared between runners and handed to the pool's batch spawn
+    without per-bullet Python objects.  ``offset_array`` has shape
+    ``(count, 2)``.  The tuple properties keep the original data view.
+    """
+
+    offset_array: np.ndarray
+    angle_array: np.ndarray
+    speed_array: np.ndarray
+
+    @classmethod
+    def from_values(cls, position_offsets, angle_offsets, speeds) -> "BurstTemplate":
+        count = len(angle_offsets)
+        return cls(
+            offset_array=_frozen_array(position_offsets, (count, 2)),
+            angle_array=_frozen_array(angle_offsets, (count,)),
+            speed_array=_frozen_array(speeds, (count,)),
+        )
+
+    def __reduce__(self):
+        # Rebuild through ``from_values`` so unpickled arrays stay read-only.
+        return (
+            BurstTemplate.from_values,
+            (self.offset_array, self.angle_array, self.speed_array),
+        )
 
     @property
     def count(self) -> int:
-        return len(self.angle_offsets)
+        return len(self.angle_array)
+
+    @property
+    def position_offsets(self) -> tuple[tuple[float, float], ...]:
+        return tuple(map(tuple, self.offset_array.tolist()))
+
+    @property
+    def angle_offsets(self) -> tuple[float, ...]:
+        return tuple(self.angle_array.tolist())
+
+    @property
+    def speeds(self) -> tuple[float, ...]:
+        return tuple(self.speed_array.tolist())
 
     @property
     def angles(self) -> tuple[float, ...]:
         return self.angle_offsets
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BurstTemplate):
+            return NotImplemented
+        return (
+            np.array_equal(self.offset_array, other.offset_array)
+            and np.array_equal(self.angle_array, other.angle_array)
+            and np.array_equal(self.speed_array, other.speed_array)
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self.offset_array.tobytes(),
+                self.angle_array.tobytes(),
+                self.speed_array.tobytes(),
+            )
+        )
+
 
 @dataclass(frozen=True)
 class PatternProgram:
@@ -70,6 +130,8 @@ class PatternProgram:
     preset_internal_node_ids: tuple[str, ...] = ()
     trajectory_kind: str = "constant"
     trajectory_parameters: tuple[tuple[str, float], ...] = ()
+    # ``keyframed`` trajectories: ("speed" | "turn", ((frame, value), ...)).
+    trajectory_tracks: tuple[tuple[str, tuple[tuple[float, float], ...]], ...] = ()
     termination_reaction: tuple[tuple[str, object], ...] = ()
     emitter_rotation_acceleration: float = 0.0
 
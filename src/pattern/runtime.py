@@ -2,19 +2,37 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
 import itertools
 import random
 import uuid
+import zlib
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
-
-from .compiler import BINDABLE_TARGETS, build_burst_template
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from src.core.checkpoints import (
+    DEFAULT_CHECKPOINT_BUDGET_BYTES,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointRing,
+    capture_context_checkpoint,
+    context_player_position,
+)
+
+from .compiler import (
+    BINDABLE_TARGETS,
+    PER_BULLET_TARGETS,
+    burst_template_key,
+    cached_burst_template,
+)
 from .bindings import CompiledBinding
-from .document import ModifierSpec, MotionSpec, ShapeSpec
-from .expressions import ExpressionError, evaluate_node
-from .ir import PatternProgram
+from .curves import CurveSampler
+from .expressions import ExpressionError, expression_evaluator, vector_evaluator
+from .ir import BurstTemplate, PatternProgram
 
 
 class PatternRunnerState(str, Enum):
@@ -65,6 +83,133 @@ class PatternTickResult:
         return self.event.spawned_count if self.event is not None else 0
 
 
+DEFAULT_PATTERN_SPAWN_TRACE_CAPACITY = 4096
+
+
+def spawn_digest(event: PatternSpawnEvent) -> int:
+    """Hash a burst's raw float64 columns with an unkeyed 64-bit BLAKE2b."""
+
+    digest = hashlib.blake2b(digest_size=8)
+    for values in (event.positions, event.angles, event.speeds):
+        digest.update(np.asarray(values, dtype=np.float64).tobytes())
+    return int.from_bytes(digest.digest(), "little")
+
+
+class PatternSpawnTrace:
+    """Fixed-capacity columnar ring of one runner's emissions.
+
+    Every emission keeps its frame, burst/loop indices, requested and
+    spawned counts and a :func:`spawn_digest`; only the newest
+    ``detail_capacity`` full :class:`PatternSpawnEvent` objects are kept.
+    Memory is therefore constant however long a pattern loops.
+    """
+
+    COLUMNS = (
+        ("frame", np.int64),
+        ("burst_index", np.int32),
+        ("loop_index", np.int32),
+        ("requested_count", np.int32),
+        ("spawned_count", np.int32),
+        ("spawn_hash", np.uint64),
+    )
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_PATTERN_SPAWN_TRACE_CAPACITY,
+        detail_capacity: int = 0,
+    ) -> None:
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("spawn trace capacity must be a positive integer")
+        if (
+            isinstance(detail_capacity, bool)
+            or not isinstance(detail_capacity, int)
+            or detail_capacity < 0
+        ):
+            raise ValueError("spawn trace detail capacity must be a non-negative integer")
+        self.capacity = capacity
+        self._columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS
+        }
+        self.details: deque[PatternSpawnEvent] = deque(maxlen=detail_capacity)
+        self.total = 0
+        self.last_hash: int | None = None
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PatternSpawnTrace):
+            return NotImplemented
+        ours = self.columns()
+        theirs = other.columns()
+        return (
+            self.total == other.total
+            and all(np.array_equal(ours[name], theirs[name]) for name, _ in self.COLUMNS)
+            and list(self.details) == list(other.details)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self.total - self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def clear(self) -> None:
+        self.total = 0
+        self.last_hash = None
+        self.details.clear()
+
+    def append(self, event: PatternSpawnEvent) -> int:
+        """Record ``event`` and return its spawn digest."""
+
+        spawn_hash = spawn_digest(event)
+        slot = self.total % self.capacity
+        columns = self._columns
+        columns["frame"][slot] = event.frame
+        columns["burst_index"][slot] = event.burst_index
+        columns["loop_index"][slot] = event.loop_index
+        columns["requested_count"][slot] = event.requested_count
+        columns["spawned_count"][slot] = event.spawned_count
+        columns["spawn_hash"][slot] = spawn_hash
+        self.total += 1
+        self.last_hash = spawn_hash
+        if self.details.maxlen:
+            self.details.append(event)
+        return spawn_hash
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Return retained records oldest-first as independent arrays."""
+
+        count = len(self)
+        start = self.total % self.capacity if self.total > self.capacity else 0
+        order = (np.arange(count) + start) % self.capacity
+        return {name: column[order] for name, column in self._columns.items()}
+
+    def capture(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "last_hash": self.last_hash,
+            "columns": self.columns(),
+            "details": tuple(self.details),
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Restore a capture, keeping the newest records that fit."""
+
+        self.total = int(state["total"])
+        self.last_hash = state["last_hash"]
+        for name, values in state["columns"].items():
+            kept = values[-self.capacity :]
+            slots = np.arange(self.total - len(kept), self.total) % self.capacity
+            self._columns[name][slots] = kept
+        self.details.clear()
+        self.details.extend(state["details"])
+
+
 _OWNER_TAGS = itertools.count(100_000)
 
 
@@ -78,73 +223,23 @@ def _next_owner_tag() -> int:
 
 def _eval_curve(binding: CompiledBinding, frame: float) -> float:
     """Sample compiled curve data with the curve resource semantics."""
-    if not binding.curve_frames:
-        return float(binding.curve_default)
-    if frame < binding.curve_frames[0]:
-        return float(binding.curve_default)
-    if frame >= binding.curve_frames[-1]:
-        return float(binding.curve_values[-1])
-    if binding.curve_interpolation == "step":
-        value = binding.curve_values[0]
-        for keyframe, key_value in zip(
-            binding.curve_frames, binding.curve_values
-        ):
-            if keyframe <= frame:
-                value = key_value
-            else:
-                break
-        return float(value)
-    for index in range(len(binding.curve_frames) - 1):
-        start = binding.curve_frames[index]
-        end = binding.curve_frames[index + 1]
-        if start <= frame < end:
-            span = float(end - start)
-            t = (frame - float(start)) / span
-            left = binding.curve_values[index]
-            right = binding.curve_values[index + 1]
-            if binding.curve_interpolation == "linear":
-                return float(left + (right - left) * t)
-            if binding.curve_interpolation == "cubic":
-                p0 = (
-                    binding.curve_values[index - 1]
-                    if index > 0
-                    else binding.curve_values[index]
-                )
-                p1 = left
-                p2 = right
-                p3 = (
-                    binding.curve_values[index + 2]
-                    if index + 2 < len(binding.curve_frames)
-                    else p2
-                )
-                return float(
-                    0.5
-                    * (
-                        2 * p1
-                        + (-p0 + p2) * t
-                        + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t * t
-                        + (-p0 + 3 * p1 - 3 * p2 + p3) * t * t * t
-                    )
-                )
-            raise PatternRuntimeError("binding", 0, "unsupported curve interpolation")
-    return float(binding.curve_values[-1])
+    return CurveSampler.from_binding(binding).sample(frame)
 
 
 def _binding_value(
     program: PatternProgram,
     binding: CompiledBinding,
     frame: int,
-    burst_index: int,
+    variables: dict[str, Any],
     context: Any,
+    evaluate: Callable[[Any], float] | None = None,
 ) -> float:
     if binding.mode == "constant":
         return binding.value
     if binding.mode == "variable":
         name = str(binding.value)
         if name == "random":
-            rng = _binding_rng(program, frame, burst_index)
-            return float(rng.random())
-        variables = _binding_variables(program, frame, burst_index, context)
+            return float(variables["rng"].random())
         if name in variables:
             return float(variables[name])
         hook = getattr(context, "get_variable", None)
@@ -159,11 +254,14 @@ def _binding_value(
                 ) from exc
         return 0.0
     if binding.mode == "curve":
+        if evaluate is not None:
+            return evaluate(float(frame))
         return _eval_curve(binding, float(frame))
     if binding.mode == "expression":
-        variables = _binding_variables(program, frame, burst_index, context)
         try:
-            return evaluate_node(binding.expression_node, variables)
+            if evaluate is None:
+                evaluate = expression_evaluator(binding.expression_node)
+            return evaluate(variables)
         except ExpressionError as exc:
             raise PatternRuntimeError(
                 program.resource_id, frame, exc.message
@@ -187,7 +285,7 @@ def _coerce_runtime_binding(
     frame: int,
 ) -> Any:
     """Apply the same typed property boundary at the runtime emission edge."""
-    target = BINDABLE_TARGETS[path]
+    target = BINDABLE_TARGETS.get(path) or PER_BULLET_TARGETS[path]
     if target == "bool":
         if not isinstance(value, bool):
             raise PatternRuntimeError(program.resource_id, frame, f"{path} requires a boolean")
@@ -216,50 +314,123 @@ def _coerce_runtime_binding(
         raise PatternRuntimeError(program.resource_id, frame, f"{path} must be non-negative")
     if path == "motion.render_scale" and number <= 0:
         raise PatternRuntimeError(program.resource_id, frame, f"{path} must be positive")
+    if path == "bullet.speed_scale" and number < 0:
+        raise PatternRuntimeError(program.resource_id, frame, f"{path} must be non-negative")
     if path == "modifiers.random_speed_variation" and not 0 <= number <= 1:
         raise PatternRuntimeError(program.resource_id, frame, f"{path} must be in 0..1")
     return number
 
 
-def _runtime_parameters(
-    program: PatternProgram,
-    frame: int,
-    burst_index: int,
-    context: Any,
-) -> dict[str, Any]:
-    """Resolve all declared bindings once for one fixed-tick emission."""
-    params: dict[str, Any] = {
-        "shape.count": program.shape_count,
-        "shape.origin_x": program.origin[0],
-        "shape.origin_y": program.origin[1],
-        "shape.angle_span": program.shape_angle_span,
-        "shape.line_length": program.shape_line_length,
-        "shape.line_angle": program.shape_line_angle,
-        "aim.angle": program.aim_angle,
-        "schedule.delay_frames": program.delay_frames,
-        "schedule.interval_frames": program.interval_frames,
-        "schedule.burst_count": program.burst_count,
-        "schedule.loop_count": program.loop_count,
-        "motion.speed": program.speed,
-        "motion.friction": program.friction,
-        "motion.spin": program.spin,
-        "motion.time_scale": program.time_scale,
-        "motion.max_lifetime": program.max_lifetime,
-        "motion.render_scale": program.render_scale,
-        "motion.bounce_x": program.bounce_x,
-        "motion.bounce_y": program.bounce_y,
-        "modifiers.angle_offset_per_burst": program.angle_offset_per_burst,
-        "modifiers.speed_offset_per_burst": program.speed_offset_per_burst,
-        "modifiers.random_speed_variation": program.random_speed_variation,
+TIMING_TARGETS = frozenset(
+    {
+        "schedule.delay_frames",
+        "schedule.interval_frames",
+        "schedule.burst_count",
+        "schedule.loop_count",
     }
-    for path, binding in ((item.target_path, item) for item in program.bindings):
-        params[path] = _coerce_runtime_binding(
-            program,
-            path,
-            _binding_value(program, binding, frame, burst_index, context),
-            frame,
+)
+
+# Targets that change burst geometry; the rest are applied around a template.
+TEMPLATE_TARGETS = frozenset(
+    {
+        "shape.count",
+        "shape.angle_span",
+        "shape.line_length",
+        "shape.line_angle",
+        "motion.speed",
+        "modifiers.angle_offset_per_burst",
+        "modifiers.speed_offset_per_burst",
+        "modifiers.random_speed_variation",
+    }
+)
+
+
+_PlannedBinding = tuple[CompiledBinding, Callable[[Any], float] | None]
+_ColumnBinding = tuple[CompiledBinding, Callable[[Mapping[str, Any], int], np.ndarray]]
+
+
+def _planned(binding: CompiledBinding) -> _PlannedBinding:
+    if binding.mode == "expression":
+        return binding, expression_evaluator(binding.expression_node)
+    if binding.mode == "curve":
+        # Curve samplers take the frame; one per plan keeps its segment cursor.
+        return binding, CurveSampler.from_binding(binding).sample
+    return binding, None
+
+
+@dataclass(frozen=True)
+class _BindingPlan:
+    """Per-program binding evaluation order.
+
+    Bindings read only frame/burst inputs, never each other, so the only
+    dependency is emission gating: timing targets are resolved every tick to
+    decide whether a burst is due, and the remaining targets only on emission
+    frames.  Declaration order is kept within each phase (last binding for a
+    path wins).  Expression bindings are paired with their lowered evaluator.
+    """
+
+    timing_defaults: dict[str, Any]
+    emission_defaults: dict[str, Any]
+    timing: tuple[_PlannedBinding, ...]
+    emission: tuple[_PlannedBinding, ...]
+    reshapes_burst: bool = False
+    columns: tuple[_ColumnBinding, ...] = ()
+
+    @classmethod
+    def from_program(cls, program: PatternProgram) -> "_BindingPlan":
+        defaults: dict[str, Any] = {
+            "shape.count": program.shape_count,
+            "shape.origin_x": program.origin[0],
+            "shape.origin_y": program.origin[1],
+            "shape.angle_span": program.shape_angle_span,
+            "shape.line_length": program.shape_line_length,
+            "shape.line_angle": program.shape_line_angle,
+            "aim.angle": program.aim_angle,
+            "schedule.delay_frames": program.delay_frames,
+            "schedule.interval_frames": program.interval_frames,
+            "schedule.burst_count": program.burst_count,
+            "schedule.loop_count": program.loop_count,
+            "motion.speed": program.speed,
+            "motion.friction": program.friction,
+            "motion.spin": program.spin,
+            "motion.time_scale": program.time_scale,
+            "motion.max_lifetime": program.max_lifetime,
+            "motion.render_scale": program.render_scale,
+            "motion.bounce_x": program.bounce_x,
+            "motion.bounce_y": program.bounce_y,
+            "modifiers.angle_offset_per_burst": program.angle_offset_per_burst,
+            "modifiers.speed_offset_per_burst": program.speed_offset_per_burst,
+            "modifiers.random_speed_variation": program.random_speed_variation,
+            "bullet.angle_offset": 0.0,
+            "bullet.speed_scale": 1.0,
+        }
+        columns = tuple(
+            (item, vector_evaluator(item.expression_node))
+            for item in program.bindings
+            if item.target_path in PER_BULLET_TARGETS and item.mode == "expression"
+        )
+        column_paths = {item.target_path for item, _evaluate in columns}
+        return cls(
+            timing_defaults={
+                path: value for path, value in defaults.items() if path in TIMING_TARGETS
+            },
+            emission_defaults={
+                path: value for path, value in defaults.items() if path not in TIMING_TARGETS
+            },
+            timing=tuple(
+                _planned(item) for item in program.bindings if item.target_path in TIMING_TARGETS
+            ),
+            emission=tuple(
+                _planned(item)
+                for item in program.bindings
+                if item.target_path not in TIMING_TARGETS
+                and item.target_path not in column_paths
+            ),
+            reshapes_burst=any(
+                item.target_path in TEMPLATE_TARGETS for item in program.bindings
+            ),
+            columns=columns,
         )
-    return params
 
 
 def _binding_rng(program: PatternProgram, frame: int, burst_index: int) -> random.Random:
@@ -267,8 +438,71 @@ def _binding_rng(program: PatternProgram, frame: int, burst_index: int) -> rando
     return random.Random(seed)
 
 
+class _BurstRandom:
+    """The deterministic random stream of one ``(frame, burst)`` pair.
+
+    Every binding reads the stream from its start.  Draws are cached, so one
+    seeded ``random.Random`` serves all bindings of a burst and is only built
+    when a binding actually draws.
+    """
+
+    __slots__ = ("key", "_program", "_rng", "_draws")
+
+    def __init__(self, program: PatternProgram, frame: int, burst_index: int) -> None:
+        self.key = (frame, burst_index)
+        self._program = program
+        self._rng: random.Random | None = None
+        self._draws: list[float] = []
+
+    def draw(self, index: int) -> float:
+        draws = self._draws
+        while len(draws) <= index:
+            if self._rng is None:
+                self._rng = _binding_rng(self._program, *self.key)
+            draws.append(self._rng.random())
+        return draws[index]
+
+
+class _ColumnRandom:
+    """``rng`` for per-bullet expressions: whole-column NumPy draws.
+
+    Seeded from ``(seed, frame, burst, target)`` so each per-bullet target
+    gets an independent stream; the generator is built on first draw.
+    """
+
+    __slots__ = ("_entropy", "_generator")
+
+    def __init__(self, program: PatternProgram, frame: int, burst_index: int, path: str) -> None:
+        self._entropy = (
+            program.seed & 0xFFFF_FFFF_FFFF_FFFF,
+            frame,
+            burst_index,
+            zlib.crc32(path.encode("utf-8")),
+        )
+        self._generator: np.random.Generator | None = None
+
+    def random(self, size: int) -> np.ndarray:
+        if self._generator is None:
+            self._generator = np.random.default_rng(self._entropy)
+        return self._generator.random(size)
+
+
+class _RandomCursor:
+    """``rng`` expression variable: replays a :class:`_BurstRandom` stream."""
+
+    __slots__ = ("_stream", "_index")
+
+    def __init__(self, stream: _BurstRandom) -> None:
+        self._stream = stream
+        self._index = 0
+
+    def random(self) -> float:
+        value = self._stream.draw(self._index)
+        self._index += 1
+        return value
+
+
 def _binding_variables(
-    program: PatternProgram,
     frame: int,
     burst_index: int,
     context: Any,
@@ -288,10 +522,34 @@ def _binding_variables(
         "player_y": player_y,
         "boss_x": 0.0,
         "boss_y": 0.0,
-        "rng": _binding_rng(program, frame, burst_index),
     }
 
 
+def _evaluate_bindings(
+    program: PatternProgram,
+    bindings: tuple[_PlannedBinding, ...],
+    params: dict[str, Any],
+    frame: int,
+    burst_index: int,
+    context: Any,
+    stream: _BurstRandom,
+) -> None:
+    """Resolve ``bindings`` into ``params`` for one fixed-tick emission."""
+    variables: dict[str, Any] | None = None
+    for binding, evaluate in bindings:
+        if binding.mode in {"variable", "expression"}:
+            if variables is None:
+                variables = _binding_variables(frame, burst_index, context)
+            variables["rng"] = _RandomCursor(stream)
+        path = binding.target_path
+        params[path] = _coerce_runtime_binding(
+            program,
+            path,
+            _binding_value(program, binding, frame, variables, context, evaluate),
+            frame,
+        )
+
+
 class _ScriptHost:
     """Lazy, explicit script module host. Never installs per-bullet callbacks."""
 
@@ -345,7 +603,17 @@ class PatternRunner:
         *,
         instance_id: str | None = None,
         owner_tag: int | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        checkpoint_budget_bytes: int = DEFAULT_CHECKPOINT_BUDGET_BYTES,
+        spawn_trace_capacity: int = DEFAULT_PATTERN_SPAWN_TRACE_CAPACITY,
+        spawn_detail_capacity: int = 0,
     ) -> None:
+        if (
+            isinstance(checkpoint_interval, bool)
+            or not isinstance(checkpoint_interval, int)
+            or checkpoint_interval < 0
+        ):
+            raise ValueError("checkpoint_interval must be a non-negative integer")
         self.program = program
         self.instance_id = instance_id or str(uuid.uuid4())
         self.owner_tag = int(owner_tag) if owner_tag is not None else _next_owner_tag()
@@ -355,7 +623,7 @@ class PatternRunner:
         self.frame = 0
         self.emission_count = 0
         self.last_event: PatternSpawnEvent | None = None
-        self.spawn_trace: list[PatternSpawnEvent] = []
+        self.spawn_trace = PatternSpawnTrace(spawn_trace_capacity, spawn_detail_capacity)
         self.replay_identity: dict[str, Any] = {
             "program_hash": program.content_hash,
             "seed": program.seed,
@@ -367,6 +635,13 @@ class PatternRunner:
         }
         self.last_error: PatternRuntimeError | None = None
         self._script_host: _ScriptHost | None = None
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = CheckpointRing(checkpoint_budget_bytes)
+        self._checkpoint_context: Any | None = None
+        self._checkpoint_player: tuple[float, float] | None = None
+        self._binding_plan = _BindingPlan.from_program(program)
+        self._burst_random: _BurstRandom | None = None
+        self.binding_evaluations = 0
 
     def start(
         self,
@@ -518,10 +793,9 @@ class PatternRunner:
 
         event = None
         try:
-            parameters = _runtime_parameters(
-                self.program, current_frame, self.emission_count, context
-            )
+            parameters = self._timing_parameters(current_frame, context)
             if self._emission_due(current_frame, parameters):
+                parameters = self._emission_parameters(current_frame, context, parameters)
                 event = self._spawn(context, current_frame, parameters)
                 self.last_event = event
                 self.spawn_trace.append(event)
@@ -544,23 +818,149 @@ class PatternRunner:
         self.frame += 1
         return PatternTickResult(current_frame, self.state, event)
 
+    @property
+    def static_timing(self) -> bool:
+        """Whether the emission check is independent of context and scripts."""
+
+        return self._script_host is None and not self._binding_plan.timing
+
+    def tick_idle(self) -> PatternTickResult:
+        """Advance one frame that :meth:`emission_due_batch` found idle."""
+
+        current_frame = self.frame
+        self.frame += 1
+        return PatternTickResult(current_frame, self.state)
+
+    @staticmethod
+    def emission_due_batch(runners: Sequence["PatternRunner"]) -> np.ndarray:
+        """Evaluate the emission check for running runners of one program.
+
+        Every runner must be RUNNING with :attr:`static_timing` and share one
+        ``program.content_hash``, so the schedule resolves once and is
+        compared against all runner frames together.
+        """
+
+        parameters = runners[0]._binding_plan.timing_defaults
+        frames = np.fromiter((runner.frame for runner in runners), np.int64, len(runners))
+        delay = int(parameters["schedule.delay_frames"])
+        interval = int(parameters["schedule.interval_frames"])
+        due = (frames >= delay) & ((frames - delay) % interval == 0)
+        total = runners[0]._total_emissions(parameters)
+        if total is not None:
+            counts = np.fromiter(
+                (runner.emission_count for runner in runners), np.int64, len(runners)
+            )
+            due &= counts < total
+        return due
+
     def advance(self, context: Any, frames: int) -> tuple[PatternTickResult, ...]:
         if isinstance(frames, bool) or not isinstance(frames, int) or frames < 0:
             raise ValueError("frames must be a non-negative integer")
         return tuple(self.tick(context) for _ in range(frames))
 
     def seek(self, context: Any, frame: int) -> tuple[PatternTickResult, ...]:
-        """Reset and replay deterministic fixed ticks to ``frame``."""
+        """Replay deterministic fixed ticks to ``frame``.
+
+        Replay starts from the newest checkpoint at or before ``frame`` (or
+        a reset at frame 0) and records a checkpoint every
+        ``checkpoint_interval`` frames.  Results cover replayed ticks only.
+        """
 
         if isinstance(frame, bool) or not isinstance(frame, int) or frame < 0:
             raise ValueError("frame must be a non-negative integer")
-        self.reset(context)
-        self.start(context, reset=False)
-        results = tuple(self.tick(context) for _ in range(frame))
+        # Player aim reads the live player position, so moving it
+        # invalidates every recorded frame.
+        player = context_player_position(context)
+        if context is not self._checkpoint_context or player != self._checkpoint_player:
+            self.checkpoints.clear()
+            self._checkpoint_context = context
+            self._checkpoint_player = player
+        checkpoint = self.checkpoints.latest(frame)
+        if checkpoint is None:
+            self.reset(context)
+            self.start(context, reset=False)
+        else:
+            self.restore_checkpoint(checkpoint, context)
+        results = []
+        interval = self.checkpoint_interval
+        for _ in range(frame - self.frame):
+            results.append(self.tick(context))
+            if (
+                interval
+                and self.frame % interval == 0
+                and self.frame not in self.checkpoints
+                and self.state in {PatternRunnerState.RUNNING, PatternRunnerState.FINISHED}
+            ):
+                captured = self.capture_checkpoint(context)
+                if captured is not None:
+                    self.checkpoints.add(self.frame, captured)
+        results = tuple(results)
         self.pause()
-        self.replay_identity["actual_trigger_frames"] = [event.frame for event in self.spawn_trace]
+        self.replay_identity["actual_trigger_frames"] = self.spawn_trace.columns()["frame"].tolist()
         return results
 
+    @property
+    def supports_checkpoints(self) -> bool:
+        """Whether runner state is fully described by :meth:`capture_checkpoint`.
+
+        Burst randomness is derived from ``(seed, frame, burst)`` so the frame
+        and emission counters are the whole RNG state; a loaded script module
+        may hold arbitrary Python state and therefore opts out.
+        """
+
+        return self._script_host is None
+
+    def capture_checkpoint(self, context: Any | None = None) -> dict[str, Any] | None:
+        """Capture runner state, plus ``context`` state when one is given.
+
+        Returns ``None`` when the runner or context cannot be restored
+        exactly; callers then replay from frame 0.
+        """
+
+        if not self.supports_checkpoints:
+            return None
+        context_state = None
+        if context is not None:
+            supported, context_state = capture_context_checkpoint(context)
+            if not supported:
+                return None
+        return {
+            "program_hash": self.program.content_hash,
+            "instance_id": self.instance_id,
+            "owner_tag": self.owner_tag,
+            "state": self.state,
+            "frame": self.frame,
+            "emission_count": self.emission_count,
+            "last_event": self.last_event,
+            "spawn_trace": self.spawn_trace.capture(),
+            "last_error": self.last_error,
+            "replay_identity": dict(self.replay_identity),
+            "context": context_state,
+        }
+
+    def restore_checkpoint(
+        self,
+        checkpoint: dict[str, Any],
+        context: Any | None = None,
+    ) -> None:
+        """Restore runner state; with ``context``, reset it and restore it too."""
+
+        if checkpoint["program_hash"] != self.program.content_hash:
+            raise ValueError("checkpoint belongs to a different pattern program")
+        if context is not None:
+            self.reset(context)
+        self.instance_id = checkpoint["instance_id"]
+        self.owner_tag = int(checkpoint["owner_tag"])
+        self.state = checkpoint["state"]
+        self.frame = int(checkpoint["frame"])
+        self.emission_count = int(checkpoint["emission_count"])
+        self.last_event = checkpoint["last_event"]
+        self.spawn_trace.restore(checkpoint["spawn_trace"])
+        self.last_error = checkpoint["last_error"]
+        self.replay_identity = dict(checkpoint["replay_identity"])
+        if context is not None and checkpoint["context"] is not None:
+            context.restore_checkpoint(checkpoint["context"])
+
     def reset_clip(self, context: Any | None = None) -> None:
         """Reset this PatternRunner's owning Clip instance."""
 
@@ -571,6 +971,56 @@ class PatternRunner:
 
         return self.seek(context, frame)
 
+    def _random_stream(self, frame: int) -> _BurstRandom:
+        stream = self._burst_random
+        if stream is None or stream.key != (frame, self.emission_count):
+            stream = self._burst_random = _BurstRandom(
+                self.program, frame, self.emission_count
+            )
+        return stream
+
+    def _timing_parameters(self, frame: int, context: Any) -> dict[str, Any]:
+        """Resolve the schedule targets that decide whether a burst is due."""
+
+        plan = self._binding_plan
+        params = dict(plan.timing_defaults)
+        if plan.timing:
+            _evaluate_bindings(
+                self.program,
+                plan.timing,
+                params,
+                frame,
+                self.emission_count,
+                context,
+                self._random_stream(frame),
+            )
+            self.binding_evaluations += len(plan.timing)
+        return params
+
+    def _emission_parameters(
+        self,
+        frame: int,
+        context: Any,
+        timing: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Resolve every target for an emission, reusing this tick's timing."""
+
+        plan = self._binding_plan
+        params = dict(plan.emission_defaults)
+        params.update(self._timing_parameters(frame, context) if timing is None else timing)
+        if plan.emission:
+            _evaluate_bindings(
+                self.program,
+                plan.emission,
+                params,
+                frame,
+                self.emission_count,
+                context,
+                self._random_stream(frame),
+            )
+            self.binding_evaluations += len(plan.emission)
+        return params
+
     def _total_emissions(self, parameters: dict[str, Any]) -> int | None:
         loop_count = parameters["schedule.loop_count"]
         if loop_count is None:
@@ -594,43 +1044,11 @@ class PatternRunner:
         parameters: dict[str, Any] | None = None,
     ) -> PatternSpawnEvent:
         if parameters is None:
-            parameters = _runtime_parameters(
-                self.program, frame, self.emission_count, context
-            )
+            parameters = self._emission_parameters(frame, context)
         burst_count = int(parameters["schedule.burst_count"])
         burst_index = self.emission_count % burst_count
         loop_index = self.emission_count // burst_count
-        shape = ShapeSpec(
-            kind=self.program.shape_kind,
-            count=int(parameters["shape.count"]),
-            origin_x=float(parameters["shape.origin_x"]),
-            origin_y=float(parameters["shape.origin_y"]),
-            angle_span=float(parameters["shape.angle_span"]),
-            line_length=float(parameters["shape.line_length"]),
-            line_angle=float(parameters["shape.line_angle"]),
-        )
-        motion = MotionSpec(
-            speed=float(parameters["motion.speed"]),
-            friction=float(parameters["motion.friction"]),
-            spin=float(parameters["motion.spin"]),
-            time_scale=float(parameters["motion.time_scale"]),
-            max_lifetime=float(parameters["motion.max_lifetime"]),
-            render_scale=float(parameters["motion.render_scale"]),
-            bounce_x=bool(parameters["motion.bounce_x"]),
-            bounce_y=bool(parameters["motion.bounce_y"]),
-        )
-        modifiers = ModifierSpec(
-            angle_offset_per_burst=float(parameters["modifiers.angle_offset_per_burst"]),
-            speed_offset_per_burst=float(parameters["modifiers.speed_offset_per_burst"]),
-            random_speed_variation=float(parameters["modifiers.random_speed_variation"]),
-        )
-        template = build_burst_template(
-            shape=shape,
-            motion=motion,
-            modifiers=modifiers,
-            seed=self.program.seed,
-            burst_index=burst_index,
-        )
+        template = self._burst_template(parameters, burst_index)
         origin_x, origin_y = float(parameters["shape.origin_x"]), float(parameters["shape.origin_y"])
         base_angle = float(parameters["aim.angle"])
         if self.program.aim_mode == "player":
@@ -640,22 +1058,27 @@ class PatternRunner:
             base_angle = math.degrees(
                 math.atan2(player.y - origin_y, player.x - origin_x)
             )
-        speeds = template.speeds
-        positions = tuple(
-            (origin_x + x, origin_y + y)
-            for x, y in template.position_offsets
-        )
         rotation_acceleration = self.program.emitter_rotation_acceleration
         accelerated_offset = (
             0.5 * rotation_acceleration * burst_index * burst_index
         )
-        angles = tuple(
-            base_angle + accelerated_offset + value
-            for value in template.angle_offsets
-        )
+        position_array = template.offset_array + (origin_x, origin_y)
+        angle_array = template.angle_array + (base_angle + accelerated_offset)
+        speed_array = template.speed_array
+        angle_offset = parameters["bullet.angle_offset"]
+        speed_scale = parameters["bullet.speed_scale"]
+        if self._binding_plan.columns:
+            columns = self._bullet_columns(frame, context, template.count)
+            angle_offset = columns.get("bullet.angle_offset", angle_offset)
+            speed_scale = columns.get("bullet.speed_scale", speed_scale)
+        if isinstance(angle_offset, np.ndarray) or angle_offset != 0.0:
+            angle_array = angle_array + angle_offset
+        if isinstance(speed_scale, np.ndarray) or speed_scale != 1.0:
+            speed_array = speed_array * speed_scale
         trajectory = dict(self.program.trajectory_parameters)
         curve_type = 0
         curve_param = (0.0, 0.0, 0.0, 0.0)
+        track_keys: dict[str, Any] = {}
         if self.program.trajectory_kind == "linear_speed":
             curve_type = 4
             curve_param = (
@@ -680,6 +1103,12 @@ class PatternRunner:
                 0.0,
                 0.0,
             )
+        elif self.program.trajectory_kind == "keyframed":
+            # Piecewise-linear speed/turn tracks are sampled inside the bullet
+            # kernel; the runner only forwards the compiled keys.
+            track_keys = {
+                f"{name}_keys": keys for name, keys in self.program.trajectory_tracks
+            }
         elif self.program.trajectory_kind not in {"constant"}:
             raise PatternRuntimeError(
                 self.program.resource_id,
@@ -687,9 +1116,9 @@ class PatternRunner:
                 f"unknown trajectory kind {self.program.trajectory_kind!r}",
             )
         indices = context.create_bullets_batch(
-            positions=positions,
-            angles=angles,
-            speeds=speeds,
+            positions=position_array,
+            angles=angle_array,
+            speeds=speed_array,
             bullet_type=self.program.bullet_type,
             color=self.program.color,
             sprite_id=self.program.sprite_id or None,
@@ -704,16 +1133,61 @@ class PatternRunner:
             bounce_y=bool(parameters["motion.bounce_y"]),
             curve_type=curve_type,
             curve_param=curve_param,
+            **track_keys,
         )
         return PatternSpawnEvent(
             frame=frame,
             burst_index=burst_index,
             loop_index=loop_index,
             owner_tag=self.owner_tag,
-            positions=positions,
-            angles=angles,
-            speeds=speeds,
-            indices=tuple(int(index) for index in indices),
+            positions=tuple(map(tuple, position_array.tolist())),
+            angles=tuple(angle_array.tolist()),
+            speeds=tuple(speed_array.tolist()),
+            indices=tuple(np.asarray(indices, dtype=np.int64).tolist()),
+        )
+
+    def _bullet_columns(self, frame: int, context: Any, count: int) -> dict[str, np.ndarray]:
+        """Evaluate per-bullet expression bindings over the whole burst."""
+
+        variables = _binding_variables(frame, self.emission_count, context)
+        columns: dict[str, np.ndarray] = {}
+        for binding, evaluate in self._binding_plan.columns:
+            path = binding.target_path
+            variables["rng"] = _ColumnRandom(self.program, frame, self.emission_count, path)
+            try:
+                values = evaluate(variables, count)
+            except ExpressionError as exc:
+                raise PatternRuntimeError(
+                    self.program.resource_id, frame, f"{path}: {exc.message}"
+                ) from exc
+            if path == "bullet.speed_scale" and (values < 0.0).any():
+                raise PatternRuntimeError(
+                    self.program.resource_id, frame, f"{path} must be non-negative"
+                )
+            columns[path] = values
+        self.binding_evaluations += len(self._binding_plan.columns)
+        return columns
+
+    def _burst_template(self, parameters: dict[str, Any], burst_index: int) -> BurstTemplate:
+        """Return the precompiled burst, or a cached one for bound geometry."""
+
+        program = self.program
+        if not self._binding_plan.reshapes_burst and burst_index < len(program.templates):
+            return program.templates[burst_index]
+        return cached_burst_template(
+            burst_template_key(
+                kind=program.shape_kind,
+                count=parameters["shape.count"],
+                angle_span=parameters["shape.angle_span"],
+                line_length=parameters["shape.line_length"],
+                line_angle=parameters["shape.line_angle"],
+                speed=parameters["motion.speed"],
+                angle_offset_per_burst=parameters["modifiers.angle_offset_per_burst"],
+                speed_offset_per_burst=parameters["modifiers.speed_offset_per_burst"],
+                random_speed_variation=parameters["modifiers.random_speed_variation"],
+                seed=program.seed,
+                burst_index=burst_index,
+            )
         )
 
     def _speed_binding(self) -> CompiledBinding | None:
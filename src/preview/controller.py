@@ -13,11 +13,17 @@ from typing import Any, Mapping
 import numpy as np
 
 from src.authoring import ResourceReference, ResourceStore
+from src.core.checkpoints import (
+    DEFAULT_CHECKPOINT_BUDGET_BYTES,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointRing,
+)
 from src.core.project_context import ProjectContext
 from src.editor.document import DocumentError, SceneDocument
 from src.editor.stage_compile import StageCompileError
 from src.game.stage.context import StageContext
 from src.game.stage.program import (
+    StageCheckpoint,
     StageProgram,
     StageRunner,
     StageRuntimeError,
@@ -30,6 +36,7 @@ from src.pattern import (
     PatternProgram,
     PatternRunner,
     PatternRuntimeError,
+    pattern_cache_dir,
 )
 
 
@@ -123,7 +130,15 @@ class PatternPreviewController:
         compiler: PatternCompiler | None = None,
         sprite_index_resolver=None,
         audio_manager: Any | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        checkpoint_budget_bytes: int = DEFAULT_CHECKPOINT_BUDGET_BYTES,
     ) -> None:
+        if (
+            isinstance(checkpoint_interval, bool)
+            or not isinstance(checkpoint_interval, int)
+            or checkpoint_interval < 0
+        ):
+            raise ValueError("checkpoint_interval must be a non-negative integer")
         self.bullet_pool = bullet_pool
         self.project = project
         self.store = ResourceStore(project)
@@ -133,7 +148,7 @@ class PatternPreviewController:
             player=self.player,
             audio_manager=audio_manager,
         )
-        self.compiler = compiler or PatternCompiler()
+        self.compiler = compiler or PatternCompiler(pattern_cache_dir(project))
         self.sprite_index_resolver = sprite_index_resolver
         self.document: PatternDocument | SceneDocument | None = None
         self.program: PatternProgram | StageProgram | None = None
@@ -150,6 +165,11 @@ class PatternPreviewController:
         self._closed = False
         self.last_compatibility_decision: dict[str, Any] = {"policy": "initial"}
         self.reload_history: list[dict[str, Any]] = []
+        # Seek checkpoints include bullet-pool motion between ticks, so they
+        # are separate from the runners' own update-free seek checkpoints.
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = CheckpointRing(checkpoint_budget_bytes)
+        self._checkpoint_key: tuple[Any, tuple[float, float]] | None = None
 
     @property
     def mode(self) -> str:
@@ -498,19 +518,41 @@ class PatternPreviewController:
             )
         assert self.runner is not None
         start = time.perf_counter()
-        self.runner.reset(self.context)
-        self.frame = 0
-        if isinstance(self.runner, StageRunner):
-            self.runner.start(
-                self.context,
-                reset=False,
-                dispatch_actions=False,
-            )
+        player_position = (self.player.x, self.player.y)
+        if (
+            self._checkpoint_key is None
+            or self._checkpoint_key[0] is not self.runner
+            or self._checkpoint_key[1] != player_position
+        ):
+            # Player aim reads the live player position, so moving it
+            # invalidates every recorded frame.
+            self.checkpoints.clear()
+            self._checkpoint_key = (self.runner, player_position)
+        checkpoint = self.checkpoints.latest(frame)
+        if checkpoint is not None:
+            self._restore_checkpoint(checkpoint)
         else:
-            self.runner.start(self.context, reset=False)
+            self.runner.reset(self.context)
+            self.frame = 0
+            if isinstance(self.runner, StageRunner):
+                self.runner.start(
+                    self.context,
+                    reset=False,
+                    dispatch_actions=False,
+                )
+            else:
+                self.runner.start(self.context, reset=False)
         try:
-            for _ in range(frame):
+            for _ in range(frame - self.frame):
+                previous = self.frame
                 self._advance_one(dispatch_actions=False)
+                if (
+                    self.frame != previous
+                    and self.checkpoint_interval
+                    and self.frame % self.checkpoint_interval == 0
+                    and self.frame not in self.checkpoints
+                ):
+                    self._record_checkpoint()
         except Exception:
             raise
         finally:
@@ -522,6 +564,23 @@ class PatternPreviewController:
         self._status(f"Seeked to frame {frame}")
         self._emit_statistics()
 
+    def _record_checkpoint(self) -> None:
+        assert self.runner is not None
+        captured = self.runner.capture_checkpoint(self.context)
+        if captured is None:
+            return
+        nbytes = captured.nbytes if isinstance(captured, StageCheckpoint) else None
+        self.checkpoints.add(self.frame, (self.frame, captured), nbytes)
+
+    def _restore_checkpoint(self, checkpoint: tuple[int, Any]) -> None:
+        assert self.runner is not None
+        frame, captured = checkpoint
+        if isinstance(self.runner, StageRunner):
+            self.runner.restore_checkpoint(self.context, captured)
+        else:
+            self.runner.restore_checkpoint(captured, self.context)
+        self.frame = frame
+
     def reset(self) -> None:
         self._ensure_open("reset")
         self._require_loaded("reset")
@@ -691,6 +750,11 @@ class PatternPreviewController:
                 else {"active_instances": [], "trace": [], "diagnostics": []}
             ),
             "paused": self.state != PreviewState.PLAYING,
+            "event_lanes": (
+                self.context.event_bus.lane_stats
+                if self.context.event_bus is not None
+                else {}
+            ),
             "update_ms": round(self.last_update_ms, 6),
             "render_ms": round(self.last_render_ms, 6),
             "reload_ok": self.last_error is None,
@@ -0,0 +1,175 @@
+"""Background SE decoding, queued first plays and stage-transition stall metric."""
+
+from concurrent.futures import Future
+import threading
+import time
+
+import pytest
+
+from src.game import audio as audio_module
+from src.game.audio import AudioBank, AudioLoader, AudioManager, GameAudioBank
+
+
+class _Backend:
+    def is_initialized(self):
+        return True
+
+
+class _Sound:
+    def __init__(self, path):
+        self.path = path
+        self.volume = 1.0
+        self.plays = []
+        self.threads = []
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def play(self, loops=0):
+        self.plays.append((self.volume, loops))
+        self.threads.append(threading.current_thread())
+
+    def stop(self):
+        pass
+
+
+class _ManualLoader:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.jobs.append((future, fn, args))
+        return future
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for future, fn, args in jobs:
+            if future.set_running_or_notify_cancel():
+                future.set_result(fn(*args))
+
+
+@pytest.fixture
+def fake_decode(monkeypatch):
+    monkeypatch.setattr(audio_module, "get_audio_backend", lambda: _Backend())
+    decoded = []
+
+    def _load(self, path):
+        decoded.append(path)
+        return _Sound(path)
+
+    monkeypatch.setattr(AudioBank, "_load_sound_with_fallback", _load)
+    return decoded
+
+
+def _se_file(directory, name):
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_first_play_on_pending_se_is_queued_then_played_when_ready(tmp_path, fake_decode):
+    loader = _ManualLoader()
+    bank = AudioBank("test", loader=loader)
+
+    future = bank.load_se_async("shot", str(_se_file(tmp_path, "se_shot.wav")))
+
+    assert fake_decode == []
+    assert bank.has_se("shot")
+    assert bank.pending_se_count == 1
+    assert bank.play_se("shot", volume=0.5, loops=2) is True
+
+    loader.run_all()
+
+    sound = future.result()
+    assert sound.plays == []
+    assert bank.poll_loaded() == 1
+    assert bank.pending_se_count == 0
+    assert sound.plays == [(0.5, 2)]
+    assert bank.play_se("shot") is True
+    assert sound.plays[-1] == (1.0, 0)
+
+
+def test_clear_cancels_pending_decodes(tmp_path, fake_decode):
+    loader = _ManualLoader()
+    bank = AudioBank("test", loader=loader)
+    bank.load_se_async("shot", str(_se_file(tmp_path, "se_shot.wav")))
+    bank.play_se("shot")
+
+    bank.clear()
+    loader.run_all()
+
+    assert fake_decode == []
+    assert not bank.has_se("shot")
+    assert bank.play_se("shot") is False
+
+
+def test_synchronous_load_supersedes_pending_decode(tmp_path, fake_decode):
+    loader = _ManualLoader()
+    bank = AudioBank("test", loader=loader)
+    path = str(_se_file(tmp_path, "se_shot.wav"))
+    bank.load_se_async("shot", path)
+
+    assert bank.load_se("shot", path)
+    sync_sound = bank._se_cache["shot"]
+    loader.run_all()
+
+    assert bank._se_cache["shot"] is sync_sound
+
+
+def test_game_bank_background_defaults_decode_on_worker_thread(tmp_path, fake_decode):
+    for filename in GameAudioBank.DEFAULT_SE_MAP.values():
+        _se_file(tmp_path, filename)
+    loader = AudioLoader()
+    try:
+        bank = GameAudioBank(loader=loader)
+        bank.load_defaults(se_dir=str(tmp_path), bgm_dir=str(tmp_path / "music"), background=True)
+
+        assert bank.wait_until_loaded(timeout=5.0)
+        assert sorted(bank.get_se_names()) == sorted(GameAudioBank.DEFAULT_SE_MAP)
+        assert len(fake_decode) == len(GameAudioBank.DEFAULT_SE_MAP)
+    finally:
+        loader.shutdown(wait=True)
+
+
+def test_queued_play_runs_on_the_polling_thread_not_the_loader(tmp_path, fake_decode):
+    loader = AudioLoader()
+    try:
+        bank = AudioBank("test", loader=loader)
+        future = bank.load_se_async("shot", str(_se_file(tmp_path, "se_shot.wav")))
+        bank.play_se("shot")
+        sound = future.result(timeout=5.0)
+
+        deadline = time.monotonic() + 5.0
+        while not sound.plays and time.monotonic() < deadline:
+            bank.poll_loaded()
+            time.sleep(0.001)
+        assert sound.threads == [threading.current_thread()]
+    finally:
+        loader.shutdown(wait=True)
+
+
+def test_stage_transition_records_main_thread_stall(tmp_path, fake_decode, monkeypatch):
+    loader = _ManualLoader()
+    monkeypatch.setattr(audio_module, "_loader", loader)
+    _se_file(tmp_path / "audio" / "se", "se_boss.wav")
+    _se_file(tmp_path / "audio" / "se", "se_wave.wav")
+    manager = AudioManager(GameAudioBank(loader=loader))
+
+    bank = manager.load_stage_bank("stage9", str(tmp_path))
+
+    stall = manager.transition_stalls[-1]
+    assert manager.stage_bank is bank
+    assert stall.stage_id == "stage9"
+    assert stall.pending_se == 2
+    assert stall.stall_ms == manager.last_transition_stall_ms >= 0.0
+    assert manager.play_se("boss") is True
+
+    loader.run_all()
+    manager.update()
+    assert bank._se_cache["boss"].plays == [(1.0, 0)]
+
+    manager.set_stage_bank(None)
+    assert manager.transition_stalls[-1].stage_id == ""
+    assert len(manager.transition_stalls) == 2
@@ -0,0 +1,148 @@
+"""SoundCache residency, streaming and on-disk PCM cache contract."""
+
+import array
+import gc
+import math
+import wave
+
+import pytest
+
+miniaudio = pytest.importorskip("miniaudio")
+
+from src.core import audio_backend
+from src.core.audio_backend import Sound, SoundCache, StreamedSound
+from src.core.project_context import ProjectContext
+
+
+def _write_tone(path, seconds, sample_rate=44100, nchannels=2):
+    frames = int(seconds * sample_rate)
+    samples = array.array("h")
+    for index in range(frames):
+        value = int(8000 * math.sin(index * 0.05))
+        samples.extend([value] * nchannels)
+    with wave.open(str(path), "wb") as stream:
+        stream.setnchannels(nchannels)
+        stream.setsampwidth(2)
+        stream.setframerate(sample_rate)
+        stream.writeframes(samples.tobytes())
+    return path
+
+
+def test_short_clip_is_decoded_resident_and_cached_on_disk(tmp_path):
+    source = _write_tone(tmp_path / "se_short.wav", 0.1)
+    cache = SoundCache(cache_dir=str(tmp_path / "pcm"))
+
+    sound = cache.load(str(source))
+
+    assert type(sound) is Sound
+    assert cache.decode_count == 1
+    assert cache.resident_bytes == sound.memory_bytes > 0
+    assert len(list((tmp_path / "pcm").glob("*.pcm"))) == 1
+
+
+def test_second_startup_reads_pcm_cache_without_decoding(tmp_path, monkeypatch):
+    source = _write_tone(tmp_path / "se_short.wav", 0.1)
+    first = SoundCache(cache_dir=str(tmp_path / "pcm")).load(str(source))
+
+    def _no_decode(*args, **kwargs):
+        raise AssertionError("decode_file must not run on a warm cache")
+
+    monkeypatch.setattr(audio_backend.miniaudio, "decode_file", _no_decode)
+    warm = SoundCache(cache_dir=str(tmp_path / "pcm"))
+    second = warm.load(str(source))
+
+    assert warm.disk_hits == 1
+    assert warm.decode_count == 0
+    assert second._samples == first._samples
+
+
+def test_identical_sources_share_one_resident_buffer(tmp_path):
+    source = _write_tone(tmp_path / "se_short.wav", 0.1)
+    cache = SoundCache(cache_dir=None)
+
+    first = cache.load(str(source))
+    second = cache.load(str(source))
+
+    assert first is not second
+    assert first._samples is second._samples
+    assert cache.decode_count == 1
+    assert cache.resident_bytes == first.memory_bytes
+
+
+def test_long_clip_is_streamed_in_chunks(tmp_path):
+    source = _write_tone(tmp_path / "voice.wav", 1.0)
+    cache = SoundCache(stream_threshold_seconds=0.5, cache_dir=None)
+
+    sound = cache.load(str(source))
+
+    assert isinstance(sound, StreamedSound)
+    assert sound.memory_bytes == 0
+    assert cache.decode_count == 0
+    stream = sound.open_stream()
+    total = 0
+    for chunk in stream:
+        assert len(chunk) <= audio_backend.STREAM_CHUNK_FRAMES * sound.nchannels
+        total += len(chunk)
+    assert total == sound.num_frames * sound.nchannels == 44100 * 2
+
+
+def test_memory_budget_overflow_streams_and_released_pcm_returns(tmp_path):
+    first_path = _write_tone(tmp_path / "a.wav", 0.2)
+    second_path = _write_tone(tmp_path / "b.wav", 0.25)
+    one_clip = int(0.2 * 44100) * 2 * 2
+    cache = SoundCache(memory_budget=one_clip + 100, cache_dir=None)
+
+    first = cache.load(str(first_path))
+    overflow = cache.load(str(second_path))
+
+    assert type(first) is Sound
+    assert isinstance(overflow, StreamedSound)
+
+    del first
+    gc.collect()
+    assert cache.resident_bytes == 0
+    assert type(cache.load(str(first_path))) is Sound
+
+
+def test_unchanged_source_is_keyed_by_stat_without_rehashing(tmp_path, monkeypatch):
+    source = _write_tone(tmp_path / "se_short.wav", 0.1)
+    SoundCache(cache_dir=str(tmp_path / "pcm")).load(str(source))
+
+    def _no_hash(*args, **kwargs):
+        raise AssertionError("an unchanged file must not be re-hashed")
+
+    warm = SoundCache(cache_dir=str(tmp_path / "pcm"))
+    monkeypatch.setattr(warm, "_source_digest", _no_hash)
+    assert type(warm.load(str(source))) is Sound
+    assert warm.disk_hits == 1
+
+    _write_tone(source, 0.12)
+    edited = SoundCache(cache_dir=str(tmp_path / "pcm"))
+    edited.load(str(source))
+    assert edited.hash_count == 1
+    assert edited.decode_count == 1
+
+
+def test_pcm_cache_evicts_least_recently_used_entries_past_the_disk_limit(tmp_path):
+    lengths = {"a": 0.1, "b": 0.11, "c": 0.12}
+    sizes = {name: int(seconds * 44100) * 2 * 2 for name, seconds in lengths.items()}
+    cache = SoundCache(cache_dir=str(tmp_path / "pcm"), disk_limit=sizes["b"] + sizes["c"])
+    sounds = [cache.load(str(_write_tone(tmp_path / f"{name}.wav", seconds)))
+              for name, seconds in lengths.items()]
+
+    files = sorted(path.stat().st_size for path in (tmp_path / "pcm").glob("*.pcm"))
+    assert files == [sizes["b"], sizes["c"]]
+    assert all(type(sound) is Sound for sound in sounds)
+
+
+def test_relative_cache_dir_is_anchored_at_the_project_userdata(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    (project / "assets").mkdir(parents=True)
+    (project / "game_content").mkdir()
+    (project / "project.pystg.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(audio_backend, "get_project_context", lambda: ProjectContext(project))
+    monkeypatch.chdir(tmp_path)
+
+    cache = SoundCache()
+
+    assert cache.cache_dir == str(project.resolve() / "userdata" / "audio_cache" / "pcm")
@@ -18,6 +18,7 @@ import json
 import math
 from dataclasses import replace
 
+import numpy as np
 import pytest
 
 from src.authoring import ResourceStore, build_default_resource_type_registry
@@ -94,6 +95,31 @@ def test_empty_keyframes_evaluate_to_default():
     assert curve.evaluate(100) == -3.25
 
 
+@pytest.mark.parametrize("interpolation", CURVE_INTERPOLATIONS)
+def test_precomputed_sampler_matches_document_evaluation(interpolation):
+    rng = np.random.default_rng(35)
+    frames = np.cumsum(rng.integers(1, 9, size=64))
+    curve = CurveDocument.new(
+        "Sampled",
+        keyframes=tuple(
+            CurveKeyframe(int(frame), float(value))
+            for frame, value in zip(frames, rng.normal(size=len(frames)))
+        ),
+        interpolation=interpolation,
+        default=-7.0,
+    )
+    sampler = curve.sampler()
+    forward = np.arange(-5.0, float(frames[-1]) + 5.0, 0.25)
+    shuffled = rng.permutation(forward)
+
+    expected = [curve.evaluate(frame) for frame in forward]
+    assert [sampler.sample(frame) for frame in forward] == expected
+    assert [sampler.sample(frame) for frame in shuffled] == [
+        curve.evaluate(frame) for frame in shuffled
+    ]
+    assert curve.sample_array(forward).tolist() == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
 def test_curve_document_round_trip_preserves_semantics():
     original = CurveDocument.new(
         "Curve",
@@ -30,7 +30,7 @@ def test_falling_emoji_from_external_message_can_hit_player():
     player = DummyPlayer()
     x, y = _game_to_screen(player.pos[0], player.pos[1], *VIEWPORT)
     pool = EmojiObjectPool(VIEWPORT)
-    pool.falling.append(FallingEmoji("😂", x=x, y=y, vy=0.0))
+    pool.add(FallingEmoji("😂", x=x, y=y, vy=0.0))
 
     assert _make_system(pool).check_player_collision(player) is True
     assert pool.falling == []
@@ -40,7 +40,7 @@ def test_emoji_projectile_collision_still_removes_projectile():
     player = DummyPlayer()
     x, y = _game_to_screen(player.pos[0], player.pos[1], *VIEWPORT)
     pool = EmojiObjectPool(VIEWPORT)
-    pool.projectiles.append(EmojiProjectile("😂", x=x, y=y, vx=0.0, vy=0.0))
+    pool.add(EmojiProjectile("😂", x=x, y=y, vx=0.0, vy=0.0))
 
     assert _make_system(pool).check_player_collision(player) is True
     assert pool.projectiles == []
@@ -58,3 +58,22 @@ def test_emoji_projectile_lifetime_can_reach_default_player_lane():
     assert pool.projectiles
     assert all(p.max_lifetime >= 7.0 for p in pool.projectiles)
     assert any((p.vx * p.vx + p.vy * p.vy) ** 0.5 * p.max_lifetime > (py - oy) for p in pool.projectiles)
+
+
+def test_pool_moves_in_game_coordinates_and_retires_rows_in_the_kernel():
+    pool = EmojiObjectPool(VIEWPORT)
+    player = DummyPlayer(pos=(0.5, 0.5))
+    x, y = _game_to_screen(0.5, 0.5, *VIEWPORT)
+    pool.add(FallingEmoji("😡", x=x, y=y - 60.0, vy=60.0))
+    pool.add(EmojiProjectile("😂", x=x, y=y, vx=0.0, vy=0.0, max_lifetime=0.5))
+    pool.add(FallingEmoji("💩", x=x, y=VIEWPORT[1] + VIEWPORT[3] + 60.0, vy=60.0))
+
+    assert pool.update(0.25) == []
+    assert pool.update(0.25) == ["💩"]
+    assert len(pool) == 1 and pool.projectiles == []
+    falling = pool.falling[0]
+    assert abs(falling.x - x) < 1e-6 and abs(falling.y - (y - 30.0)) < 1e-6
+
+    pool.update(0.5)
+    assert _make_system(pool).check_player_collision(player) is True
+    assert len(pool) == 0
@@ -0,0 +1,179 @@
+from types import SimpleNamespace
+
+from src.game.emoji_danmaku.emoji_gl_renderer import (
+    ATLAS_COLUMNS,
+    EMOJI_INSTANCE_DTYPE,
+    EMOJI_TEX_SIZE,
+    EmojiGLRenderer,
+)
+from src.game.emoji_danmaku.emoji_pool import (
+    EMOJI_LIST,
+    EmojiObjectPool,
+    EmojiProjectile,
+    FallingEmoji,
+)
+
+
+VIEWPORT = (64, 32, 768, 896)
+
+
+class FakeTexture:
+    def __init__(self, size):
+        self.width, self.height = size
+        self.writes = []
+        self.released = False
+        self.filter = None
+
+    def write(self, data, viewport=None):
+        self.writes.append(viewport)
+
+    def read(self):
+        return bytes(self.width * self.height * 4)
+
+    def use(self, location=0):
+        pass
+
+    def release(self):
+        self.released = True
+
+
+class FakeBuffer:
+    def __init__(self, size):
+        self.size = size
+        self.written = 0
+
+    def orphan(self, size):
+        self.size = size
+
+    def write(self, data):
+        self.written = len(data)
+
+    def release(self):
+        pass
+
+
+class FakeVertexArray:
+    def __init__(self):
+        self.draws = []
+
+    def render(self, mode, instances=1):
+        self.draws.append(instances)
+
+
+class FakeProgram(dict):
+    def __missing__(self, key):
+        value = self[key] = SimpleNamespace(value=None)
+        return value
+
+
+class FakeContext:
+    def __init__(self):
+        self.textures = []
+        self.vaos = []
+        self.scissor = None
+        self.blend_func = None
+
+    def texture(self, size, components, data=None):
+        texture = FakeTexture(size)
+        self.textures.append(texture)
+        return texture
+
+    def buffer(self, data=None, reserve=0):
+        return FakeBuffer(len(data) if data is not None else reserve)
+
+    def program(self, vertex_shader, fragment_shader):
+        return FakeProgram()
+
+    def vertex_array(self, program, content):
+        vao = FakeVertexArray()
+        self.vaos.append(vao)
+        return vao
+
+    def enable(self, flag):
+        pass
+
+
+def test_emoji_layer_is_one_instanced_draw_and_atlas_grows_with_partial_uploads(monkeypatch):
+    monkeypatch.setattr(
+        EmojiGLRenderer,
+        "_glyph_bytes",
+        lambda self, ch: bytes(EMOJI_TEX_SIZE * EMOJI_TEX_SIZE * 4),
+    )
+    ctx = FakeContext()
+    renderer = EmojiGLRenderer(ctx, (1280, 960), EMOJI_LIST)
+    first_atlas = ctx.textures[0]
+    assert len(ctx.textures) == 1
+    assert first_atlas.writes[3] == (3 * EMOJI_TEX_SIZE, 0, EMOJI_TEX_SIZE, EMOJI_TEX_SIZE)
+
+    pool = EmojiObjectPool(VIEWPORT)
+    for index in range(5000):
+        pool.spawn_falling(EMOJI_LIST[index % len(EMOJI_LIST)])
+    fresh = (chr(0x1F910 + index) for index in range(4 * ATLAS_COLUMNS))
+    extra = [ch for ch in fresh if ch not in EMOJI_LIST][:ATLAS_COLUMNS]
+    assert len(extra) == ATLAS_COLUMNS
+    for ch in extra:
+        pool.add(FallingEmoji(ch, x=400.0, y=300.0, vy=0.0))
+
+    renderer.render_pool(pool, clip_rect=VIEWPORT)
+
+    vao = ctx.vaos[0]
+    assert vao.draws == [5000 + ATLAS_COLUMNS]
+    assert renderer.instance_buffer.written == (5000 + ATLAS_COLUMNS) * EMOJI_INSTANCE_DTYPE.itemsize
+    grown = ctx.textures[-1]
+    assert first_atlas.released and len(ctx.textures) == 2
+    assert grown.height == 2 * EMOJI_TEX_SIZE
+    assert grown.writes[0] == (0, 0, first_atlas.width, first_atlas.height)
+    # Glyphs past the first row land in the grown atlas one cell at a time.
+    second_row = len(EMOJI_LIST) + len(extra) - ATLAS_COLUMNS
+    assert len(grown.writes) == 1 + second_row
+    last = second_row - 1
+    assert renderer.uv_rect(extra[-1]) == (
+        last / ATLAS_COLUMNS,
+        0.5,
+        (last + 1) / ATLAS_COLUMNS,
+        1.0,
+    )
+    assert ctx.scissor is None
+
+
+def test_pool_layer_draws_falling_emoji_under_projectiles(monkeypatch):
+    monkeypatch.setattr(
+        EmojiGLRenderer,
+        "_glyph_bytes",
+        lambda self, ch: bytes(EMOJI_TEX_SIZE * EMOJI_TEX_SIZE * 4),
+    )
+    renderer = EmojiGLRenderer(FakeContext(), (1280, 960), EMOJI_LIST)
+    pool = EmojiObjectPool(VIEWPORT)
+    pool.add(EmojiProjectile(EMOJI_LIST[0], x=400.0, y=300.0, vx=0.0, vy=0.0, scale=2.0))
+    pool.add(FallingEmoji(EMOJI_LIST[1], x=400.0, y=300.0, vy=0.0, scale=1.0))
+    pool.add(EmojiProjectile(EMOJI_LIST[2], x=400.0, y=300.0, vx=0.0, vy=0.0, scale=3.0))
+    pool.add(FallingEmoji(EMOJI_LIST[3], x=400.0, y=300.0, vy=0.0, scale=0.5))
+
+    renderer.render_pool(pool, clip_rect=VIEWPORT)
+
+    sizes = renderer._instances["size"][:4] / renderer._instances["size"][0]
+    assert sizes.tolist() == [1.0, 0.5, 2.0, 3.0]
+
+
+def test_pool_layer_skips_glyphs_that_failed_to_bake(monkeypatch):
+    broken = EMOJI_LIST[1]
+
+    def glyph_bytes(self, ch):
+        if ch == broken:
+            raise OSError("missing glyph")
+        return bytes(EMOJI_TEX_SIZE * EMOJI_TEX_SIZE * 4)
+
+    monkeypatch.setattr(EmojiGLRenderer, "_glyph_bytes", glyph_bytes)
+    ctx = FakeContext()
+    renderer = EmojiGLRenderer(ctx, (1280, 960), EMOJI_LIST)
+    pool = EmojiObjectPool(VIEWPORT)
+    pool.add(FallingEmoji(EMOJI_LIST[0], x=400.0, y=300.0, vy=0.0, scale=1.0))
+    pool.add(FallingEmoji(broken, x=400.0, y=300.0, vy=0.0, scale=2.0))
+    pool.add(EmojiProjectile(EMOJI_LIST[2], x=400.0, y=300.0, vx=0.0, vy=0.0, scale=3.0))
+
+    renderer.render_pool(pool, clip_rect=VIEWPORT)
+
+    assert ctx.vaos[0].draws == [2]
+    sizes = renderer._instances["size"][:2] / renderer._instances["size"][0]
+    assert sizes.tolist() == [1.0, 3.0]
+    assert renderer._instances["uv_rect"][1].tolist() == list(renderer.uv_rect(EMOJI_LIST[2]))
@@ -13,10 +13,17 @@ Contract summary:
 
 import json
 import socket
+import time
 
 import pytest
 
-from src.game.adapters import EventAdapter, LoopbackAdapter, UDPAdapter
+from src.game.adapters import (
+    EventAdapter,
+    LocalIPCAdapter,
+    LoopbackAdapter,
+    UDPAdapter,
+    _LineFramer,
+)
 from src.game.events import EventBus
 
 
@@ -129,3 +136,159 @@ def test_adapter_can_drive_typed_scene_events_through_the_bus():
     bus.dispatch()
 
     assert scene_actions == [{"target": "scene", "action": "emitter_spawn", "x": 0.5, "y": -0.5}]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_line_framer_scans_a_trickled_backlog_once():
+    framer = _LineFramer()
+    frames = []
+    for byte in b'{"a": 1}\n\n{"b":':
+        frames.extend(bytes(raw) for raw in framer.feed(bytes([byte])))
+    frames.extend(bytes(raw) for raw in framer.feed(b' 2}\n{"c"'))
+
+    assert frames == [b'{"a": 1}', b'{"b": 2}']
+    assert bytes(framer.buffer) == b'{"c"' and framer.pending == 4
+
+
+def test_local_ipc_adapter_serves_concurrent_clients_with_limits():
+    bus = EventBus(max_queue=1024)
+    adapter = LocalIPCAdapter(port=0, max_clients=2, rate_limit=5, max_pending_bytes=64)
+    adapter.start(bus)
+    address = ("127.0.0.1", adapter.bound_port)
+    try:
+        idle = socket.create_connection(address)
+        idle.sendall(b'{"client": "idle"')
+        with socket.create_connection(address) as busy:
+            assert _wait_for(lambda: adapter.health()["clients"] == 2)
+            with socket.create_connection(address) as extra:
+                assert extra.recv(1) == b""
+            busy.sendall(b"".join(b'{"n": %d}\n' % index for index in range(8)))
+            assert _wait_for(lambda: adapter.health()["rate_limited"] == 3)
+            idle.sendall(b"}\n" + b"x" * 100)
+            assert _wait_for(lambda: adapter.health()["overflowed"] == 1)
+        idle.close()
+        assert _wait_for(lambda: adapter.health()["clients"] == 0)
+    finally:
+        adapter.stop()
+    payloads = []
+    bus.subscribe("adapter.local_ipc", lambda event: payloads.append(event.payload))
+    bus.dispatch()
+
+    health = adapter.health()
+    assert health["rejected"] == 1 and health["received"] == 6
+    assert payloads == [{"n": index} for index in range(5)] + [{"client": "idle"}]
+
+
+def test_local_ipc_rejected_frame_drops_only_its_client():
+    bus = EventBus(max_queue=4096)
+    adapter = LocalIPCAdapter(port=0)
+    assert adapter.rate_limit is None
+    adapter.start(bus)
+    address = ("127.0.0.1", adapter.bound_port)
+    try:
+        with socket.create_connection(address) as good:
+            with socket.create_connection(address) as bad:
+                assert _wait_for(lambda: adapter.health()["clients"] == 2)
+                bad.sendall(b'{"x": NaN}\n')
+                assert bad.recv(1) == b""
+            assert _wait_for(lambda: adapter.health()["clients"] == 1)
+            good.sendall(b"".join(b'{"n": %d}\n' % index for index in range(3000)))
+            assert _wait_for(lambda: bus.pending == 3000)
+        health = adapter.health()
+        assert health["running"] and health["ok"] and health["errors"] == 1
+        bus.close()
+        with socket.create_connection(address) as late:
+            late.sendall(b'{"n": "late"}\n')
+            assert _wait_for(lambda: not adapter.health()["running"])
+    finally:
+        adapter.stop()
+
+    assert adapter.health()["last_error"] == "event bus is closed"
+
+
+def test_udp_adapter_filters_raw_bytes_and_coalesces_each_drain():
+    bus = EventBus()
+    events = []
+    bus.subscribe("adapter.udp", lambda event: events.append(event))
+    adapter = UDPAdapter(host="127.0.0.1", port=0, require_any=(b"hit",), coalesce=True)
+    adapter.start(bus)
+    address = ("127.0.0.1", adapter.bound_port)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+        for _ in range(5):
+            client.sendto(b'{"kind": "hit"}', address)
+        client.sendto(b'{"kind": "miss"}', address)
+        client.sendto(b"{hit", address)
+        assert _wait_for(lambda: adapter.health()["errors"] == 1)
+    health = adapter.health()
+    adapter.stop()
+    bus.dispatch()
+
+    assert health["received"] == 5
+    assert health["filtered"] == 1 and health["errors"] == 1
+    assert sum(getattr(event, "count", 1) for event in events) == 5
+    assert {event.payload["kind"] for event in events} == {"hit"}
+    # Datagrams of one drain collapse into one counted event.
+    assert len(events) == 5 - health["coalesced"]
+
+
+def test_udp_receiver_merges_one_frame_of_emoji_into_counted_events():
+    from src.game.emoji_danmaku.udp_receiver import EMOJI_NEEDLES, UDPReceiver
+
+    receiver = UDPReceiver(port=0)
+    receiver.start()
+    address = ("127.0.0.1", receiver._adapter.bound_port)
+    messages = [
+        json.dumps({"cmd": "emoji", "emoji": "😂", "nickname": "a", "user_id": 1}),
+        json.dumps({"cmd": "stg", "args": "😂", "nickname": "b", "user_id": 2}),
+        json.dumps({"cmd": "emoji", "emoji": "😡"}, ensure_ascii=False),
+        json.dumps({"cmd": "emoji", "emoji": "🙂"}),
+        json.dumps({"cmd": "chat", "text": "hello"}),
+    ]
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+            for message in messages:
+                client.sendto(message.encode("utf-8"), address)
+            assert _wait_for(lambda: receiver._adapter.health()["filtered"] == 2)
+            assert _wait_for(lambda: receiver._adapter.health()["received"] == 3)
+        events = receiver.poll()
+    finally:
+        receiver.stop()
+
+    assert any(needle.startswith(b"\\u") for needle in EMOJI_NEEDLES)
+    assert sorted((event["emoji"], event["count"]) for event in events) == [
+        ("😂", 2),
+        ("😡", 1),
+    ]
+    assert receiver.poll() == []
+    lanes = receiver.lane_stats
+    assert all(stats["dropped"] == 0 for stats in lanes.values())
+    assert sum(stats["coalesced"] for stats in lanes.values()) == 0
+
+
+def test_udp_receiver_accepts_uppercase_json_escapes():
+    from src.game.emoji_danmaku.udp_receiver import UDPReceiver
+
+    receiver = UDPReceiver(port=0)
+    receiver.start()
+    address = ("127.0.0.1", receiver._adapter.bound_port)
+    messages = [
+        b'{"cmd":"emoji","emoji":"\\uD83D\\uDE02"}',
+        b'{"cmd":"emoji","emoji":"\\uD83d\\ude02"}',
+    ]
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+            for message in messages:
+                client.sendto(message, address)
+            assert _wait_for(lambda: receiver._adapter.health()["received"] == 2)
+        events = receiver.poll()
+    finally:
+        receiver.stop()
+
+    assert receiver._adapter.health()["filtered"] == 0
+    assert [(event["emoji"], event["count"]) for event in events] == [("😂", 2)]
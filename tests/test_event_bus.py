@@ -14,7 +14,7 @@ Contract summary:
 
 import pytest
 
-from src.game.events import Event, EventBus, EventBusError, Subscription
+from src.game.events import Event, EventBus, EventBusError, EventLane, Subscription
 
 
 def test_event_carries_type_source_frame_and_payload():
@@ -159,3 +159,168 @@ def test_event_is_immutable():
 
     with pytest.raises(Exception):
         event.type = "other"  # noqa: B018 - frozen dataclass must reject
+
+
+def test_batch_dispatch_matches_per_event_delivery_order():
+    def run(bus):
+        calls = []
+        bus.subscribe("a", lambda event: calls.append(("a", event.payload)))
+        bus.subscribe("*", lambda event: calls.append(("*", event.payload)))
+        bus.subscribe("b", lambda event: bus.emit("a", payload="late"))
+        bus.subscribe("b", lambda event: calls.append(("b", event.payload)))
+        for index in range(3):
+            bus.emit("a", payload=index)
+            bus.emit("b", payload=index)
+        count = bus.dispatch_frame()
+        bus.dispatch_frame()
+        return count, calls
+
+    assert run(EventBus(batch_dispatch=True)) == run(EventBus())
+
+
+def test_batch_dispatch_skips_events_of_owner_cancelled_mid_batch():
+    bus = EventBus(batch_dispatch=True)
+    seen = []
+    bus.subscribe("stop", lambda _event: bus.cancel_owner("boss"))
+    bus.subscribe("*", lambda event: seen.append(event.type))
+    bus.emit("stop")
+    bus.emit("boss.fact", owner="boss")
+    bus.emit("world.fact")
+    bus.dispatch()
+
+    assert seen == ["stop", "world.fact"]
+    assert bus.cancelled == 1
+
+
+def test_batch_dispatch_called_from_a_handler_keeps_the_running_batch():
+    bus = EventBus(batch_dispatch=True)
+    seen = []
+    nested = []
+
+    def stop(_event):
+        nested.append(bus.dispatch())
+        bus.cancel_owner("boss")
+
+    bus.subscribe("stop", stop)
+    bus.subscribe("*", lambda event: seen.append(event.type))
+    bus.emit("stop")
+    bus.emit("boss.fact", owner="boss")
+    bus.emit("world.fact")
+    bus.dispatch()
+
+    assert nested == [0]
+    assert seen == ["stop", "world.fact"]
+    assert bus.cancelled == 1
+    assert [event.type for event in bus.last_dispatched] == ["stop", "world.fact"]
+
+
+def test_unvalidated_payloads_are_checked_when_serialized():
+    bus = EventBus(validate_payloads=False)
+    marker = object()
+
+    event = bus.emit("raw", payload=marker)
+
+    assert event.payload is marker
+    with pytest.raises(EventBusError, match="unsupported type"):
+        event.to_dict()
+
+
+def test_unvalidated_events_stay_frozen_and_detached_from_the_caller():
+    bus = EventBus(validate_payloads=False)
+    payload = {"hp": 3}
+
+    event = bus.emit("raw", payload=payload)
+    lifecycle = bus.emit_lifecycle("bullet.cleared", payload=payload)
+    payload["hp"] = 0
+
+    assert event.payload == lifecycle.payload == {"hp": 3}
+    with pytest.raises(Exception):
+        event.payload = {}  # noqa: B018 - frozen dataclass must reject
+
+
+def test_cancelling_ten_thousand_owners_keeps_survivors_in_order():
+    bus = EventBus(max_queue=4)
+    calls = []
+    bus.subscribe("boss.hit", lambda event: calls.append(("first", event.payload)))
+    for index in range(10_000):
+        owner = f"boss-{index}"
+        bus.subscribe("boss.hit", lambda _event: calls.append("stale"), owner=owner)
+        bus.subscribe("*", lambda _event: calls.append("stale"), owner=owner)
+        bus.emit("boss.hit", payload=index, owner=owner)
+    # Build the dispatch snapshots so cancellation leaves tombstones in them.
+    bus.dispatch()
+    bus.subscribe("boss.hit", lambda event: calls.append(("last", event.payload)))
+    bus.emit("boss.hit", payload="x", owner="boss-9998")
+
+    removed = sum(bus.cancel_owner(f"boss-{index}") for index in range(10_000))
+    bus.emit("boss.hit", payload="kept")
+    bus.dispatch()
+
+    assert removed == 20_001
+    assert bus.cancelled == 20_001
+    assert calls[-2:] == [("first", "kept"), ("last", "kept")]
+    assert bus._owner_handlers == {} and bus._owner_pending == {}
+    assert [item.order for item in bus._handlers["boss.hit"].values()] == [1, 20_002]
+
+
+def test_adapter_flood_cannot_evict_lifecycle_events():
+    bus = EventBus(
+        max_queue=4,
+        lanes=(EventLane("external", 2, "drop_newest"),),
+    )
+    bus.emit_lifecycle("enemy.died", reason="killed")
+    for index in range(50):
+        bus.emit("adapter.udp", payload=index, source="udp")
+    bus.emit("score", payload=1)
+    seen = []
+    bus.subscribe("*", lambda event: seen.append((event.type, event.payload)))
+    bus.dispatch()
+
+    assert seen == [
+        ("enemy.died", None),
+        ("adapter.udp", 0),
+        ("adapter.udp", 1),
+        ("score", 1),
+    ]
+    stats = bus.lane_stats
+    assert stats["external"]["dropped"] == 48 and bus.dropped == 48
+    assert stats["engine"]["dropped"] == stats["gameplay"]["dropped"] == 0
+    assert all(lane["pending"] == 0 for lane in stats.values())
+
+
+def test_max_queue_bounds_all_lanes_and_evicts_from_the_fullest():
+    bus = EventBus(max_queue=4)
+    bus.emit_lifecycle("enemy.died", reason="killed")
+    for index in range(3):
+        bus.emit("adapter.udp", payload=index, source="udp")
+    bus.emit("score", payload=1)
+    bus.tick()
+    bus.emit("score", payload=2)
+
+    assert bus.pending == 4
+    seen = []
+    bus.subscribe("*", lambda event: seen.append((event.type, event.payload)))
+    bus.dispatch(strict=True)
+
+    assert seen == [("enemy.died", None), ("adapter.udp", 2), ("score", 1)]
+    stats = bus.lane_stats
+    assert stats["external"]["dropped"] == 2 and bus.dropped == 2
+    assert stats["engine"]["dropped"] == stats["gameplay"]["dropped"] == 0
+    assert bus.pending == 1
+
+
+def test_coalescing_lane_keeps_newest_payload_per_key_in_place():
+    bus = EventBus(lanes=(EventLane("gameplay", 3, "coalesce"),))
+    bus.emit("cursor", payload=1, source="mouse")
+    bus.emit("click", payload=1, source="mouse")
+    bus.emit("cursor", payload=2, source="mouse")
+    bus.emit("cursor", payload=3, source="mouse")
+    bus.emit("key", payload="z", source="keyboard")
+    seen = []
+    bus.subscribe("*", lambda event: seen.append((event.type, event.payload)))
+    bus.dispatch()
+
+    # "cursor"=3 replaced the newest cursor; "key" had no match and dropped "cursor"=1.
+    assert seen == [("click", 1), ("cursor", 3), ("key", "z")]
+    assert bus.lane_stats["gameplay"]["coalesced"] == 1
+    assert bus.lane_stats["gameplay"]["dropped"] == 1
@@ -91,3 +91,95 @@ def test_stage_context_converts_pool_batches_without_per_bullet_events():
     assert events[0].count == 12
     assert events[0].reason == "bomb_cancelled"
     assert events[0].payload["count"] == 12
+
+
+def test_death_columns_fold_into_one_summary_per_tag_and_reason_for_the_timeline():
+    from src.game.reactions import ActivationRule, ReactionSpec, ReactiveClip, ReactiveTimeline
+
+    pool = OptimizedBulletPool(max_bullets=4096)
+    for tag in (1, 2, 3):
+        pool.spawn_bullets_batch(
+            positions=np.zeros((1000, 2), dtype="f4"),
+            angles=np.zeros(1000, dtype="f4"),
+            speeds=np.zeros(1000, dtype="f4"),
+            tag=tag,
+            max_lifetime=0.01,
+        )
+    pool.spawn_bullets_batch(
+        positions=np.zeros((500, 2), dtype="f4"),
+        angles=np.zeros(500, dtype="f4"),
+        speeds=np.zeros(500, dtype="f4"),
+        tag=4,
+    )
+    pool.clear_by_tag(4, reason="owner_cancelled")
+    pool.update(0.02)
+    deaths = pool.drain_death_columns()
+
+    assert len(deaths) == 3500
+    assert deaths.counts() == {
+        (1, "expired"): 1000,
+        (2, "expired"): 1000,
+        (3, "expired"): 1000,
+        (4, "owner_cancelled"): 500,
+    }
+    assert pool.drain_lifecycle_batches() == ()
+
+    seen = []
+
+    def action(event, scope):
+        seen.append((event.owner, event.reason, event.count, len(event.representative_ids)))
+
+    clip = ReactiveClip(
+        "tag-2-expired",
+        ReactionSpec("expired", "bullet.terminated", action, once_per_scope=False),
+        activation=ActivationRule(
+            kind="on_lifecycle", event_type="bullet.terminated", owner="2", reason="expired"
+        ),
+    )
+    timeline = ReactiveTimeline((clip,))
+    timeline.tick("state", 0, deaths=deaths)
+
+    assert seen == [("2", "expired", 1000, 8)]
+
+
+def test_drained_batches_keep_recording_order_and_raw_reasons():
+    pool = OptimizedBulletPool(max_bullets=64)
+
+    def spawn(tag, count, lifetime=0.0):
+        return pool.spawn_bullets_batch(
+            positions=np.zeros((count, 2), dtype="f4"),
+            angles=np.zeros(count, dtype="f4"),
+            speeds=np.zeros(count, dtype="f4"),
+            tag=tag,
+            max_lifetime=lifetime,
+        )
+
+    spawn(5, 2)
+    pool.clear_by_tag(5, reason="owner_cancelled")
+    spawn(5, 3)
+    pool.clear_by_tag(5, reason="owner_cancelled")
+    spawn(7, 1)
+    pool.clear_by_tag(7, reason=None)
+    spawn(3, 2, 0.01)
+    spawn(1, 2, 0.01)
+    marked = spawn(2, 4, 0.01)
+    pool._termination_reasons.update(
+        {int(marked[0]): "zeta", int(marked[1]): "alpha", int(marked[2]): "zeta"}
+    )
+    pool.update(0.02)
+
+    batches = pool.drain_lifecycle_batches()
+
+    # Separate clears stay separate; an update lists expired, out_of_bounds,
+    # explicit reasons by name, then hit_destroyed, tags ascending in each.
+    assert [(batch.reason, batch.owner, batch.count) for batch in batches] == [
+        ("owner_cancelled", "5", 2),
+        ("owner_cancelled", "5", 3),
+        (None, "7", 1),
+        ("expired", "1", 2),
+        ("expired", "2", 1),
+        ("expired", "3", 2),
+        ("alpha", "2", 1),
+        ("zeta", "2", 2),
+    ]
+    assert all(len(batch.representative_ids) == batch.count for batch in batches)
@@ -1,6 +1,8 @@
 from dataclasses import FrozenInstanceError, replace
 import json
+import os
 
+import numpy as np
 import pytest
 
 from src.core.project_context import ProjectContext
@@ -11,6 +13,7 @@ from src.pattern import (
     PatternCompiler,
     PatternDocument,
 )
+from src.pattern.compiler import _CACHE_VERSION
 
 
 def _from_spec(**changes):
@@ -59,6 +62,91 @@ def test_compiler_returns_cached_immutable_program():
         first.name = "mutated"
 
 
+def test_disk_cache_reuses_programs_across_compilers(tmp_path, monkeypatch):
+    document = PatternDocument.new("DiskCached")
+    writer = PatternCompiler(tmp_path)
+    original = writer.compile(document)
+    entry = tmp_path / f"{original.content_hash}-{_CACHE_VERSION}.npz"
+
+    reader = PatternCompiler(tmp_path)
+    loaded = reader.compile(PatternDocument.from_dict(document.to_dict()))
+
+    assert writer.disk_writes == 1 and entry.is_file()
+    assert reader.disk_hits == 1 and reader.disk_writes == 0
+    assert loaded == original and loaded is not original
+    assert not loaded.templates[0].angle_array.flags.writeable
+    assert not list(tmp_path.glob("*.tmp"))
+
+    monkeypatch.setattr("src.pattern.compiler._CACHE_FINGERPRINT", "stale")
+    stale = PatternCompiler(tmp_path)
+    assert stale.compile(document) == original
+    assert stale.disk_hits == 0 and stale.disk_writes == 1
+
+    entry.write_bytes(b"not an archive")
+    corrupt = PatternCompiler(tmp_path)
+    assert corrupt.compile(document) == original
+    assert corrupt.disk_hits == 0 and corrupt.disk_writes == 1
+
+
+def test_disk_cache_entries_never_unpickle(tmp_path):
+    class _Payload:
+        def __reduce__(self):
+            return (exec, ("raise SystemExit('cache entry executed code')",))
+
+    document = PatternDocument.new("Untrusted")
+    original = PatternCompiler(tmp_path).compile(document)
+    entry = tmp_path / f"{original.content_hash}-{_CACHE_VERSION}.npz"
+    np.savez(entry, meta=np.array([_Payload()], dtype=object))
+
+    reader = PatternCompiler(tmp_path)
+    assert reader.compile(document) == original
+    assert reader.disk_hits == 0 and reader.disk_writes == 1
+
+
+def test_disk_cache_round_trips_bindings_and_a_new_compiler_version(tmp_path, monkeypatch):
+    from src.pattern import BindingSpec
+
+    document = PatternDocument.new("Bound")
+    document.schedule = replace(document.schedule, burst_count=3)
+    document.bindings = (
+        BindingSpec(path="motion.speed", kind="expression", value="1.5 + burst_index / 3"),
+    )
+    original = PatternCompiler(tmp_path).compile(document)
+
+    loaded = PatternCompiler(tmp_path).compile(PatternDocument.from_dict(document.to_dict()))
+    assert loaded == original and loaded is not original
+    assert loaded.bindings[0].expression_node == original.bindings[0].expression_node
+
+    monkeypatch.setattr("src.pattern.compiler._CACHE_VERSION", "next")
+    upgraded = PatternCompiler(tmp_path)
+    assert upgraded.compile(document) == original
+    assert upgraded.disk_hits == 0 and upgraded.disk_writes == 1
+    assert (tmp_path / f"{original.content_hash}-next.npz").is_file()
+    assert not (tmp_path / f"{original.content_hash}-{_CACHE_VERSION}.npz").exists()
+
+
+def test_disk_cache_evicts_least_recently_used_entries_past_the_disk_limit(tmp_path):
+    def entry(program, directory=tmp_path):
+        return directory / f"{program.content_hash}-{_CACHE_VERSION}.npz"
+
+    stale = tmp_path / f"0123abcd-{'0' * len(_CACHE_VERSION)}.npz"
+    stale.write_bytes(b"old compiler output")
+    documents = [PatternDocument.new(name) for name in ("First", "Second", "Third")]
+    writer = PatternCompiler(tmp_path)
+    first, second = (writer.compile(document) for document in documents[:2])
+    assert not stale.exists()
+    os.utime(entry(first), ns=(1, 1))
+    os.utime(entry(second), ns=(2, 2))
+
+    # A disk hit marks the first entry as the most recently used one.
+    assert PatternCompiler(tmp_path).compile(documents[0]) == first
+    third = PatternCompiler(tmp_path / "probe").compile(documents[2])
+    limit = entry(first).stat().st_size + entry(third, tmp_path / "probe").stat().st_size
+    PatternCompiler(tmp_path, disk_limit=limit).compile(documents[2])
+
+    assert sorted(tmp_path.glob("*.npz")) == sorted((entry(first), entry(third)))
+
+
 def test_line_shape_precomputes_offsets_and_motion_direction():
     document = PatternDocument.new()
     document.shape = replace(
@@ -167,3 +255,22 @@ def test_unknown_alias_reports_structured_bullet_path(tmp_path):
     assert diagnostic.resource_id == document.id
     assert diagnostic.path == "bullet"
     assert "ball_m/red" in diagnostic.message
+
+
+def test_keyframed_trajectory_rejects_unordered_keys():
+    document = PatternDocument.new()
+    document.header.metadata["trajectory"] = {
+        "kind": "keyframed",
+        "speed_keys": [[10, 60.0], [5, 90.0]],
+    }
+
+    with pytest.raises(PatternCompileError) as caught:
+        PatternCompiler().compile(document)
+
+    diagnostic = caught.value.diagnostics[0]
+    assert diagnostic.code == "invalid_trajectory"
+    assert diagnostic.path == "metadata.trajectory.speed_keys"
+
+    document.header.metadata["trajectory"]["speed_keys"] = [[0, 60.0], [30, 90.0]]
+    program = PatternCompiler().compile(document)
+    assert program.trajectory_tracks == (("speed", ((0.0, 60.0), (30.0, 90.0))),)
@@ -39,6 +39,7 @@ from src.pattern import (
     compile_expression,
 )
 from src.pattern.expressions import EXPRESSION_VARIABLES, ExpressionError
+from src.pattern.runtime import _binding_rng
 
 
 class DummyPlayer:
@@ -370,3 +371,178 @@ def test_expression_binding_uses_burst_index_in_runtime():
     ]
     assert not pool.emitter_callbacks
     assert not pool.death_handlers
+
+
+def test_binding_plan_defers_emission_targets_and_replays_random_per_burst():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, count=1)
+    document.schedule = replace(document.schedule, interval_frames=4, burst_count=3)
+    document.bindings = (
+        BindingSpec(path="schedule.interval_frames", kind="expression", value="2 + 2"),
+        BindingSpec(path="motion.speed", kind="expression", value="1.0 + random + random"),
+        BindingSpec(path="motion.spin", kind="variable", value="random"),
+        BindingSpec(path="shape.angle_span", kind="expression", value="360.0 * random"),
+    )
+
+    program = PatternCompiler().compile(document)
+    context = StageContext(OptimizedBulletPool(max_bullets=64), DummyPlayer())
+    runner = PatternRunner(program, owner_tag=5004)
+    runner.start(context)
+    events = [result.event for result in runner.advance(context, 12) if result.event]
+
+    assert [event.frame for event in events] == [0, 4, 8]
+    # One timing binding per live tick (frames 0..8); three per burst.
+    assert runner.binding_evaluations == 9 + 3 * 3
+    for burst_index, event in enumerate(events):
+        # Each binding reads the (frame, burst) stream from its start.
+        rng = _binding_rng(program, event.frame, burst_index)
+        first, second = rng.random(), rng.random()
+        assert event.speeds == pytest.approx((1.0 + first + second,))
+
+
+def _random_source(rng, depth):
+    if depth <= 0 or rng.random() < 0.25:
+        if rng.random() < 0.5:
+            return rng.choice(["frame", "time", "burst_index", "player_x", "random"])
+        return repr(round(rng.uniform(-9.0, 9.0), rng.randint(0, 3)))
+    left = _random_source(rng, depth - 1)
+    right = _random_source(rng, depth - 1)
+    choice = rng.randrange(7)
+    if choice == 0:
+        return f"({left} {rng.choice(['+', '-', '*', '/', '//', '%'])} {right})"
+    if choice == 1:
+        return f"({left}) ** {rng.randint(0, 3)}"
+    if choice == 2:
+        return f"-({left})"
+    if choice == 3:
+        name = rng.choice(["min", "max", "abs", "clamp"])
+        if name == "abs":
+            return f"abs({left})"
+        if name == "clamp":
+            return f"clamp({left}, {right}, {_random_source(rng, depth - 1)})"
+        return f"{name}({left}, {right})"
+    if choice == 4:
+        return f"(1 if {left} {rng.choice(['<', '<=', '>', '>=', '==', '!='])} {right} else 0)"
+    if choice == 5:
+        return f"({left} if {right} else {_random_source(rng, depth - 1)})"
+    return f"({left} >= {right})"
+
+
+def test_lowered_evaluator_matches_the_interpreter_on_fuzzed_expressions():
+    from src.pattern.expressions import evaluate_node, expression_evaluator
+
+    rng = random.Random(20260418)
+    checked = 0
+    for _ in range(1500):
+        source = _random_source(rng, rng.randint(1, 5))
+        try:
+            node = compile_expression(source).node
+        except ExpressionError:
+            continue
+        variables = {
+            "frame": float(rng.randint(0, 600)),
+            "time": rng.uniform(0.0, 10.0),
+            "burst_index": float(rng.randint(0, 8)),
+            "player_x": rng.uniform(-1.0, 1.0),
+        }
+        seed = rng.getrandbits(32)
+        outcomes = []
+        for evaluate in (lambda ctx: evaluate_node(node, ctx), expression_evaluator(node)):
+            context = dict(variables, rng=random.Random(seed))
+            try:
+                outcomes.append(("value", evaluate(context), context["rng"].random()))
+            except ExpressionError:
+                outcomes.append(("error",))
+        assert outcomes[0] == outcomes[1], source
+        checked += 1
+    assert checked > 1000
+
+
+def test_lowered_evaluator_is_composed_without_generated_source():
+    from src.pattern import expressions
+    from src.pattern.expressions import expression_evaluator
+
+    evaluate = expression_evaluator(compile_expression("frame + 1").node)
+    assert evaluate.__code__.co_filename == expressions.__file__
+    with pytest.raises(ExpressionError, match="division by zero"):
+        expression_evaluator(compile_expression("1 / (frame - 2)").node)({"frame": 2.0})
+    with pytest.raises(ExpressionError, match="non-finite"):
+        expression_evaluator(compile_expression("frame * frame * 10").node)({"frame": 1e200})
+
+
+def test_vector_evaluator_lanes_match_scalar_evaluation():
+    import numpy as np
+    from src.pattern.expressions import BULLET_VARIABLES, expression_evaluator, vector_evaluator
+
+    rng = random.Random(34)
+    checked = 0
+    for _ in range(400):
+        # Conditionals draw both branches in a column, so compare without random.
+        body = _random_source(rng, 4).replace("random", "player_x")
+        source = f"{body} + index * {rng.randint(0, 5)} / count"
+        try:
+            node = compile_expression(source, extra_variables=BULLET_VARIABLES).node
+        except ExpressionError:
+            continue
+        variables = {
+            "frame": float(rng.randint(0, 600)),
+            "time": 2.5,
+            "burst_index": 3.0,
+            "player_x": rng.uniform(-1.0, 1.0),
+        }
+        size = 16
+        lanes = []
+        for lane in range(size):
+            try:
+                lanes.append(
+                    expression_evaluator(node)(dict(variables, index=float(lane), count=float(size)))
+                )
+            except ExpressionError:
+                lanes.append(None)
+        try:
+            column = vector_evaluator(node)(variables, size)
+        except ExpressionError:
+            assert None in lanes, source
+            continue
+        if None in lanes:
+            continue  # columns only check the result, not masked lanes
+        # pow may round differently from math.pow in the last place.
+        assert column.tolist() == pytest.approx(lanes, rel=1e-12, abs=1e-300), source
+        checked += 1
+    assert checked > 200
+
+
+def test_per_bullet_bindings_fill_burst_columns_in_one_call():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, kind="ring", count=1000)
+    document.schedule = replace(document.schedule, interval_frames=1, burst_count=2)
+    document.bindings = (
+        BindingSpec(path="bullet.angle_offset", kind="expression", value="random * 4.0 - 2.0"),
+        BindingSpec(path="bullet.speed_scale", kind="expression", value="1.0 + index / count"),
+    )
+    program = PatternCompiler().compile(document)
+    pool = OptimizedBulletPool(max_bullets=4096)
+    context = StageContext(pool, DummyPlayer())
+    runner = PatternRunner(program, owner_tag=5005)
+    runner.start(context)
+    events = [result.event for result in runner.advance(context, 2)]
+
+    base = [program.aim_angle + value for value in program.templates[0].angle_offsets]
+    offsets = [angle - reference for angle, reference in zip(events[0].angles, base)]
+    assert all(-2.0 <= value <= 2.0 for value in offsets)
+    assert len(set(offsets)) > 900
+    assert events[0].speeds == pytest.approx(
+        [speed * (1.0 + index / 1000) for index, speed in enumerate(program.templates[0].speeds)]
+    )
+    # Two per-bullet bindings per burst: one vector evaluation each.
+    assert runner.binding_evaluations == 2 * 2
+
+    replay = PatternRunner(program, owner_tag=5006)
+    replay.start(context)
+    assert [result.event.angles for result in replay.advance(context, 2)] == [
+        event.angles for event in events
+    ]
+
+    with pytest.raises(PatternCompileError):
+        document.bindings = (BindingSpec(path="motion.speed", kind="expression", value="index"),)
+        PatternCompiler().compile(document)
@@ -1,4 +1,6 @@
 from dataclasses import replace
+import hashlib
+import json
 import math
 
 import numpy as np
@@ -218,3 +220,265 @@ def test_runtime_failure_has_resource_frame_and_actionable_detail():
     assert caught.value.frame == 0
     assert "active player" in caught.value.detail
     assert runner.state == PatternRunnerState.ERROR
+
+
+def test_checkpointed_seek_matches_a_linear_replay_bit_for_bit():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, kind="random", count=3)
+    document.schedule = replace(document.schedule, interval_frames=2, loop_count=None)
+    document.modifiers = replace(document.modifiers, random_speed_variation=0.25)
+    program = PatternCompiler().compile(document)
+
+    def _seek(frames, interval):
+        pool = OptimizedBulletPool(max_bullets=256)
+        context = StageContext(pool, DummyPlayer())
+        runner = PatternRunner(program, owner_tag=1001, checkpoint_interval=interval)
+        for frame in frames:
+            results = runner.seek(context, frame)
+        runner.resume()
+        runner.advance(context, 7)
+        return pool, runner, results
+
+    linear_pool, linear, _ = _seek((61,), 0)
+    seeked_pool, seeked, results = _seek((90, 61), 10)
+
+    assert seeked.checkpoints.frames == tuple(range(10, 91, 10))
+    assert len(results) == 1
+    assert seeked.frame == linear.frame == 68
+    assert seeked.spawn_trace == linear.spawn_trace
+    assert seeked_pool.data.tobytes() == linear_pool.data.tobytes()
+    assert seeked_pool.free_indices == linear_pool.free_indices
+
+
+def test_checkpointed_seek_replays_player_aim_after_the_player_moves():
+    document = PatternDocument.new()
+    document.aim = AimSpec(mode="player")
+    document.schedule = replace(document.schedule, interval_frames=2, loop_count=None)
+    program = PatternCompiler().compile(document)
+
+    def _seek(frames, interval):
+        player = DummyPlayer(-0.5, -0.8)
+        pool = OptimizedBulletPool(max_bullets=256)
+        context = StageContext(pool, player)
+        runner = PatternRunner(program, owner_tag=1001, checkpoint_interval=interval)
+        for frame in frames:
+            runner.seek(context, frame)
+            player.pos = [0.5, -0.8]
+        return pool
+
+    linear = _seek((60, 50), 0)
+    seeked = _seek((60, 50), 10)
+
+    assert seeked.data.tobytes() == linear.data.tobytes()
+    assert seeked.free_indices == linear.free_indices
+
+
+# sha256 prefixes of the burst positions/angles/speeds (as float.hex) that the
+# per-burst tuple runtime produced before burst templates became arrays.
+_TUPLE_RUNTIME_BURSTS = {
+    ("ring", False): "008ee9d7cc101ece",
+    ("ring", True): "4218c0085e56fc16",
+    ("arc", False): "a86fce839bcb13b8",
+    ("arc", True): "5546fba0ae1753d0",
+    ("spiral", False): "190825a1ef00576c",
+    ("spiral", True): "cb7bf49e5fc422f5",
+    ("flower", False): "7699d2be1a894380",
+    ("flower", True): "943fc2b4650690a5",
+    ("line", False): "a5b87643206ce290",
+    ("line", True): "569e35d5f7a0ae1f",
+    ("random", False): "7543cc0e45e0cd28",
+    ("random", True): "16cadc9b8018bb8d",
+}
+
+
+def _burst_digest(events):
+    values = [
+        [
+            [float(value).hex() for position in event.positions for value in position],
+            [float(value).hex() for value in event.angles],
+            [float(value).hex() for value in event.speeds],
+        ]
+        for event in events
+    ]
+    return hashlib.sha256(json.dumps(values).encode("ascii")).hexdigest()[:16]
+
+
+@pytest.mark.parametrize("kind", ["ring", "arc", "spiral", "flower", "line", "random"])
+@pytest.mark.parametrize("bound", [False, True])
+def test_array_bursts_match_the_tuple_runtime_output(kind, bound):
+    from src.pattern import BindingSpec
+    from src.pattern.compiler import cached_burst_template
+    from src.pattern.document import ModifierSpec
+
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, kind=kind, count=7, angle_span=150.0)
+    document.schedule = replace(document.schedule, interval_frames=1, burst_count=3)
+    document.modifiers = ModifierSpec(
+        angle_offset_per_burst=12.5,
+        speed_offset_per_burst=0.25,
+        random_speed_variation=0.2,
+    )
+    if bound:
+        document.bindings = (
+            BindingSpec(path="motion.speed", kind="expression", value="1.5 + burst_index / 3"),
+            BindingSpec(path="shape.count", kind="expression", value="5 + burst_index"),
+        )
+    pool, context, runner = _runtime(document)
+    runner.start(context)
+    events = [result.event for result in runner.advance(context, 3)]
+    hits = cached_burst_template.cache_info().hits
+    runner.reset(context)
+    runner.start(context)
+    replayed = [result.event for result in runner.advance(context, 3)]
+
+    assert _burst_digest(events) == _TUPLE_RUNTIME_BURSTS[(kind, bound)]
+    assert _burst_digest(replayed) == _burst_digest(events)
+    assert all(isinstance(value, float) for event in events for value in event.speeds)
+    assert pool.data["speed"][: len(events[0].speeds)].tolist() == pytest.approx(
+        [value / 60.0 for value in events[0].speeds]
+    )
+    if bound:
+        assert cached_burst_template.cache_info().hits >= hits + 3
+
+
+def test_bound_burst_parameters_are_not_rounded_before_generation():
+    from src.pattern import BindingSpec
+
+    document = PatternDocument.new()
+    # Rounding this speed to 9 digits first would yield 1.99087.
+    document.bindings = (
+        BindingSpec(path="motion.speed", kind="expression", value="1.9908705001894258"),
+    )
+    pool, context, runner = _runtime(document)
+    runner.start(context)
+
+    event = runner.advance(context, 1)[0].event
+
+    assert set(event.speeds) == {1.990871}
+
+
+def test_spawn_trace_is_a_bounded_ring_with_optional_detail_window():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, count=2)
+    document.schedule = replace(
+        document.schedule, interval_frames=1, burst_count=1, loop_count=None
+    )
+    program = PatternCompiler().compile(document)
+    pool = OptimizedBulletPool(max_bullets=4096)
+    context = StageContext(pool, DummyPlayer())
+    runner = PatternRunner(
+        program, owner_tag=1001, spawn_trace_capacity=8, spawn_detail_capacity=3
+    )
+    runner.start(context)
+
+    events = [result.event for result in runner.advance(context, 20)]
+    trace = runner.spawn_trace
+    columns = trace.columns()
+
+    assert len(trace) == 8 and trace.total == 20 and trace.dropped == 12
+    assert columns["frame"].tolist() == list(range(12, 20))
+    assert columns["spawned_count"].tolist() == [2] * 8
+    assert trace.last_hash == int(columns["spawn_hash"][-1])
+    assert list(trace.details) == events[-3:]
+
+    restored = PatternRunner(
+        program, owner_tag=1002, spawn_trace_capacity=8, spawn_detail_capacity=3
+    )
+    restored.restore_checkpoint(runner.capture_checkpoint())
+    assert restored.spawn_trace == trace
+
+
+def test_looping_pattern_spawn_trace_storage_stays_fixed_while_wrapping():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, count=1)
+    document.schedule = replace(
+        document.schedule, interval_frames=1, burst_count=1, loop_count=None
+    )
+    _, context, _ = _runtime(document, capacity=64)
+    runner = PatternRunner(
+        PatternCompiler().compile(document),
+        owner_tag=1001,
+        spawn_trace_capacity=32,
+        spawn_detail_capacity=4,
+    )
+    runner.start(context)
+    trace = runner.spawn_trace
+    columns = dict(trace._columns)
+    nbytes = trace.nbytes
+
+    for _ in range(10 * trace.capacity):
+        runner.tick(context)
+
+    assert trace.total == 10 * trace.capacity
+    assert len(trace) == trace.capacity and len(trace.details) == 4
+    assert trace.nbytes == nbytes
+    assert all(trace._columns[name] is column for name, column in columns.items())
+
+
+@pytest.mark.soak
+def test_looping_pattern_spawn_trace_memory_is_bounded_for_a_million_frames():
+    import tracemalloc
+
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, count=1)
+    document.schedule = replace(
+        document.schedule, interval_frames=1, burst_count=1, loop_count=None
+    )
+    # A full pool keeps spawning cheap; the trace still records each burst.
+    _, context, runner = _runtime(document, capacity=64)
+    runner.start(context)
+
+    tracemalloc.start()
+    try:
+        for _ in range(20_000):
+            runner.tick(context)
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(1_000_000 - 20_000):
+            runner.tick(context)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert runner.spawn_trace.total == 1_000_000
+    assert len(runner.spawn_trace) == runner.spawn_trace.capacity
+    assert current - baseline < 256 * 1024
+
+
+def test_keyframed_trajectory_is_sampled_by_the_bullet_kernel():
+    document = PatternDocument.new()
+    document.shape = replace(document.shape, count=4)
+    document.schedule = replace(
+        document.schedule,
+        delay_frames=0,
+        interval_frames=1,
+        burst_count=2,
+        loop_count=1,
+    )
+    document.header.metadata["trajectory"] = {
+        "kind": "keyframed",
+        "speed_keys": [[0, 60.0], [60, 120.0]],
+        "turn_keys": [[0, 0.0], [30, 90.0]],
+    }
+    pool, context, runner = _runtime(document)
+    runner.start(context)
+
+    first = np.asarray(runner.tick(context).event.indices, dtype=np.intp)
+    track = pool.data["speed_track"][first]
+    assert np.all(track == track[0]) and track[0] >= 0
+    assert np.all(pool.data["turn_track"][first] >= 0)
+    assert np.all(pool.data["curve_type"][first] == 0)
+
+    start_angles = pool.data["angle"][first].copy()
+    for _ in range(30):
+        pool.update(1.0 / 60.0)
+
+    # Speed 60 -> 120 per second over one second, in per-frame pool units.
+    assert pool.data["speed"][first] == pytest.approx([1.5] * 4, rel=1e-4)
+    # Angular velocity ramps 0 -> 90 deg/s over half a second: ~22.5 degrees.
+    turned = np.degrees(pool.data["angle"][first] - start_angles)
+    turned = (turned + 180.0) % 360.0 - 180.0
+    assert turned == pytest.approx([22.5] * 4, abs=1.0)
+
+    second = np.asarray(runner.tick(context).event.indices, dtype=np.intp)
+    assert np.all(pool.data["speed_track"][second] == track[0])
+    assert len(pool.track_starts) == 2
@@ -169,3 +169,32 @@ def test_close_and_stop_are_idempotent(tmp_path):
     assert controller.state == PreviewState.STOPPED
     with pytest.raises(PreviewCommandError, match="closed"):
         controller.play()
+
+
+def test_checkpointed_seek_matches_full_replay_with_pool_motion(tmp_path):
+    document = PatternDocument.new("Scrub")
+    document.shape = replace(document.shape, count=4)
+    document.schedule = replace(document.schedule, interval_frames=3, loop_count=None)
+
+    def _seek(frames, interval):
+        pool = OptimizedBulletPool(max_bullets=512)
+        controller = PatternPreviewController(
+            pool, project=_project(tmp_path / str(interval)), checkpoint_interval=interval
+        )
+        controller.load(document.to_dict())
+        for frame in frames:
+            controller.seek(frame)
+        return pool, controller
+
+    full_pool, full = _seek((75,), 0)
+    fast_pool, fast = _seek((120, 75), 20)
+
+    assert fast.checkpoints.frames == (20, 40, 60, 80, 100, 120)
+    assert fast.frame == full.frame == 75
+    for name in full_pool.dtype.names:
+        if name == "tag":  # each controller owns a fresh PatternRunner tag
+            continue
+        assert fast_pool.data[name].tobytes() == full_pool.data[name].tobytes(), name
+    fast.set_player_position(0.5, -0.5)
+    fast.seek(10)
+    assert fast.checkpoints.frames == ()
@@ -1,5 +1,11 @@
 """N3.2 reentry, cancellation, budgets, and causal-depth diagnostics."""
 
+import gc
+import io
+import json
+
+import pytest
+
 from src.game.events import Event, EventBus
 from src.game.reactions import ReactionScheduler, ReactionSpec, TaskWait
 
@@ -131,3 +137,120 @@ def test_owner_cancellation_removes_pending_instances_and_allows_new_scope_gener
     assert scheduler.cancel_owner("state:old", frame=2) == 1
     assert scheduler.instances == {}
     assert any(item.kind == "cancel" and item.reason == "owner_cancelled" for item in scheduler.trace)
+
+
+def test_indexed_matching_visits_only_candidate_reactions_in_id_order():
+    started = []
+    guarded = []
+    scheduler = ReactionScheduler()
+
+    def action(event, scope):
+        started.append((scope.parent.scope_id, event.payload["n"]))
+
+    def guard(event):
+        guarded.append(event.payload["n"])
+        return True
+
+    scheduler.register(ReactionSpec("b.any", "pulse", action, once_per_scope=False, guard=guard))
+    scheduler.register(
+        ReactionSpec("a.boss", "pulse", action, owner="boss", once_per_scope=False)
+    )
+    scheduler.register(ReactionSpec("c.other", "other", action, guard=guard))
+    for index in range(500):
+        scheduler.register(ReactionSpec(f"noise.{index}", f"noise.{index}", action))
+    scheduler.unregister("noise.0")
+    scheduler.unregister("c.other")
+
+    events = [
+        Event(type="pulse", source="test", frame=0, payload={"n": 1}),
+        Event(type="pulse", source="test", frame=0, payload={"n": 2}, owner="boss"),
+        Event(type="other", source="test", frame=0, payload={"n": 3}),
+    ]
+    traces = scheduler.process(events, 0)
+
+    assert [(item.reaction_id, item.kind) for item in traces] == [
+        ("a.boss", "start"),
+        ("b.any", "start"),
+        ("b.any", "suppress"),
+    ]
+    assert guarded == [1, 2]
+    assert ("pulse", "boss") in scheduler._index and ("other", None) not in scheduler._index
+    assert ("noise.0", None) not in scheduler._index and len(scheduler._index) == 501
+
+
+def test_trace_sink_streams_every_record_past_the_retention_window():
+    sink = io.StringIO()
+    scheduler = ReactionScheduler(trace_capacity=4, trace_sink=sink)
+    scheduler.register(ReactionSpec("pulse", "pulse", lambda event, scope: None, once_per_scope=False))
+
+    returned = []
+    for frame in range(6):
+        returned.append(scheduler.process([_event(frame)], frame))
+        scheduler.tick(frame)
+
+    assert all(len(traces) == 1 and traces[0].kind == "start" for traces in returned)
+    assert scheduler.trace.total == 12 and len(scheduler.trace) == 4
+    assert scheduler.trace.dropped == 8
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [record["kind"] for record in records] == ["start", "complete"] * 6
+    assert [record["event_id"] for record in records[::2]] == [
+        traces[0].event_id for traces in returned
+    ]
+    assert scheduler.trace[-1].to_dict() == records[-1]
+
+
+def test_reset_flushes_and_close_releases_an_owned_trace_sink(tmp_path):
+    path = tmp_path / "reactions.ndjson"
+    bus = EventBus()
+    scheduler = ReactionScheduler(trace_sink=path, event_bus=bus)
+    log = []
+    scheduler.register(ReactionSpec("pulse", "pulse", _waiting_action(log), once_per_scope=False))
+    scheduler.process([_event(0)], 0)
+    scheduler.tick(0)
+
+    scheduler.reset(frame=1)
+    kinds = [json.loads(line)["kind"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert kinds == ["start"]
+
+    sink = scheduler.trace._sink
+    scheduler.process([_event(2)], 2)
+    scheduler.close(frame=3)
+
+    assert sink.closed and scheduler.trace._sink is None
+    assert scheduler.instances == {} and scheduler.scopes == {}
+    bus.emit("pulse")
+    bus.dispatch()
+    assert scheduler._pending_events == []
+    kinds = [json.loads(line)["kind"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert kinds == ["start", "start"]
+
+
+@pytest.mark.soak
+def test_million_frame_soak_keeps_trace_and_scope_memory_bounded():
+    scheduler = ReactionScheduler(trace_capacity=64, task_trace_capacity=8)
+    scheduler.register(
+        ReactionSpec(
+            "soak",
+            "pulse",
+            _waiting_action([]),
+            once_per_scope=False,
+            reentry="parallel",
+            max_instances=4,
+        )
+    )
+    baseline = None
+    for frame in range(1_000_000):
+        if frame % 64 == 0:
+            scheduler.process([_event(frame)], frame)
+        if scheduler.instances:
+            scheduler.tick(frame)
+        if frame == 100_000:
+            gc.collect()
+            baseline = len(gc.get_objects())
+    gc.collect()
+    stage = scheduler.scopes["stage"]
+
+    assert scheduler.trace.total == 31_250 and len(scheduler.trace) == 64
+    assert len(stage.trace) <= 8 and not stage.children
+    assert len(scheduler.instances) <= 1 and len(scheduler.scopes) <= 2
+    assert len(gc.get_objects()) - baseline < 200
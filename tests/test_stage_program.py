@@ -16,8 +16,8 @@ from src.editor.node_types import make_default_root, make_node
 from src.editor.stage_compile import StageCompileError, compile_stage
 from src.game.bullet.optimized_pool import OptimizedBulletPool
 from src.game.stage.context import StageContext
-from src.game.stage.program import StageRunner, StageRunnerState
-from src.pattern import PatternDocument
+from src.game.stage.program import DEFAULT_AUDIO_TRACE_CAPACITY, StageRunner, StageRunnerState
+from src.pattern import AimSpec, PatternDocument
 from src.preview import PatternPreviewController, PreviewState
 
 
@@ -80,10 +80,12 @@ def _project(tmp_path):
     return ProjectContext(tmp_path)
 
 
-def _authored_stage(tmp_path, *, duration=30):
+def _authored_stage(tmp_path, *, duration=30, aim=None):
     project = _project(tmp_path)
     pattern = PatternDocument.new("Timeline Ring")
     pattern.shape = replace(pattern.shape, count=1)
+    if aim is not None:
+        pattern.aim = aim
     pattern.schedule = replace(
         pattern.schedule,
         interval_frames=1,
@@ -595,7 +597,8 @@ def test_stage_audio_pause_resume_seek_reset_stop_and_finish(tmp_path):
     ]
 
 
-def test_automatic_audio_stop_does_not_stop_newer_overlapping_bgm(tmp_path):
+@pytest.mark.parametrize("audio_trace_capacity", [DEFAULT_AUDIO_TRACE_CAPACITY, 1])
+def test_automatic_audio_stop_does_not_stop_newer_overlapping_bgm(tmp_path, audio_trace_capacity):
     project, scene, _emitter, _instance = _authored_stage(tmp_path, duration=20)
     audio_track = next(track for track in scene.tracks if track.kind == "Audio")
     audio_track.channel = "music"
@@ -625,7 +628,7 @@ def test_automatic_audio_stop_does_not_stop_newer_overlapping_bgm(tmp_path):
         DummyPlayer(),
         audio_manager=audio,
     )
-    runner = StageRunner(compile_stage(project, scene))
+    runner = StageRunner(compile_stage(project, scene), audio_trace_capacity=audio_trace_capacity)
 
     runner.start(context)
     runner.advance(context, 7)
@@ -650,6 +653,7 @@ def test_automatic_audio_stop_does_not_stop_newer_overlapping_bgm(tmp_path):
     runner.advance(context, 14, dispatch_actions=False)
     runner.restore_audio_state(context)
     assert audio.events == []
+    assert len(runner._audio_trace) <= audio_trace_capacity
 
 
 def test_explicit_audio_stop_suppresses_duplicate_automatic_stop(tmp_path):
@@ -699,3 +703,216 @@ def test_stage_context_records_typed_events_and_invokes_registered_script_hook()
     )
     context.clear_authored_stage_state()
     assert context.timeline_events() == ()
+
+
+def test_checkpointed_seek_then_tick_matches_linear_run_bit_for_bit(tmp_path):
+    project, scene, _emitter, _instance = _authored_stage(
+        tmp_path, duration=240, aim=AimSpec(mode="player")
+    )
+    scene.tracks[0].clips[0].duration_frames = 200
+    program = compile_stage(project, scene)
+
+    def _run(seek_frames, interval):
+        pool = OptimizedBulletPool(max_bullets=512)
+        context = RecordingContext(pool)
+        runner = StageRunner(program, checkpoint_interval=interval)
+        if seek_frames is None:
+            context._player.pos = [-0.8, -0.6]
+            runner.start(context)
+            runner.advance(context, 130, dispatch_actions=False)
+            results = ()
+        else:
+            first, *rest = seek_frames
+            runner.seek(context, first)
+            # Checkpoints aimed at the old position must not be restored.
+            context._player.pos = [-0.8, -0.6]
+            for frame in rest:
+                results = runner.seek(context, frame)
+            runner.resume()
+        for _ in range(40):
+            runner.tick(context, dispatch_actions=False)
+            pool.update(1.0 / 60.0)
+        return runner, pool, results
+
+    linear, linear_pool, _ = _run(None, 0)
+    seeked, seeked_pool, results = _run((100, 150, 130), 16)
+
+    assert seeked.checkpoints.frames == tuple(range(16, 145, 16))
+    assert len(results) == 130 - 128
+    assert seeked.frame == linear.frame == 170
+    assert tuple(seeked.trace) == tuple(linear.trace)
+    for name, values in linear.spawn_trace.columns().items():
+        assert values.tobytes() == seeked.spawn_trace.columns()[name].tobytes(), name
+    assert seeked.node_state == linear.node_state
+    linear_vars = linear.variables.snapshot()
+    seeked_vars = seeked.variables.snapshot()
+    # Behavior scopes are keyed by each runner's random instance id.
+    assert list(seeked_vars.pop("behavior").values()) == list(linear_vars.pop("behavior").values())
+    assert seeked_vars == linear_vars
+    for name in linear_pool.dtype.names:
+        if name == "tag":
+            # Owner tags are process-unique per PatternRunner, so each run
+            # allocates its own values; allocation order and which bullets
+            # share an owner must still match exactly.
+            linear_tags = np.unique(linear_pool.data["tag"], return_inverse=True)[1]
+            seeked_tags = np.unique(seeked_pool.data["tag"], return_inverse=True)[1]
+            assert linear_tags.tobytes() == seeked_tags.tobytes(), name
+            continue
+        assert linear_pool.data[name].tobytes() == seeked_pool.data[name].tobytes(), name
+    assert linear_pool.free_indices == seeked_pool.free_indices
+    assert np.count_nonzero(seeked_pool.data["alive"]) > 100
+
+
+def test_trace_modes_bound_semantic_and_spawn_traces(tmp_path):
+    project, scene, _emitter, _instance = _authored_stage(tmp_path, duration=240)
+    scene.tracks[0].clips[0].duration_frames = 200
+    program = compile_stage(project, scene)
+
+    def _run(**kwargs):
+        context = RecordingContext(OptimizedBulletPool(max_bullets=512))
+        runner = StageRunner(program, **kwargs)
+        runner.start(context)
+        runner.advance(context, 200, dispatch_actions=False)
+        return runner
+
+    full = _run()
+    summary = _run(trace_mode="summary")
+    bounded = _run(trace_capacity=4, spawn_trace_capacity=3)
+    off = _run(trace_mode="off")
+
+    spawns = [item for item in full.trace if item.kind == "pattern_spawn"]
+    assert len(spawns) == full.spawn_trace.total > 3
+    columns = full.spawn_trace.columns()
+    assert [f"{value:016x}" for value in columns["spawn_hash"]] == [
+        item.value["spawn_hash"] for item in spawns
+    ]
+    assert columns["frame"].tolist() == [item.frame for item in spawns]
+    assert not any(item.kind == "pattern_spawn" for item in summary.trace)
+    assert summary.spawn_trace.columns()["spawn_hash"].tobytes() == columns["spawn_hash"].tobytes()
+    assert len(bounded.trace) == 4
+    assert tuple(bounded.trace) == tuple(full.trace)[-4:]
+    assert len(bounded.spawn_trace) == 3
+    assert bounded.spawn_trace.dropped == full.spawn_trace.total - 3
+    assert bounded.spawn_trace.columns()["spawn_hash"].tolist() == columns["spawn_hash"].tolist()[-3:]
+    assert off.spawn_trace.total == 0
+    assert not off.trace
+    with pytest.raises(ValueError):
+        StageRunner(program, trace_mode="verbose")
+
+
+def _concurrent_pattern_stage(tmp_path, copies, *, duration=60):
+    project = _project(tmp_path)
+    pattern = PatternDocument.new("Shared Ring")
+    pattern.shape = replace(pattern.shape, count=2)
+    pattern.schedule = replace(
+        pattern.schedule,
+        delay_frames=0,
+        interval_frames=3,
+        burst_count=1,
+        loop_count=None,
+    )
+    pattern_uri = "res://game_content/patterns/shared_ring.pystg.json"
+    ResourceStore(project).save(pattern, pattern_uri.removeprefix("res://"))
+
+    root = make_default_root("Concurrent Stage")
+    stage = make_node("Stage", name="Stage")
+    boss = make_node("Boss", name="Boss")
+    spell = make_node("Spell", name="Spell")
+    tracks = []
+    for index in range(copies):
+        emitter = make_node("Emitter", name=f"Emitter {index}")
+        emitter.properties.update({"x": 192.0, "y": 224.0})
+        instance = make_node("PatternInstance", name=f"Pattern {index}")
+        instance.properties["pattern"] = pattern_uri
+        emitter.children.append(instance)
+        spell.children.append(emitter)
+        tracks.append(
+            TimelineTrack(
+                name=f"Pattern {index}",
+                kind="Pattern",
+                channel="danmaku",
+                target_id=instance.id,
+                order=copies - index,
+                clips=[
+                    TimelineClip(
+                        name=f"Ring {index}",
+                        kind="Pattern",
+                        start_frame=index,
+                        duration_frames=duration - index,
+                        channel="danmaku",
+                    )
+                ],
+            )
+        )
+    boss.children.append(spell)
+    stage.children.append(boss)
+    root.children.append(stage)
+    scene = SceneDocument(
+        "Concurrent Stage", root, tracks=tracks, metadata={"duration_frames": duration}
+    )
+    return compile_stage(project, scene)
+
+
+def test_concurrent_patterns_keep_order_contexts_and_grouped_emission_frames(tmp_path):
+    program = _concurrent_pattern_stage(tmp_path, 6)
+    context = RecordingContext(OptimizedBulletPool(max_bullets=2048))
+    runner = StageRunner(program)
+    runner.start(context)
+    runner.advance(context, 10, dispatch_actions=False)
+
+    active = runner._active_patterns
+    contexts = {key: item.context for key, item in active.items()}
+    assert [key for _, key in runner._pattern_order] == sorted(
+        active, key=lambda key: active[key].schedule.order_key
+    )
+    runner.advance(context, 20, dispatch_actions=False)
+    assert all(active[key].context is contexts[key] for key in contexts)
+
+    spawns = [item for item in runner.trace if item.kind == "pattern_spawn"]
+    order = {schedule.clip_id: schedule.order_key for schedule in program.patterns}
+    for schedule in program.patterns:
+        frames = [item.frame for item in spawns if item.clip_id == schedule.clip_id]
+        assert frames == list(range(schedule.start_frame, 30, 3))
+    for frame in range(30):
+        keys = [order[item.clip_id] for item in spawns if item.frame == frame]
+        assert keys == sorted(keys)
+
+
+def test_pattern_tick_order_follows_state_path_changes_and_indexed_removal(tmp_path):
+    from types import SimpleNamespace
+
+    runner = StageRunner(_concurrent_pattern_stage(tmp_path, 1))
+
+    def item(state_id, order):
+        return SimpleNamespace(state_id=state_id, schedule=SimpleNamespace(order_key=(order,)))
+
+    # "child" is not on the path yet when its patterns start.
+    runner._ordered_active_patterns(("root",))
+    patterns = {
+        ("child", "a", 0): item("child", 0),
+        ("root", "b", 0): item("root", 2),
+        ("root", "c", 0): item("root", 1),
+        ("child", "d", 0): item("child", 0),
+    }
+    for key, value in patterns.items():
+        runner._add_active_pattern(key, value)
+
+    def order(path):
+        keys = {id(value): key for key, value in patterns.items()}
+        return [keys[id(value)] for value in runner._ordered_active_patterns(path)]
+
+    assert order(("root",)) == [
+        ("root", "c", 0), ("root", "b", 0), ("child", "a", 0), ("child", "d", 0)
+    ]
+    # A path change re-keys the depths of patterns that are already active.
+    assert order(("child", "root")) == [
+        ("child", "a", 0), ("child", "d", 0), ("root", "c", 0), ("root", "b", 0)
+    ]
+
+    del patterns[("child", "a", 0)]
+    runner._remove_active_pattern(("child", "a", 0))
+    runner._add_active_pattern(("root", "e", 0), patterns.setdefault(("root", "e", 0), item("root", 0)))
+    assert order(("child", "root")) == [
+        ("child", "d", 0), ("root", "e", 0), ("root", "c", 0), ("root", "b", 0)
+    ]
+    assert len(runner._pattern_entries) == len(runner._pattern_order) == 4
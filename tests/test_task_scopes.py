@@ -60,3 +60,16 @@ def test_completed_scope_does_not_accept_new_work():
 
     assert scope.start(lambda: None, frame=4) is None
     assert scope.state == TaskScopeState.COMPLETED
+
+
+def test_task_scope_trace_keeps_only_the_newest_records():
+    scope = TaskScope("stage", trace_capacity=3)
+
+    def task():
+        yield TaskWait(10)
+
+    for index in range(5):
+        scope.start(task, task_id=f"task{index}", frame=index)
+
+    assert [item.task_id for item in scope.trace] == ["task2", "task3", "task4"]
+    assert scope._trace.total == 5 and scope._trace.dropped == 2
@@ -132,3 +132,31 @@ def test_variable_conflict_requires_explicit_reducer(tmp_path) -> None:
     )
     with pytest.raises(StageCompileError, match="Multiple writers overlap"):
         compile_stage(ProjectContext(tmp_path), scene)
+
+
+def test_compiled_writer_resolves_once_and_skips_unchanged_sets() -> None:
+    store = VariableStore(
+        (
+            VariableSpec("speed", "float", 1.0, scope="stage", writable_by=("timeline",), animatable=True),
+            VariableSpec("score", "int", 0, scope="stage", writable_by=("timeline",), animatable=True),
+            VariableSpec("fixed", "float", 0.0, scope="stage", writable_by=("safe_action",)),
+        )
+    )
+    write = store.compile_writer("speed", writer="timeline")
+
+    assert write(1.0, frame=0) is False
+    assert store.writes == ()
+    assert write(2, frame=1, order=3) is True
+    assert write(2.0, frame=2) is False
+    assert store.read("speed") == 2.0
+    assert [(item.value, item.frame, item.order) for item in store.writes] == [(2.0, 1, 3)]
+    with pytest.raises(VariableError):
+        write("fast")
+
+    add = store.compile_writer("score", writer="timeline", operation="add")
+    assert add(0) is True and add(2) is True
+    assert store.read("score") == 2
+    with pytest.raises(VariableError, match="not allowed"):
+        store.compile_writer("fixed", writer="timeline")
+    store.reset()
+    assert write(5.0) is True and store.read("speed") == 5.0
@@ -0,0 +1,83 @@
+"""Compare per-bullet scalar evaluation with one column evaluation per burst."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.pattern import (
+    BULLET_VARIABLES,
+    compile_expression,
+    expression_evaluator,
+    vector_evaluator,
+)
+
+
+_EXPRESSIONS = (
+    "1.0 + index / count",
+    "index * 360.0 / count + random * 4.0 - 2.0",
+    "(2.0 if index % 2 == 0 else 1.0) * clamp(time - index * 0.01, 0.5, 3.0)",
+)
+
+
+class _ScalarRandom:
+    def __init__(self, generator: np.random.Generator) -> None:
+        self._generator = generator
+
+    def random(self) -> float:
+        return float(self._generator.random())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--bursts", type=int, default=200)
+    args = parser.parse_args()
+
+    variables = {"frame": 120.0, "time": 2.0, "burst_index": 4.0}
+    rows = []
+    for source in _EXPRESSIONS:
+        node = compile_expression(source, extra_variables=BULLET_VARIABLES).node
+        scalar = expression_evaluator(node)
+        column = vector_evaluator(node)
+
+        start = perf_counter()
+        for burst in range(args.bursts):
+            context = dict(variables, count=float(args.count))
+            context["rng"] = _ScalarRandom(np.random.default_rng(burst))
+            for index in range(args.count):
+                context["index"] = float(index)
+                scalar(context)
+        scalar_seconds = perf_counter() - start
+
+        start = perf_counter()
+        for burst in range(args.bursts):
+            column(dict(variables, rng=np.random.default_rng(burst)), args.count)
+        column_seconds = perf_counter() - start
+
+        rows.append(
+            {
+                "source": source,
+                "scalar_ms_per_burst": round(scalar_seconds * 1000.0 / args.bursts, 4),
+                "column_ms_per_burst": round(column_seconds * 1000.0 / args.bursts, 4),
+                "column_calls_per_burst": 1,
+                "speedup": round(scalar_seconds / column_seconds, 2),
+            }
+        )
+    payload = {"count": args.count, "bursts": args.bursts, "expressions": rows}
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""Compare linear-scan, precomputed-segment and array curve sampling."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.pattern import CurveDocument, CurveKeyframe
+
+
+def _curve(keys: int, interpolation: str) -> CurveDocument:
+    rng = np.random.default_rng(keys)
+    return CurveDocument.new(
+        "Benchmark",
+        keyframes=tuple(
+            CurveKeyframe(index * 4, float(value))
+            for index, value in enumerate(rng.normal(size=keys))
+        ),
+        interpolation=interpolation,
+    )
+
+
+def _rate(sample, frames) -> float:
+    start = perf_counter()
+    for frame in frames:
+        sample(frame)
+    return len(frames) / (perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--samples", type=int, default=100000)
+    parser.add_argument("--interpolation", default="cubic")
+    args = parser.parse_args()
+
+    rows = []
+    for keys in args.keys:
+        curve = _curve(keys, args.interpolation)
+        sampler = curve.sampler()
+        end = float(curve.keyframes[-1].frame)
+        playback = np.linspace(0.0, end, args.samples).tolist()
+        scrub = np.random.default_rng(0).uniform(0.0, end, args.samples).tolist()
+        timeline = np.asarray(playback)
+        start = perf_counter()
+        curve.sample_array(timeline)
+        array_seconds = perf_counter() - start
+        scan = _rate(curve.evaluate, playback)
+        cursor = _rate(sampler.sample, playback)
+        rows.append(
+            {
+                "keys": keys,
+                "scan_per_second": round(scan, 2),
+                "cursor_per_second": round(cursor, 2),
+                "bisect_per_second": round(_rate(sampler.sample, scrub), 2),
+                "array_per_second": round(args.samples / array_seconds, 2),
+                "cursor_speedup": round(cursor / scan, 2),
+            }
+        )
+    payload = {
+        "samples": args.samples,
+        "interpolation": args.interpolation,
+        "curves": rows,
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
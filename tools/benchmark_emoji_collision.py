@@ -0,0 +1,99 @@
+"""Time emoji danmaku update and player collision with many on-screen emoji."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.game.emoji_danmaku import EmojiDanmakuSystem, _screen_to_game
+from src.game.emoji_danmaku.emoji_pool import EMOJI_LIST, EmojiObjectPool, FallingEmoji
+
+
+VIEWPORT = (64, 32, 768, 896)
+
+
+class _Player:
+    hit_radius = 0.01
+
+    def get_hit_position(self):
+        # Outside the viewport, so every frame scans the whole pool.
+        return (5.0, 5.0)
+
+
+def _pool(count: int) -> EmojiObjectPool:
+    rng = random.Random(7)
+    gvx, gvy, gvw, gvh = VIEWPORT
+    pool = EmojiObjectPool(VIEWPORT)
+    for index in range(count):
+        pool.add(
+            FallingEmoji(
+                EMOJI_LIST[index % len(EMOJI_LIST)],
+                x=gvx + rng.uniform(0.05, 0.95) * gvw,
+                y=gvy + rng.uniform(0.05, 0.95) * gvh,
+                vy=0.0,
+                scale=rng.uniform(0.85, 1.15),
+            )
+        )
+    return pool
+
+
+def _reference_collision(objects, player) -> bool:
+    # The per-object screen -> game loop the pool replaced.
+    gvx, gvy, gvw, gvh = VIEWPORT
+    hit_x, hit_y = player.get_hit_position()
+    for obj in objects:
+        gx, gy = _screen_to_game(obj.x, obj.y, gvx, gvy, gvw, gvh)
+        radius = 48.0 * obj.scale * obj.hitbox_factor / (gvw / 2.0)
+        dx = gx - hit_x
+        dy = gy - hit_y
+        if dx * dx + dy * dy < (player.hit_radius + radius) ** 2:
+            return True
+    return False
+
+
+def _time(fn, frames: int) -> float:
+    start = perf_counter()
+    for _ in range(frames):
+        fn()
+    return round((perf_counter() - start) * 1000.0 / frames, 4)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emoji", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pool = _pool(args.emoji)
+    system = object.__new__(EmojiDanmakuSystem)
+    system.gvx, system.gvy, system.gvw, system.gvh = VIEWPORT
+    system._bullet_pool = None
+    system._pool = pool
+    player = _Player()
+    objects = pool.falling
+    # Compile the update kernel outside the sample.
+    pool.update(0.0)
+
+    payload = {
+        "emoji": args.emoji,
+        "frames": args.frames,
+        "reference_collision_ms": _time(lambda: _reference_collision(objects, player), args.frames),
+        "collision_ms": _time(lambda: system.check_player_collision(player), args.frames),
+        "update_ms": _time(lambda: pool.update(1.0 / 60.0), args.frames),
+        "alive": len(pool),
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""Measure EventBus events per second across subscriber counts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.game.events import EventBus
+
+
+def _run(subscribers: int, args, *, batch: bool, validate: bool) -> dict:
+    bus = EventBus(
+        max_queue=args.events_per_frame,
+        batch_dispatch=batch,
+        validate_payloads=validate,
+    )
+    received = [0]
+
+    def handler(_event) -> None:
+        received[0] += 1
+
+    for _ in range(subscribers):
+        bus.subscribe("bullet.grazed", handler)
+    payload = {"x": 1.0, "y": 2.0, "bullet": 7}
+    start = perf_counter()
+    for _ in range(args.frames):
+        for _ in range(args.events_per_frame):
+            bus.emit("bullet.grazed", payload=payload, source="benchmark")
+        bus.dispatch_frame()
+    bus.dispatch_frame()
+    seconds = perf_counter() - start
+    events = args.frames * args.events_per_frame
+    return {
+        "subscribers": subscribers,
+        "batch_dispatch": batch,
+        "validate_payloads": validate,
+        "events_per_second": round(events / seconds, 1),
+        "deliveries": received[0],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--events-per-frame", type=int, default=200)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    results = []
+    for subscribers in args.subscribers:
+        for batch, validate in ((False, True), (True, True), (True, False)):
+            results.append(_run(subscribers, args, batch=batch, validate=validate))
+    payload = {
+        "frames": args.frames,
+        "events_per_frame": args.events_per_frame,
+        "results": results,
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Measure LocalIPCAdapter messages per second over loopback TCP."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import socket
+import sys
+import threading
+import time
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.game.adapters import LocalIPCAdapter
+
+
+def _send(address, messages: int, chunk: int) -> None:
+    frame = json.dumps({"action": "set_node_position", "x": 0.5, "y": -0.25}).encode() + b"\n"
+    payload = frame * messages
+    with socket.create_connection(address) as client:
+        # Small writes model a backlog trickling in through a slow pipe.
+        for offset in range(0, len(payload), chunk):
+            client.sendall(payload[offset : offset + chunk])
+
+
+def _run(clients: int, args) -> dict:
+    adapter = LocalIPCAdapter(port=0, max_clients=clients, rate_limit=None)
+    adapter.start(None)
+    address = ("127.0.0.1", adapter.bound_port)
+    expected = clients * args.messages
+    threads = [
+        threading.Thread(target=_send, args=(address, args.messages, args.chunk))
+        for _ in range(clients)
+    ]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    deadline = time.monotonic() + args.timeout
+    while adapter.health()["received"] < expected and time.monotonic() < deadline:
+        time.sleep(0.001)
+    seconds = perf_counter() - start
+    health = adapter.health()
+    adapter.stop()
+    return {
+        "clients": clients,
+        "received": health["received"],
+        "messages_per_second": round(health["received"] / seconds, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20000, help="per client")
+    parser.add_argument("--chunk", type=int, default=512, help="bytes per client write")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    payload = {
+        "messages": args.messages,
+        "chunk": args.chunk,
+        "results": [_run(clients, args) for clients in args.clients],
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+"""Compare cold and warm PatternCompiler runs against the on-disk cache."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+import json
+from pathlib import Path
+import sys
+import tempfile
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.authoring import ResourceStore
+from src.core.project_context import ProjectContext
+from src.pattern import PatternCompiler, PatternDocument
+from src.pattern.compiler import cached_burst_template
+
+
+def _documents(project: ProjectContext, variants: int) -> list[PatternDocument]:
+    store = ResourceStore(project)
+    documents = []
+    for path in sorted((project.game_content / "patterns").rglob("*.pystg.json")):
+        document = store.load(path)
+        if isinstance(document, PatternDocument):
+            # Seed variants stand in for a larger library with distinct hashes.
+            documents.extend(
+                replace(document, seed=document.seed + index) for index in range(variants)
+            )
+    return documents
+
+
+def _compile_all(project, documents, cache_dir: Path) -> dict:
+    # Each run models a fresh process: no in-memory program or template cache.
+    cached_burst_template.cache_clear()
+    compiler = PatternCompiler(cache_dir)
+    start = perf_counter()
+    for document in documents:
+        compiler.compile(document, project=project)
+    seconds = perf_counter() - start
+    return {
+        "ms": round(seconds * 1000.0, 3),
+        "disk_hits": compiler.disk_hits,
+        "disk_writes": compiler.disk_writes,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--variants", type=int, default=1)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    project = ProjectContext(ROOT)
+    documents = _documents(project, args.variants)
+    cold = []
+    warm = []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as directory:
+            cold.append(_compile_all(project, documents, Path(directory)))
+            warm.append(_compile_all(project, documents, Path(directory)))
+    cold_ms = min(item["ms"] for item in cold)
+    warm_ms = min(item["ms"] for item in warm)
+    payload = {
+        "patterns": len(documents),
+        "runs": args.runs,
+        "cold_ms": cold_ms,
+        "warm_ms": warm_ms,
+        "speedup": round(cold_ms / warm_ms, 2) if warm_ms else None,
+        "cold": cold[-1],
+        "warm": warm[-1],
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
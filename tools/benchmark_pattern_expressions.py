@@ -0,0 +1,74 @@
+"""Compare interpreted and lowered pattern expression evaluation."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.pattern import compile_expression
+from src.pattern.expressions import evaluate_node, expression_evaluator
+
+
+_EXPRESSIONS = (
+    "1.5 + burst_index * 0.25",
+    "clamp(player_x * 90.0, -45.0, 45.0) - 90.0 + random * 10.0",
+    "(frame % 120 < 60) * 2.0 + max(abs(player_x), abs(player_y)) ** 2",
+    "(time * 3.0 if burst_index % 2 == 0 else -time * 3.0) + min(frame / 60.0, 4.0)",
+)
+
+
+def _rate(evaluate, context: dict, count: int) -> float:
+    start = perf_counter()
+    for _ in range(count):
+        evaluate(context)
+    return count / (perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--evaluations", type=int, default=200000)
+    args = parser.parse_args()
+
+    context = {
+        "frame": 240.0,
+        "time": 4.0,
+        "burst_index": 3.0,
+        "player_x": 0.25,
+        "player_y": -0.8,
+        "boss_x": 0.0,
+        "boss_y": 0.0,
+        "rng": random.Random(7),
+    }
+    rows = []
+    for source in _EXPRESSIONS:
+        node = compile_expression(source).node
+        lower_start = perf_counter()
+        lowered = expression_evaluator(node)
+        lower_ms = (perf_counter() - lower_start) * 1000.0
+        interpreted = _rate(lambda ctx: evaluate_node(node, ctx), context, args.evaluations)
+        compiled = _rate(lowered, context, args.evaluations)
+        rows.append(
+            {
+                "source": source,
+                "lower_ms": round(lower_ms, 3),
+                "interpreted_per_second": round(interpreted, 2),
+                "lowered_per_second": round(compiled, 2),
+                "speedup": round(compiled / interpreted, 2),
+            }
+        )
+    payload = {"evaluations": args.evaluations, "expressions": rows}
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Time ReactionScheduler.process with many reactions and a dense event frame."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.game.events import Event
+from src.game.reactions import ReactionScheduler, ReactionSpec
+
+
+def _scheduler(reactions: int, types: int) -> ReactionScheduler:
+    scheduler = ReactionScheduler(max_instances_per_frame=reactions)
+    for index in range(reactions):
+        scheduler.register(
+            ReactionSpec(
+                f"reaction.{index:05d}",
+                f"event.{index % types}",
+                lambda event, scope: None,
+                owner=f"owner.{index % 7}" if index % 3 == 0 else None,
+                payload_filter={"lane": index % 4},
+                policy="count_per_frame",
+                once_per_scope=False,
+                max_instances=2,
+                reentry="parallel",
+            )
+        )
+    return scheduler
+
+
+def _events(count: int, types: int, frame: int) -> list[Event]:
+    return [
+        Event(
+            type=f"event.{index % (types * 4)}",
+            source="benchmark",
+            frame=frame,
+            payload={"lane": index % 4},
+            owner=f"owner.{index % 11}",
+        )
+        for index in range(count)
+    ]
+
+
+def _run(args, *, indexed: bool) -> dict:
+    scheduler = _scheduler(args.reactions, args.types)
+    specs = None if indexed else tuple(scheduler.specs.values())
+    frame_events = [_events(args.events, args.types, frame) for frame in range(args.frames)]
+    started = 0
+    start = perf_counter()
+    for frame, events in enumerate(frame_events):
+        traces = scheduler.process(events, frame, specs=specs)
+        started += sum(1 for item in traces if item.kind == "start")
+        scheduler.tick(frame)
+    seconds = perf_counter() - start
+    return {
+        "indexed": indexed,
+        "process_mean_ms": round(seconds * 1000.0 / args.frames, 3),
+        "started": started,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reactions", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=5000, help="events per frame")
+    parser.add_argument("--types", type=int, default=250)
+    parser.add_argument("--frames", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = {
+        "reactions": args.reactions,
+        "events_per_frame": args.events,
+        "results": [_run(args, indexed=False), _run(args, indexed=True)],
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+"""Measure preview seek latency with and without replay checkpoints."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.core.project_context import ProjectContext
+from src.game.bullet.optimized_pool import OptimizedBulletPool
+from src.pattern import PatternDocument
+from src.preview import PatternPreviewController
+
+
+def _controller(project: ProjectContext, document: PatternDocument, args, interval: int):
+    pool = OptimizedBulletPool(max_bullets=args.pool_size)
+    controller = PatternPreviewController(
+        pool, project=project, checkpoint_interval=interval
+    )
+    controller.load(document.to_dict())
+    return controller
+
+
+def _seek_ms(controller: PatternPreviewController, frame: int) -> float:
+    start = perf_counter()
+    controller.seek(frame)
+    return (perf_counter() - start) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=32)
+    parser.add_argument("--interval-frames", type=int, default=4)
+    parser.add_argument("--checkpoint-interval", type=int, default=300)
+    parser.add_argument("--pool-size", type=int, default=50000)
+    parser.add_argument(
+        "--positions",
+        type=int,
+        nargs="+",
+        default=[300, 599, 1800, 3599, 7200, 10799],
+    )
+    args = parser.parse_args()
+
+    document = PatternDocument.new("Seek Latency Benchmark")
+    document.shape = replace(document.shape, count=args.count)
+    document.schedule = replace(
+        document.schedule,
+        interval_frames=args.interval_frames,
+        loop_count=None,
+    )
+    document.motion = replace(document.motion, max_lifetime=4.0)
+    positions = sorted(args.positions)
+
+    project = ProjectContext(ROOT)
+    baseline = _controller(project, document, args, 0)
+    checkpointed = _controller(project, document, args, args.checkpoint_interval)
+    # One pass to the end records checkpoints, as an editor scrub would.
+    warmup_ms = _seek_ms(checkpointed, positions[-1])
+    rows = []
+    for frame in positions:
+        full_ms = _seek_ms(baseline, frame)
+        warm_ms = _seek_ms(checkpointed, frame)
+        rows.append(
+            {
+                "frame": frame,
+                "full_replay_ms": round(full_ms, 3),
+                "checkpointed_ms": round(warm_ms, 3),
+                "speedup": round(full_ms / warm_ms, 2) if warm_ms else None,
+            }
+        )
+    payload = {
+        "count_per_burst": args.count,
+        "interval_frames": args.interval_frames,
+        "checkpoint_interval": args.checkpoint_interval,
+        "pool_size": args.pool_size,
+        "first_scrub_ms": round(warmup_ms, 3),
+        "checkpoints": len(checkpointed.checkpoints),
+        "checkpoint_mib": round(checkpointed.checkpoints.nbytes / (1024 * 1024), 2),
+        "positions": rows,
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
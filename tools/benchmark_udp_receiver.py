@@ -0,0 +1,113 @@
+"""Measure UDPReceiver frame-time impact under a loopback packet flood."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import socket
+import statistics
+import sys
+import threading
+import time
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.game.adapters import UDPAdapter
+from src.game.emoji_danmaku.udp_receiver import UDPReceiver
+
+
+MESSAGES = (
+    json.dumps({"cmd": "emoji", "emoji": "😂", "nickname": "n", "user_id": 1}).encode(),
+    json.dumps({"cmd": "stg", "args": "💩", "nickname": "n", "user_id": 2}).encode(),
+    json.dumps({"cmd": "chat", "text": "plain group chatter"}).encode(),
+    json.dumps({"cmd": "emoji", "emoji": "🙂", "nickname": "n", "user_id": 3}).encode(),
+)
+
+
+def _flood(address, rate: int, stop: threading.Event) -> None:
+    # Paced in 1 ms slices; the sender cannot exceed what one thread can push.
+    per_slice = max(1, rate // 1000)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+        sent = 0
+        start = time.monotonic()
+        while not stop.is_set():
+            for index in range(per_slice):
+                try:
+                    client.sendto(MESSAGES[(sent + index) % len(MESSAGES)], address)
+                except OSError:
+                    pass
+            sent += per_slice
+            delay = start + sent / rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+
+def _frame_work(size: int) -> int:
+    return sum(range(size))
+
+
+def _run(rate: int, args, *, batched: bool) -> dict:
+    receiver = UDPReceiver(port=0)
+    if not batched:
+        # Reference: decode every datagram and emit one event per message.
+        receiver._adapter = UDPAdapter(host=receiver.host, port=0)
+    receiver.start()
+    address = ("127.0.0.1", receiver._adapter.bound_port)
+    stop = threading.Event()
+    sender = threading.Thread(target=_flood, args=(address, rate, stop), daemon=True)
+    if rate:
+        sender.start()
+    frame_ms = []
+    poll_ms = []
+    emoji = 0
+    try:
+        for _ in range(args.frames):
+            start = perf_counter()
+            _frame_work(args.work)
+            poll_start = perf_counter()
+            events = receiver.poll()
+            poll_ms.append((perf_counter() - poll_start) * 1000.0)
+            emoji += sum(event.get("count", 1) for event in events)
+            frame_ms.append((perf_counter() - start) * 1000.0)
+            remaining = 1.0 / 60.0 - (perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+    finally:
+        stop.set()
+        health = receiver._adapter.health()
+        receiver.stop()
+    frame_ms.sort()
+    return {
+        "packets_per_second": rate,
+        "batched": batched,
+        "frame_mean_ms": round(statistics.fmean(frame_ms), 4),
+        "frame_p99_ms": round(frame_ms[int(len(frame_ms) * 0.99) - 1], 4),
+        "poll_mean_ms": round(statistics.fmean(poll_ms), 4),
+        "emoji": emoji,
+        "decoded": health["received"],
+        "filtered": health.get("filtered", 0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rates", type=int, nargs="+", default=[0, 10000, 50000, 100000])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--work", type=int, default=50000, help="fixed per-frame work")
+    args = parser.parse_args()
+
+    results = []
+    for rate in args.rates:
+        for batched in (False, True):
+            results.append(_run(rate, args, batched=batched))
+    print(json.dumps({"frames": args.frames, "results": results}, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+"""Measure StageRunner ticks per second with many automated variables."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tempfile
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.authoring.variables import VariableSpec
+from src.core.project_context import ProjectContext
+from src.editor import SceneEditorSession
+from src.editor.document import TimelineClip, TimelineKeyframe, TimelineTrack
+from src.editor.stage_compile import compile_stage
+from src.game.stage.program import StageRunner
+
+
+def _program(root: Path, variables: int, frames: int, held: float):
+    scene = SceneEditorSession.new_document("Automated Variables")
+    state = scene.state_graph.initial_state
+    held_count = int(variables * held)
+    for index in range(variables):
+        name = f"v{index}"
+        scene.variables.append(
+            VariableSpec(name, "float", 0.0, writable_by=("timeline",), animatable=True)
+        )
+        if index < held_count:
+            # Held clips write the same value every frame.
+            keyframes = [TimelineKeyframe(0, 1.0)]
+        else:
+            keyframes = [TimelineKeyframe(0, 0.0), TimelineKeyframe(frames, float(index))]
+        state.tracks.append(
+            TimelineTrack(
+                name=f"Variable {index}",
+                kind="Variable",
+                channel="variables",
+                clips=[
+                    TimelineClip(
+                        name=f"Animate {index}",
+                        kind="Variable",
+                        start_frame=0,
+                        duration_frames=frames,
+                        channel="variables",
+                        payload={"variable": name},
+                        keyframes=keyframes,
+                    )
+                ],
+            )
+        )
+    state.duration_frames = frames
+    return compile_stage(ProjectContext(root), scene)
+
+
+def _run(program, frames: int) -> dict:
+    runner = StageRunner(program, trace_mode="summary")
+    runner.start()
+    context = object()
+    start = perf_counter()
+    for _ in range(frames):
+        runner.tick(context, dispatch_actions=False)
+    seconds = perf_counter() - start
+    return {
+        "ticks_per_second": round(frames / seconds, 1),
+        "tick_mean_ms": round(seconds * 1000.0 / frames, 4),
+        "variable_writes": len(runner.variables.writes),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--variables", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument(
+        "--held", type=float, default=0.5, help="fraction of clips holding one value"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        program = _program(Path(directory), args.variables, args.frames, args.held)
+    _run(program, 10)
+    payload = {
+        "variables": args.variables,
+        "frames": args.frames,
+        "held": args.held,
+        "result": _run(program, args.frames),
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())